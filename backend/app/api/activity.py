@@ -0,0 +1,87 @@
+"""
+Activity Log API Endpoint
+
+Filtered queries over the activity log: by action type, entity, user, time
+range, spool, and JSON containment on the entries' extra_data.
+
+Requires: read:inventory permission (all authenticated users)
+"""
+
+import json
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from app.schemas.activity_log import ActivityLogResponse
+from app.services.activity_log_service import ActivityLogService
+from app.core.dependencies import get_activity_log_service, require_action
+from app.core.authorization import Action
+from app.core.pagination import cursor_param, set_next_cursor
+from app.models.user import User
+
+router = APIRouter(prefix="/api/activity", tags=["Activity"])
+
+
+def contains_param(
+    contains: Optional[str] = Query(
+        None,
+        description='JSON object the entries\' extra_data must contain, e.g. {"barcode": "SPL0001"}',
+    )
+) -> Optional[dict]:
+    """Containment filter; anything but a JSON object gets a 400"""
+    if contains is None:
+        return None
+    try:
+        value = json.loads(contains)
+    except json.JSONDecodeError:
+        value = None
+    if not isinstance(value, dict):
+        raise HTTPException(status_code=400, detail="'contains' must be a JSON object")
+    return value
+
+
+@router.get("/", response_model=List[ActivityLogResponse])
+async def query_activity(
+    response: Response,
+    action_type: Optional[List[str]] = Query(
+        None, description="Action types to include (repeat for several)"
+    ),
+    entity_type: Optional[str] = None,
+    entity_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    spool_id: Optional[str] = Query(
+        None, description="Entries of this spool and of its inventory units"
+    ),
+    since: Optional[datetime] = Query(None, description="Inclusive lower bound"),
+    until: Optional[datetime] = Query(None, description="Exclusive upper bound"),
+    contains: Optional[dict] = Depends(contains_param),
+    limit: int = Query(50, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
+    service: ActivityLogService = Depends(get_activity_log_service),
+    current_user: User = Depends(require_action(Action.READ_INVENTORY)),
+):
+    """
+    Get the activity logs matching all given filters, newest first.
+
+    Pass the X-Next-Cursor response header as `cursor` to get older entries;
+    it is absent on the last page.
+    """
+    try:
+        logs, next_cursor = await service.query(
+            limit,
+            cursor,
+            action_types=action_type,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            user_id=user_id,
+            since=since,
+            until=until,
+            contains=contains,
+            spool_id=spool_id,
+        )
+        set_next_cursor(response, next_cursor)
+        return logs
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -1,7 +1,7 @@
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token, AuthResponse
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 @router.post("/register", response_model=AuthResponse, status_code=201)
 async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Register a new user.
@@ -29,7 +29,7 @@ async def register(
     auth_service = AuthService(db)
 
     try:
-        user = auth_service.register_user(user_data)
+        user = await auth_service.register_user(user_data)
 
         # Create access token with role for authorization
         access_token = create_access_token(
@@ -61,14 +61,14 @@ async def register(
 @router.post("/login", response_model=AuthResponse)
 async def login(
     user_data: UserLogin,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Authenticate a user and return an access token.
     """
     auth_service = AuthService(db)
 
-    user = auth_service.authenticate_user(user_data.email, user_data.password)
+    user = await auth_service.authenticate_user(user_data.email, user_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from app.core.pagination import cursor_param, set_next_cursor
 from app.schemas.brand import BrandCreate, BrandResponse
 from app.services.brand_service import BrandService
 from app.core.dependencies import get_brand_service
@@ -18,7 +19,7 @@ async def create_brand(
     Returns the created brand with its ID.
     """
     try:
-        brand = service.create_brand(brand_data.name)
+        brand = await service.create_brand(brand_data.name)
         return brand
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -28,15 +29,21 @@ async def create_brand(
 
 @router.get("/", response_model=List[BrandResponse])
 async def get_brands(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Records to skip (without a cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
     service: BrandService = Depends(get_brand_service),
 ):
     """
     Get all brands with pagination.
+
+    Ordered oldest first. Pass the X-Next-Cursor response header as
+    `cursor` to get the next page; it is absent on the last page.
     """
     try:
-        brands = service.get_all_brands(skip, limit)
+        brands, next_cursor = await service.get_all_brands(skip, limit, cursor)
+        set_next_cursor(response, next_cursor)
         return brands
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -49,7 +56,7 @@ async def get_brand(
 ):
     """Get a single brand by ID"""
     try:
-        brand = service.get_brand_by_id(brand_id)
+        brand = await service.get_brand_by_id(brand_id)
         return brand
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
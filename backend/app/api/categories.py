@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from app.core.pagination import cursor_param, set_next_cursor
 from app.schemas.category import CategoryCreate, CategoryResponse
 from app.services.category_service import CategoryService
 from app.core.dependencies import get_category_service
@@ -14,7 +15,7 @@ async def create_category(
 ):
     """Create a new category."""
     try:
-        category = service.create_category(category_data.name)
+        category = await service.create_category(category_data.name)
         return category
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -24,13 +25,16 @@ async def create_category(
 
 @router.get("/", response_model=List[CategoryResponse])
 async def get_categories(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Records to skip (without a cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
     service: CategoryService = Depends(get_category_service),
 ):
     """Get all categories with pagination."""
     try:
-        categories = service.get_all_categories(skip, limit)
+        categories, next_cursor = await service.get_all_categories(skip, limit, cursor)
+        set_next_cursor(response, next_cursor)
         return categories
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -43,7 +47,7 @@ async def get_category(
 ):
     """Get a single category by ID."""
     try:
-        category = service.get_category_by_id(category_id)
+        category = await service.get_category_by_id(category_id)
         return category
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from app.core.pagination import cursor_param, set_next_cursor
 from app.schemas.color import ColorCreate, ColorResponse
 from app.services.color_service import ColorService
 from app.core.dependencies import get_color_service
@@ -18,7 +19,7 @@ async def create_color(
     Returns the created color with its ID.
     """
     try:
-        color = service.create_color(color_data.name, color_data.hex_code)
+        color = await service.create_color(color_data.name, color_data.hex_code)
         return color
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -28,15 +29,21 @@ async def create_color(
 
 @router.get("/", response_model=List[ColorResponse])
 async def get_colors(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Records to skip (without a cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
     service: ColorService = Depends(get_color_service),
 ):
     """
     Get all colors with pagination.
+
+    Ordered oldest first. Pass the X-Next-Cursor response header as
+    `cursor` to get the next page; it is absent on the last page.
     """
     try:
-        colors = service.get_all_colors(skip, limit)
+        colors, next_cursor = await service.get_all_colors(skip, limit, cursor)
+        set_next_cursor(response, next_cursor)
         return colors
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -49,7 +56,7 @@ async def get_color(
 ):
     """Get a single color by ID"""
     try:
-        color = service.get_color_by_id(color_id)
+        color = await service.get_color_by_id(color_id)
         return color
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -4,9 +4,11 @@ Dashboard API Endpoints
 Provides endpoints for dashboard data and AI insights.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
-from typing import List
+from typing import List, Optional
+
+from app.core.pagination import cursor_param, set_next_cursor
 
 from app.schemas.dashboard import (
     DashboardResponse,
@@ -41,9 +43,9 @@ async def get_dashboard(
     Requires: read:inventory permission
     """
     try:
-        stats = service.get_inventory_stats()
-        recent_activity = service.get_recent_activity(limit=20)
-        latest_insight = service.get_latest_insight()
+        stats = await service.get_inventory_stats()
+        recent_activity = await service.get_recent_activity(limit=20)
+        latest_insight = await service.get_latest_insight()
 
         return DashboardResponse(
             stats=stats,
@@ -65,24 +67,31 @@ async def get_stats(
     Requires: read:inventory permission
     """
     try:
-        return service.get_inventory_stats()
+        return await service.get_inventory_stats()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
 @router.get("/activity", response_model=List[ActivityLogResponse])
 async def get_activity(
-    limit: int = 50,
+    response: Response,
+    limit: int = Query(50, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
     service: DashboardService = Depends(get_dashboard_service),
     current_user: User = Depends(require_action(Action.READ_INVENTORY)),
 ):
     """
-    Get recent activity logs.
+    Get activity logs, newest first.
+
+    Pass the X-Next-Cursor response header as `cursor` to get older entries;
+    it is absent on the last page.
 
     Requires: read:inventory permission
     """
     try:
-        return service.get_recent_activity(limit=limit)
+        activity, next_cursor = await service.get_activity_page(limit, cursor)
+        set_next_cursor(response, next_cursor)
+        return activity
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -99,7 +108,7 @@ async def get_insights_history(
     Requires: read:inventory permission
     """
     try:
-        insights = service.get_insights_history(limit=limit)
+        insights = await service.get_insights_history(limit=limit)
         return InsightsHistoryResponse(insights=insights)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -116,7 +125,7 @@ async def get_latest_insight(
     Requires: read:inventory permission
     """
     try:
-        insight = service.get_latest_insight()
+        insight = await service.get_latest_insight()
         if not insight:
             raise HTTPException(status_code=404, detail="No insights available yet")
         return insight
@@ -138,7 +147,7 @@ async def delete_insight(
     Requires: write:inventory permission
     """
     try:
-        deleted = service.delete_insight(insight_id)
+        deleted = await service.delete_insight(insight_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Insight not found")
         return None
@@ -212,6 +221,6 @@ async def get_jobs(
     Requires: read:inventory permission
     """
     try:
-        return service.get_recent_jobs(limit=limit)
+        return await service.get_recent_jobs(limit=limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -7,9 +7,20 @@ Authorization is enforced using the centralized authorization module:
 - DELETE endpoints require: delete:inventory permission (admin only)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
-from app.schemas.inventory import InventoryCreate, InventoryUpdate, InventoryResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from app.core.export import ExportFormat, export_response
+from app.core.pagination import cursor_param, set_next_cursor
+from app.schemas.inventory import (
+    InventoryBulkCreate,
+    InventoryBulkResponse,
+    InventoryCreate,
+    InventoryUpdate,
+    InventoryResponse,
+    InventorySummary,
+    WeightBatchResponse,
+    WeightBatchUpdate,
+)
 from app.services.inventory_service import InventoryService
 from app.core.dependencies import (
     get_inventory_service,
@@ -36,7 +47,7 @@ async def add_to_inventory(
     If weight is not provided, it defaults to the spool's base_weight.
     """
     try:
-        inventory = service.add_to_inventory(inventory_data, user=current_user)
+        inventory = await service.add_to_inventory(inventory_data, user=current_user)
         return inventory
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -44,20 +55,77 @@ async def add_to_inventory(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post("/bulk", response_model=InventoryBulkResponse, status_code=201)
+async def add_bulk_to_inventory(
+    bulk_data: InventoryBulkCreate,
+    service: InventoryService = Depends(get_inventory_service),
+    current_user: User = Depends(require_action(Action.WRITE_INVENTORY)),
+):
+    """
+    Add many units to inventory at once (e.g. receiving a pallet).
+
+    Requires: write:inventory permission (member or admin role)
+
+    Each item adds `quantity` identical units of one spool type; fields
+    are as for POST /api/inventory. Either every unit is added or none is.
+    Returns the new inventory IDs in request order.
+    """
+    try:
+        ids = await service.add_bulk(bulk_data, user=current_user)
+        return {"created": len(ids), "ids": ids}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.post("/weights", response_model=WeightBatchResponse)
+async def update_inventory_weights(
+    batch: WeightBatchUpdate,
+    service: InventoryService = Depends(get_inventory_service),
+    current_user: User = Depends(require_action(Action.WRITE_INVENTORY)),
+):
+    """
+    Apply many scale readings (inventory id and new weight) at once.
+
+    Requires: write:inventory permission (member or admin role)
+
+    Readings are applied independently: unknown items are reported as
+    failed in `results` while the other readings are still saved. If an
+    item is read more than once, the last reading wins.
+    """
+    try:
+        results = await service.update_weights(batch, user=current_user)
+        updated = sum(1 for result in results if result["updated"])
+        return {
+            "updated": updated,
+            "failed": len(results) - updated,
+            "results": results,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.get("/", response_model=List[InventoryResponse])
 async def get_inventory(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Records to skip (without a cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
     service: InventoryService = Depends(get_inventory_service),
     current_user: User = Depends(require_action(Action.READ_INVENTORY)),
 ):
     """
     Get all inventory items with pagination.
 
+    Ordered oldest first. Pass the X-Next-Cursor response header as
+    `cursor` to get the next page; it is absent on the last page.
+
     Requires: read:inventory permission (all authenticated users)
     """
     try:
-        inventory = service.get_all_inventory(skip, limit)
+        inventory, next_cursor = await service.get_all_inventory(skip, limit, cursor)
+        set_next_cursor(response, next_cursor)
         return inventory
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -74,7 +142,7 @@ async def get_in_use_inventory(
     Requires: read:inventory permission (all authenticated users)
     """
     try:
-        inventory = service.get_in_use_inventory()
+        inventory = await service.get_in_use_inventory()
         return inventory
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -92,7 +160,7 @@ async def get_inventory_by_spool(
     Requires: read:inventory permission (all authenticated users)
     """
     try:
-        inventory = service.get_inventory_by_spool(spool_id)
+        inventory = await service.get_inventory_by_spool(spool_id)
         return inventory
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -110,12 +178,61 @@ async def count_inventory_by_spool(
     Requires: read:inventory permission (all authenticated users)
     """
     try:
-        count = service.count_by_spool(spool_id)
+        count = await service.count_by_spool(spool_id)
         return {"spool_id": spool_id, "count": count}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+# Declared before /{inventory_id} so "export" is not taken for an id
+@router.get("/export")
+async def export_inventory(
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip the file"),
+    service: InventoryService = Depends(get_inventory_service),
+    current_user: User = Depends(require_action(Action.READ_INVENTORY)),
+):
+    """
+    Download all inventory items as CSV or NDJSON, oldest first.
+
+    One flat row per item, with spool barcode and color, brand, material
+    and status names.
+    Rows are streamed from a server-side cursor, so exports of any size
+    use constant memory. `gzip=true` compresses the file on the fly.
+
+    Requires: read:inventory permission (all authenticated users)
+    """
+    try:
+        result = await service.stream_export()
+        return export_response(result, format, "inventory", gzip=gzip)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+# Declared before /{inventory_id} so "summary" is not taken for an id
+@router.get("/summary", response_model=List[InventorySummary])
+async def get_inventory_summary(
+    material: Optional[str] = Query(None, description="Only spools of this material"),
+    brand: Optional[str] = Query(None, description="Only spools of this brand"),
+    status: Optional[str] = Query(None, description="Only count units in this status"),
+    service: InventoryService = Depends(get_inventory_service),
+    current_user: User = Depends(require_action(Action.READ_INVENTORY)),
+):
+    """
+    Get unit counts per spool type in one request.
+
+    For every spool with inventory: units, total weight, units in use and
+    low-stock units (below 20% of base weight). Replaces one
+    /count/{spool_id} call per spool in catalog views.
+
+    Requires: read:inventory permission (all authenticated users)
+    """
+    try:
+        return await service.get_summary(material=material, brand=brand, status=status)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.get("/{inventory_id}", response_model=InventoryResponse)
 async def get_inventory_item(
     inventory_id: str,
@@ -128,7 +245,7 @@ async def get_inventory_item(
     Requires: read:inventory permission (all authenticated users)
     """
     try:
-        inventory = service.get_inventory_by_id(inventory_id)
+        inventory = await service.get_inventory_by_id(inventory_id)
         return inventory
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -149,7 +266,7 @@ async def update_inventory_item(
     Requires: write:inventory permission (member or admin role)
     """
     try:
-        inventory = service.update_inventory(
+        inventory = await service.update_inventory(
             inventory_id, update_data, user=current_user
         )
         return inventory
@@ -171,7 +288,7 @@ async def delete_inventory_item(
     Requires: delete:inventory permission (admin only)
     """
     try:
-        service.delete_inventory(inventory_id, user=current_user)
+        await service.delete_inventory(inventory_id, user=current_user)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from app.core.pagination import cursor_param, set_next_cursor
 from app.schemas.material import MaterialCreate, MaterialResponse
 from app.services.material_service import MaterialService
 from app.core.dependencies import get_material_service
@@ -18,7 +19,7 @@ async def create_material(
     Returns the created material with its ID.
     """
     try:
-        material = service.create_material(material_data.name)
+        material = await service.create_material(material_data.name)
         return material
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -28,15 +29,21 @@ async def create_material(
 
 @router.get("/", response_model=List[MaterialResponse])
 async def get_materials(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Records to skip (without a cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
     service: MaterialService = Depends(get_material_service),
 ):
     """
     Get all materials with pagination.
+
+    Ordered oldest first. Pass the X-Next-Cursor response header as
+    `cursor` to get the next page; it is absent on the last page.
     """
     try:
-        materials = service.get_all_materials(skip, limit)
+        materials, next_cursor = await service.get_all_materials(skip, limit, cursor)
+        set_next_cursor(response, next_cursor)
         return materials
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -49,7 +56,7 @@ async def get_material(
 ):
     """Get a single material by ID"""
     try:
-        material = service.get_material_by_id(material_id)
+        material = await service.get_material_by_id(material_id)
         return material
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
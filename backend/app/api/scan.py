@@ -0,0 +1,38 @@
+"""
+Barcode Scan API Endpoint
+
+One round trip for warehouse scanners: resolves a barcode to its spool,
+inventory units and their aggregates (instead of a barcode lookup followed
+by /api/inventory/by-spool/{id} and /api/inventory/count/{id}).
+
+Requires: read:inventory permission (all authenticated users)
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from app.schemas.scan import ScanResponse
+from app.services.inventory_service import InventoryService
+from app.core.dependencies import get_inventory_service, require_action
+from app.core.authorization import Action
+from app.models.user import User
+
+router = APIRouter(prefix="/api/scan", tags=["Scan"])
+
+
+@router.get("/{barcode}", response_model=ScanResponse)
+async def scan_barcode(
+    barcode: str,
+    service: InventoryService = Depends(get_inventory_service),
+    current_user: User = Depends(require_action(Action.READ_INVENTORY)),
+):
+    """
+    Resolve a scanned barcode.
+
+    Returns the spool, all of its inventory units, and their count, in-use
+    count, total weight and per-status counts. 404 if the barcode is unknown.
+    """
+    try:
+        return await service.scan(barcode)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -1,8 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import List, Optional
+from app.core.authorization import Action
+from app.core.export import ExportFormat, export_response
+from app.core.pagination import cursor_param, set_next_cursor
+from app.models.user import User
+from app.schemas.job import JobResponse
 from app.schemas.spool import SpoolCreate, SpoolResponse
+from app.services.spool_import_service import OnConflict, SpoolImportService
 from app.services.spool_service import SpoolService
-from app.core.dependencies import get_spool_service
+from app.core.dependencies import (
+    get_spool_import_service,
+    get_spool_service,
+    require_action,
+)
 
 router = APIRouter(prefix="/api/spools", tags=["Spools"])
 
@@ -24,7 +34,7 @@ async def create_spool(
     Returns complete spool data with nested relationships.
     """
     try:
-        spool = service.create_spool(spool_data)
+        spool = await service.create_spool(spool_data)
         return spool
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -34,33 +44,138 @@ async def create_spool(
 
 @router.get("/", response_model=List[SpoolResponse])
 async def get_spools(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Records to skip (without a cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
     barcode: Optional[str] = Query(None, description="Filter by partial barcode match"),
     service: SpoolService = Depends(get_spool_service),
 ):
     """
     Get all spools with pagination.
 
-    Optionally filter by barcode for partial match lookup (returns all matches).
+    Ordered oldest first. Pass the X-Next-Cursor response header as
+    `cursor` to get the next page; it is absent on the last page.
+
+    Optionally filter by barcode for partial match lookup (paged by skip/limit).
     Returns spools with complete nested data (color, brand, material).
     Perfect for displaying in a table view.
     """
     try:
         if barcode:
-            spools = service.search_spools_by_barcode(barcode)
+            spools = await service.search_spools_by_barcode(barcode, skip, limit)
             return spools
-        spools = service.get_all_spools(skip, limit)
+        spools, next_cursor = await service.get_all_spools(skip, limit, cursor)
+        set_next_cursor(response, next_cursor)
         return spools
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get("/search", response_model=List[SpoolResponse])
+async def search_spools(
+    q: str = Query(
+        ...,
+        min_length=2,
+        max_length=100,
+        description="Barcode fragment or color, brand, material or trade name",
+    ),
+    limit: int = Query(20, ge=1, le=100, description="Max results to return"),
+    service: SpoolService = Depends(get_spool_service),
+):
+    """
+    Search the catalog, most relevant first.
+
+    Matches barcodes and color, brand, material and trade names containing
+    `q` (case-insensitive), ranked by trigram similarity.
+    """
+    try:
+        return await service.search_spools(q, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get("/export")
+async def export_spools(
+    format: ExportFormat = Query(ExportFormat.CSV, description="csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip the file"),
+    service: SpoolService = Depends(get_spool_service),
+):
+    """
+    Download the whole spool catalog as CSV or NDJSON, oldest first.
+
+    One flat row per spool, with color, brand, material, trade name and
+    category names.
+    Rows are streamed from a server-side cursor, so exports of any size
+    use constant memory. `gzip=true` compresses the file on the fly.
+    """
+    try:
+        result = await service.stream_export()
+        return export_response(result, format, "spools", gzip=gzip)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.post("/import", response_model=JobResponse, status_code=202)
+async def import_spools(
+    request: Request,
+    filename: str = Query("import.csv", max_length=255, description="For the report"),
+    on_conflict: OnConflict = Query(
+        OnConflict.SKIP, description="skip or update spools whose barcode exists"
+    ),
+    service: SpoolImportService = Depends(get_spool_import_service),
+    current_user: User = Depends(require_action(Action.WRITE_CATALOG)),
+):
+    """
+    Import spool types from a CSV file (the raw request body, text/csv).
+
+    Requires: write:catalog permission (member or admin role)
+
+    Columns are the fields of POST /api/spools: barcode, base_weight,
+    is_box, thickness, spool_return, color_name, color_hex_code,
+    brand_name, material_name, trade_name, category_name. Missing lookup
+    names are created. The file is imported by a background job; poll
+    GET /api/spools/import/{job_id} for its status. When it completes,
+    the job result holds the report: row counts plus every skipped or
+    failed row with its line number and reason. The import is not atomic:
+    rows are committed in batches, and a job that fails midway keeps the
+    batches before the failure; its result then holds the report up to
+    that point, with committed_rows and the error.
+    """
+    try:
+        return await service.start_import(
+            request.stream(), filename, on_conflict, user=current_user
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get("/import/{job_id}", response_model=JobResponse)
+async def get_import_job(
+    job_id: str,
+    service: SpoolImportService = Depends(get_spool_import_service),
+    current_user: User = Depends(require_action(Action.WRITE_CATALOG)),
+):
+    """
+    Get the status of a catalog import; `result` holds its report (JSON).
+
+    Requires: write:catalog permission (member or admin role)
+    """
+    try:
+        return await service.get_import_job(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.get("/{spool_id}", response_model=SpoolResponse)
 async def get_spool(spool_id: str, service: SpoolService = Depends(get_spool_service)):
     """Get single spool by ID"""
     try:
-        spool = service.get_spool_by_id(spool_id)
+        spool = await service.get_spool_by_id(spool_id)
         return spool
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from app.core.pagination import cursor_param, set_next_cursor
 from app.schemas.status import StatusCreate, StatusResponse
 from app.services.status_service import StatusService
 from app.core.dependencies import get_status_service
@@ -14,7 +15,7 @@ async def create_status(
 ):
     """Create a new status."""
     try:
-        status = service.create_status(status_data.name)
+        status = await service.create_status(status_data.name)
         return status
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -24,13 +25,16 @@ async def create_status(
 
 @router.get("/", response_model=List[StatusResponse])
 async def get_statuses(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Records to skip (without a cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
     service: StatusService = Depends(get_status_service),
 ):
     """Get all statuses with pagination."""
     try:
-        statuses = service.get_all_statuses(skip, limit)
+        statuses, next_cursor = await service.get_all_statuses(skip, limit, cursor)
+        set_next_cursor(response, next_cursor)
         return statuses
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -43,7 +47,7 @@ async def get_status(
 ):
     """Get a single status by ID."""
     try:
-        status = service.get_status_by_id(status_id)
+        status = await service.get_status_by_id(status_id)
         return status
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
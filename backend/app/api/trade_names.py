@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from app.core.pagination import cursor_param, set_next_cursor
 from app.schemas.trade_name import TradeNameCreate, TradeNameResponse
 from app.services.trade_name_service import TradeNameService
 from app.core.dependencies import get_trade_name_service
@@ -14,7 +15,7 @@ async def create_trade_name(
 ):
     """Create a new trade name."""
     try:
-        trade_name = service.create_trade_name(trade_name_data.name)
+        trade_name = await service.create_trade_name(trade_name_data.name)
         return trade_name
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -24,13 +25,18 @@ async def create_trade_name(
 
 @router.get("/", response_model=List[TradeNameResponse])
 async def get_trade_names(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Records to skip (without a cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
+    cursor: Optional[str] = Depends(cursor_param),
     service: TradeNameService = Depends(get_trade_name_service),
 ):
     """Get all trade names with pagination."""
     try:
-        trade_names = service.get_all_trade_names(skip, limit)
+        trade_names, next_cursor = await service.get_all_trade_names(
+            skip, limit, cursor
+        )
+        set_next_cursor(response, next_cursor)
         return trade_names
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -43,7 +49,7 @@ async def get_trade_name(
 ):
     """Get a single trade name by ID."""
     try:
-        trade_name = service.get_trade_name_by_id(trade_name_id)
+        trade_name = await service.get_trade_name_by_id(trade_name_id)
         return trade_name
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -8,14 +8,15 @@ This module provides admin-only endpoints for managing users:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
+from app.core.cache import user_cache
 from app.core.dependencies import get_db
 from app.services.auth_service import get_current_user
 from app.core.authorization import Action, authorize
 from app.models.user import User, UserRole
-from app.schemas.user import UserResponse, UserRoleEnum
+from app.schemas.user import UserCacheStats, UserResponse, UserRoleEnum
 from app.repositories.user_repository import UserRepository
 
 router = APIRouter(prefix="/api/users", tags=["users"])
@@ -24,7 +25,7 @@ router = APIRouter(prefix="/api/users", tags=["users"])
 @router.get("", response_model=List[UserResponse])
 async def list_users(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     List all users in the system.
@@ -35,17 +36,31 @@ async def list_users(
     authorize(current_user, Action.READ_USERS)
 
     user_repo = UserRepository(db)
-    users = user_repo.find_all()
+    users = await user_repo.find_all()
 
     return [UserResponse.model_validate(user) for user in users]
 
 
+@router.get("/cache-stats", response_model=UserCacheStats)
+async def get_user_cache_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Hit rate of this process's authenticated-user cache.
+
+    **Requires:** ADMIN role (READ_USERS permission)
+    """
+    authorize(current_user, Action.READ_USERS)
+
+    return UserCacheStats(**user_cache.stats())
+
+
 @router.patch("/{user_id}/role", response_model=UserResponse)
 async def update_user_role(
     user_id: str,
     role: UserRoleEnum,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Update a user's role.
@@ -66,7 +81,7 @@ async def update_user_role(
         )
 
     user_repo = UserRepository(db)
-    user = user_repo.find_by_id(user_id)
+    user = await user_repo.find_by_id(user_id)
 
     if not user:
         raise HTTPException(
@@ -76,8 +91,9 @@ async def update_user_role(
 
     # Update role
     user.role = UserRole[role.name]
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    # Takes effect on the user's next request, not after the cache TTL
+    user_cache.invalidate(user.id)
 
     return UserResponse.model_validate(user)
 
@@ -87,7 +103,7 @@ async def update_user_status(
     user_id: str,
     is_active: bool,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Activate or deactivate a user.
@@ -108,7 +124,7 @@ async def update_user_status(
         )
 
     user_repo = UserRepository(db)
-    user = user_repo.find_by_id(user_id)
+    user = await user_repo.find_by_id(user_id)
 
     if not user:
         raise HTTPException(
@@ -118,7 +134,8 @@ async def update_user_status(
 
     # Update status
     user.is_active = is_active
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    # Takes effect on the user's next request, not after the cache TTL
+    user_cache.invalidate(user.id)
 
     return UserResponse.model_validate(user)
@@ -0,0 +1,161 @@
+"""
+In-process caches for lookup tables and authenticated users.
+
+Colors, brands, materials, trade names, categories and statuses hold a few
+dozen rows that almost never change, yet every spool and inventory write
+resolves one or more of them by name. LookupCache keeps them in memory,
+keyed by model and case-insensitive name, so those resolutions skip the
+database.
+
+Entries are plain column snapshots rather than ORM instances, which belong
+to the session that loaded them. LookupRepository turns a snapshot back
+into an instance of the caller's session with `merge(load=False)`, without
+a query.
+
+The cache is per process. A row created by another process is simply a
+miss here and gets cached once a transaction that looked it up commits.
+
+UserCache holds the users behind authenticated requests, keyed by id, so
+decoding a JWT does not cost a primary-key SELECT each time. Users do
+change (role, active flag), so entries expire after a TTL: the endpoints
+that change a user invalidate it immediately in their own process, and
+the TTL bounds how long any other process can serve the stale row.
+"""
+
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+
+
+def snapshot(obj: Any) -> Dict[str, Any]:
+    """Column values of an ORM instance"""
+    return {
+        attr.key: getattr(obj, attr.key) for attr in inspect(type(obj)).column_attrs
+    }
+
+
+def restore(model: Type, values: Dict[str, Any]) -> Any:
+    """Detached instance of `model` rebuilt from a snapshot"""
+    obj = model(**values)
+    make_transient_to_detached(obj)
+    return obj
+
+
+class LookupCache:
+    """Name -> row cache for small lookup tables"""
+
+    def __init__(self):
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._rows: Dict[type, Dict[str, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Cache key for a name (lookups are case-insensitive)"""
+        return name.lower()
+
+    def get(self, model: Type, name: str) -> Optional[Any]:
+        """Return a detached instance for `name`, or None on a miss"""
+        if not self.enabled:
+            return None
+        values = self._rows.get(model, {}).get(self.normalize(name))
+        if values is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return restore(model, values)
+
+    def put(self, obj: Any) -> None:
+        """Remember a loaded (or just created) lookup row"""
+        if not self.enabled:
+            return
+        self._rows.setdefault(type(obj), {})[self.normalize(obj.name)] = snapshot(obj)
+
+    def invalidate(self, model: Type) -> None:
+        """Forget all rows of a model (after an update or delete)"""
+        self._rows.pop(model, None)
+
+    def clear(self) -> None:
+        """Forget everything"""
+        self._rows.clear()
+
+    async def load(self, db: AsyncSession, models: Iterable[Type]) -> int:
+        """Warm the cache with every row of the given models"""
+        count = 0
+        for model in models:
+            result = await db.execute(select(model))
+            for obj in result.scalars():
+                self.put(obj)
+                count += 1
+        return count
+
+
+class UserCache:
+    """Id -> user cache with a time-to-live"""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._rows: Dict[str, Tuple[float, Type, Dict[str, Any]]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, user_id: str) -> Optional[Any]:
+        """Return a detached user, or None on a miss or an expired entry"""
+        if not self.enabled:
+            return None
+        entry = self._rows.get(user_id)
+        if entry is None or entry[0] <= time.monotonic():
+            self._rows.pop(user_id, None)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        _, model, values = entry
+        return restore(model, values)
+
+    def put(self, user: Any) -> None:
+        """Remember a loaded user for ttl_seconds"""
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        self._rows[user.id] = (expires_at, type(user), snapshot(user))
+
+    def invalidate(self, user_id: str) -> None:
+        """Forget a user (after its role or status changed)"""
+        self._rows.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Forget everything"""
+        self._rows.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring"""
+        return {
+            "size": len(self._rows),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# Global cache instances
+lookup_cache = LookupCache()
+user_cache = UserCache(ttl_seconds=settings.USER_CACHE_TTL_SECONDS)
@@ -1,6 +1,6 @@
 import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 from pathlib import Path
 
 
@@ -21,6 +21,53 @@ class Settings(BaseSettings):
     def DATABASE_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+
+    # Expose per-request DB usage as X-DB-Checkouts/-Statements/-Commits
+    # response headers (tests, debugging). Streamed responses (exports) only
+    # report what happened before the body started
+    DB_USAGE_HEADERS: bool = False
+
+    # Uploaded catalog CSVs wait here for the import job. API and worker
+    # processes must share this directory (a volume in docker-compose)
+    IMPORT_DIR: str = "/tmp/erp-imports"
+    IMPORT_MAX_BYTES: int = 50 * 1024 * 1024
+
+    # Activity log entries are written in the transaction of the change they
+    # describe. Buffered: they are queued once that commits and written in
+    # batches of ACTIVITY_LOG_BATCH_SIZE, at least every FLUSH_INTERVAL_MS;
+    # faster writes, but entries still queued are lost if the process dies.
+    # Past MAX_PENDING queued rows, entries are written synchronously again
+    ACTIVITY_LOG_BUFFERED: bool = False
+    ACTIVITY_LOG_BATCH_SIZE: int = 500
+    ACTIVITY_LOG_FLUSH_INTERVAL_MS: float = 200.0
+    ACTIVITY_LOG_MAX_PENDING: int = 10_000
+
+    # Run the job worker and scheduler inside the API process. Set to false
+    # when they run as a separate process (python -m app.worker)
+    RUN_BACKGROUND_SERVICES: bool = True
+
+    # Job worker: fallback poll interval when no NOTIFY wakes it up
+    JOB_POLL_INTERVAL_SECONDS: float = 60.0
+    # Max jobs in flight per worker process, and per job type within that
+    # (JSON object, e.g. {"generate_insights": 2}; unlisted types are uncapped)
+    JOB_CONCURRENCY: int = 4
+    JOB_TYPE_CONCURRENCY: Dict[str, int] = {"generate_insights": 2}
+    # Running jobs heartbeat every interval; processing jobs without a
+    # heartbeat for the visibility timeout are requeued (counts as a retry)
+    JOB_HEARTBEAT_INTERVAL_SECONDS: float = 10.0
+    JOB_VISIBILITY_TIMEOUT_SECONDS: float = 60.0
+    # Failed jobs are retried after an exponential backoff with jitter:
+    # base * 2^(attempt-1), capped at max
+    JOB_RETRY_BACKOFF_BASE_SECONDS: float = 30.0
+    JOB_RETRY_BACKOFF_MAX_SECONDS: float = 3600.0
+    # On shutdown, in-flight jobs get this long to finish before being requeued
+    JOB_SHUTDOWN_TIMEOUT_SECONDS: float = 30.0
+    # How often non-leaders retry, and the leader checks, the scheduler lock
+    LEADER_RETRY_INTERVAL_SECONDS: float = 15.0
+
     # CORS - Accept either comma-separated string or JSON array
     CORS_ORIGINS: Union[List[str], str] = "*"
 
@@ -40,6 +87,14 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Authenticated users are cached per process for this long (0 disables).
+    # Role/status changes invalidate at once locally; other processes may
+    # keep serving the old row for up to the TTL
+    USER_CACHE_TTL_SECONDS: float = 30.0
+    # bcrypt cost factor (log2 rounds). Changing it rehashes passwords on login
+    BCRYPT_ROUNDS: int = 12
+    # Threads for password hashing/verification, off the event loop
+    PASSWORD_HASH_WORKERS: int = 2
 
     # OpenAI Configuration (for AI Insights)
     OPENAI_API_KEY: Optional[str] = None
@@ -0,0 +1,126 @@
+"""
+Per-request database usage metrics.
+
+Counts how many pooled connections a request checks out. A request should
+check out exactly one (see get_db); more than that means some layer opened
+its own session and the request is eating into the shared pool.
+
+Also counts the statements a request sends and the transactions it
+commits. A write request should commit exactly once (see BaseRepository);
+the statement count catches extra round trips such as reloads after a
+write.
+
+The counter lives in a ContextVar, so concurrent requests don't mix their
+numbers. Pool events fire inside the request's context, including when the
+async engine runs them through its greenlet bridge.
+
+DbUsageMiddleware checks the numbers once the last byte of the response
+has been sent, so work done while a StreamingResponse body is iterated
+(exports) counts too. The X-DB-* headers (DB_USAGE_HEADERS) can only carry
+what had happened by the time the response started; for a streamed
+response, that excludes everything done while streaming.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DbUsage:
+    """Database usage collected for one request"""
+
+    checkouts: int = 0
+    statements: int = 0
+    commits: int = 0
+
+
+_current_usage: ContextVar[Optional[DbUsage]] = ContextVar("db_usage", default=None)
+
+
+@contextmanager
+def track_db_usage() -> Iterator[DbUsage]:
+    """Collect database usage for everything run inside the block."""
+    usage = DbUsage()
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
+
+
+# Registered on the Pool class so every engine (sync, async, test) is covered
+@event.listens_for(Pool, "checkout")
+def _count_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    usage = _current_usage.get()
+    if usage is not None:
+        usage.checkouts += 1
+
+
+# Engine events fire on the sync engine behind each async engine, too
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    usage = _current_usage.get()
+    if usage is not None:
+        usage.statements += 1
+
+
+@event.listens_for(Engine, "commit")
+def _count_commit(conn) -> None:
+    usage = _current_usage.get()
+    if usage is not None:
+        usage.commits += 1
+
+
+class DbUsageMiddleware:
+    """
+    Track the database usage of each HTTP request, from its first byte in to
+    its last byte out, and log requests that check out more than one
+    connection or commit more than once.
+
+    A pure ASGI middleware rather than @app.middleware("http"): the latter
+    regains control as soon as the response starts, before a streamed body
+    has been produced.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_db_usage() as usage:
+
+            async def send_with_usage(message: Message) -> None:
+                if message["type"] == "http.response.start" and (
+                    settings.DB_USAGE_HEADERS
+                ):
+                    # For streamed responses: only the work done so far
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Checkouts"] = str(usage.checkouts)
+                    headers["X-DB-Statements"] = str(usage.statements)
+                    headers["X-DB-Commits"] = str(usage.commits)
+                await send(message)
+
+            await self.app(scope, receive, send_with_usage)
+
+        request = f"{scope['method']} {scope['path']}"
+        if usage.checkouts > 1:
+            logger.warning(
+                f"{request} checked out {usage.checkouts} pooled connections"
+            )
+        if usage.commits > 1:
+            logger.warning(f"{request} committed {usage.commits} transactions")
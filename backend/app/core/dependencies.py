@@ -1,7 +1,7 @@
-from typing import Generator, Callable
+from typing import Callable
 from fastapi import Depends
-from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db
 from app.repositories.color_repository import ColorRepository
 from app.repositories.brand_repository import BrandRepository
 from app.repositories.material_repository import MaterialRepository
@@ -13,6 +13,7 @@ from app.repositories.inventory_repository import InventoryRepository
 from app.repositories.activity_log_repository import ActivityLogRepository
 from app.repositories.job_repository import JobRepository
 from app.repositories.insight_repository import InsightRepository
+from app.repositories.user_repository import UserRepository
 
 from app.services.color_service import ColorService
 from app.services.brand_service import BrandService
@@ -23,79 +24,80 @@ from app.services.category_service import CategoryService
 from app.services.status_service import StatusService
 from app.services.inventory_service import InventoryService
 from app.services.activity_log_service import ActivityLogService
+from app.services.activity_log_writer import activity_log_writer
 from app.services.ai_insights_service import AIInsightsService
 from app.services.dashboard_service import DashboardService
+from app.services.spool_import_service import SpoolImportService
 
 # Import authorization components
 from app.core.authorization import Action, authorize
 from app.models.user import User
 
 
-# Database session dependency
-def get_db() -> Generator[Session, None, None]:
-    """Dependency that provides database session"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # Repository dependencies
-def get_color_repository(db: Session = Depends(get_db)) -> ColorRepository:
+def get_color_repository(db: AsyncSession = Depends(get_db)) -> ColorRepository:
     """Dependency that provides ColorRepository"""
     return ColorRepository(db)
 
 
-def get_spool_repository(db: Session = Depends(get_db)) -> SpoolRepository:
+def get_spool_repository(db: AsyncSession = Depends(get_db)) -> SpoolRepository:
     return SpoolRepository(db)
 
 
-def get_brand_repository(db: Session = Depends(get_db)) -> BrandRepository:
+def get_brand_repository(db: AsyncSession = Depends(get_db)) -> BrandRepository:
     """Dependency that provides BrandRepository"""
     return BrandRepository(db)
 
 
-def get_material_repository(db: Session = Depends(get_db)) -> MaterialRepository:
+def get_material_repository(db: AsyncSession = Depends(get_db)) -> MaterialRepository:
     """Dependency that provides MaterialRepository"""
     return MaterialRepository(db)
 
 
-def get_trade_name_repository(db: Session = Depends(get_db)) -> TradeNameRepository:
+def get_trade_name_repository(
+    db: AsyncSession = Depends(get_db),
+) -> TradeNameRepository:
     """Dependency that provides TradeNameRepository"""
     return TradeNameRepository(db)
 
 
-def get_category_repository(db: Session = Depends(get_db)) -> CategoryRepository:
+def get_category_repository(db: AsyncSession = Depends(get_db)) -> CategoryRepository:
     """Dependency that provides CategoryRepository"""
     return CategoryRepository(db)
 
 
-def get_status_repository(db: Session = Depends(get_db)) -> StatusRepository:
+def get_status_repository(db: AsyncSession = Depends(get_db)) -> StatusRepository:
     """Dependency that provides StatusRepository"""
     return StatusRepository(db)
 
 
-def get_inventory_repository(db: Session = Depends(get_db)) -> InventoryRepository:
+def get_inventory_repository(db: AsyncSession = Depends(get_db)) -> InventoryRepository:
     """Dependency that provides InventoryRepository"""
     return InventoryRepository(db)
 
 
-def get_activity_log_repository(db: Session = Depends(get_db)) -> ActivityLogRepository:
+def get_activity_log_repository(
+    db: AsyncSession = Depends(get_db),
+) -> ActivityLogRepository:
     """Dependency that provides ActivityLogRepository"""
     return ActivityLogRepository(db)
 
 
-def get_job_repository(db: Session = Depends(get_db)) -> JobRepository:
+def get_job_repository(db: AsyncSession = Depends(get_db)) -> JobRepository:
     """Dependency that provides JobRepository"""
     return JobRepository(db)
 
 
-def get_insight_repository(db: Session = Depends(get_db)) -> InsightRepository:
+def get_insight_repository(db: AsyncSession = Depends(get_db)) -> InsightRepository:
     """Dependency that provides InsightRepository"""
     return InsightRepository(db)
 
 
+def get_user_repository(db: AsyncSession = Depends(get_db)) -> UserRepository:
+    """Dependency that provides UserRepository"""
+    return UserRepository(db)
+
+
 # Service dependencies
 def get_color_service(
     color_repo: ColorRepository = Depends(get_color_repository),
@@ -142,8 +144,8 @@ def get_status_service(
 def get_activity_log_service(
     activity_log_repo: ActivityLogRepository = Depends(get_activity_log_repository),
 ) -> ActivityLogService:
-    """Dependency that provides ActivityLogService"""
-    return ActivityLogService(activity_log_repo)
+    """Dependency that provides ActivityLogService (buffered if configured)"""
+    return ActivityLogService(activity_log_repo, activity_log_writer)
 
 
 def get_spool_service(
@@ -167,6 +169,31 @@ def get_spool_service(
     )
 
 
+def get_spool_import_service(
+    spool_repo: SpoolRepository = Depends(get_spool_repository),
+    color_repo: ColorRepository = Depends(get_color_repository),
+    brand_repo: BrandRepository = Depends(get_brand_repository),
+    material_repo: MaterialRepository = Depends(get_material_repository),
+    trade_name_repo: TradeNameRepository = Depends(get_trade_name_repository),
+    category_repo: CategoryRepository = Depends(get_category_repository),
+    job_repo: JobRepository = Depends(get_job_repository),
+    user_repo: UserRepository = Depends(get_user_repository),
+    activity_log_service: ActivityLogService = Depends(get_activity_log_service),
+) -> SpoolImportService:
+    """Dependency that provides SpoolImportService with all its dependencies."""
+    return SpoolImportService(
+        spool_repo,
+        color_repo,
+        brand_repo,
+        material_repo,
+        trade_name_repo,
+        category_repo,
+        job_repo,
+        user_repo,
+        activity_log_service,
+    )
+
+
 def get_inventory_service(
     inventory_repo: InventoryRepository = Depends(get_inventory_repository),
     spool_repo: SpoolRepository = Depends(get_spool_repository),
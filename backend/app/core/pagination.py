@@ -0,0 +1,57 @@
+"""
+Keyset (cursor) pagination.
+
+List endpoints order rows by (created_at, id) and continue after the last
+row of the previous page instead of skipping `offset` rows, so every page
+costs one index range scan no matter how deep it is, and rows inserted
+meanwhile do not shift later pages.
+
+The cursor handed to clients is opaque: the last row's key, base64-encoded.
+Response bodies stay plain lists; the cursor for the next page is sent in
+the X-Next-Cursor header and is absent on the last page.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Query, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """Opaque cursor pointing just after the row with this key"""
+    raw = json.dumps([created_at.isoformat(), id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Row key from a cursor; raises ValueError if it is malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def cursor_param(
+    cursor: Optional[str] = Query(
+        None, description=f"Cursor from the previous page's {NEXT_CURSOR_HEADER}"
+    )
+) -> Optional[str]:
+    """Cursor query parameter; malformed cursors get a 400 before any query"""
+    if cursor is not None:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return cursor
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Send the next page's cursor, if there is one"""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -1,31 +1,69 @@
-from sqlalchemy import create_engine
+import asyncio
+import json
+from functools import partial
+from typing import AsyncGenerator
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
 
+# JSONB values (activity log extra_data) are sent as UTF-8 text rather than
+# with \uXXXX escapes, which Postgres rejects for non-ASCII characters unless
+# the database encoding is UTF8
+json_serializer = partial(json.dumps, ensure_ascii=False)
+
+# Sync engine - only used for startup tasks (create_tables, seeding)
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_pre_ping=True,
     pool_size=5,
     max_overflow=10,
+    json_serializer=json_serializer,
 )
 # creates database session instance
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # TODO: 3. Understand flushing
+
+# Async engine - used by the API, the job worker and the scheduler so that
+# queries don't block the event loop
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    echo=settings.DEBUG,
+    pool_pre_ping=True,
+    pool_size=5,
+    max_overflow=10,
+    json_serializer=json_serializer,
+)
+# expire_on_commit=False: attributes stay loaded after commit, otherwise
+# touching them would trigger implicit IO which AsyncSession does not allow
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 # foundation class for all ORM models later on
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Request-scoped database session dependency.
+
+    This is the only session dependency: auth (get_current_user) and all
+    repository dependencies depend on it, so FastAPI resolves it once per
+    request and every layer shares one pooled connection.
+    """
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def create_tables():
-    print("Creating database tables...")
+# Advisory lock id serializing schema creation between processes
+SCHEMA_LOCK_ID = 727000
+
+
+def import_models():
+    """Import every model so Base.metadata knows all tables"""
     from app.models.color import Color
     from app.models.brand import Brand
     from app.models.material import Material
@@ -43,5 +81,77 @@ def create_tables():
 
     # TODO: Understand reflection and why imports should be here
 
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created")
+
+def create_tables():
+    """
+    Create missing tables and the search indexes (blocking).
+
+    The API calls this at startup; python -m app.worker waits for the
+    schema instead. On a fresh database several API processes can start
+    at once. The advisory lock, held on its own connection while the DDL
+    runs on others, makes them take turns instead of racing into duplicate
+    object errors.
+    """
+    print("Creating database tables...")
+    import_models()
+
+    with engine.connect() as lock_conn:
+        lock_conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": SCHEMA_LOCK_ID})
+        lock_conn.commit()
+        try:
+            Base.metadata.create_all(bind=engine)
+            print("✅ Database tables created")
+            create_search_indexes()
+        finally:
+            # Session-level lock: it outlives the pooled connection's
+            # transactions, so release it explicitly
+            lock_conn.execute(
+                text("SELECT pg_advisory_unlock(:id)"), {"id": SCHEMA_LOCK_ID}
+            )
+            lock_conn.commit()
+
+
+async def wait_for_schema(timeout: float = 300, interval: float = 2) -> None:
+    """
+    Wait until every table exists, i.e. an API process has run
+    create_tables.
+
+    Raises:
+        TimeoutError: If the tables are still missing after `timeout` seconds
+    """
+    import_models()
+    names = list(Base.metadata.tables)
+    query = text(
+        "SELECT count(*) FROM information_schema.tables "
+        "WHERE table_schema = current_schema() AND table_name = ANY(:names)"
+    )
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        async with async_engine.connect() as conn:
+            if await conn.scalar(query, {"names": names}) == len(names):
+                return
+        if loop.time() >= deadline:
+            raise TimeoutError("Database tables were not created in time")
+        print("⏳ Waiting for the API to create the database tables...")
+        await asyncio.sleep(interval)
+
+
+# Catalog search (SpoolRepository.search) needs pg_trgm, which ships with
+# Postgres contrib. Its DDL lives here rather than in the models so that
+# create_all still works on a server without the extension; search then
+# fails, everything else is unaffected.
+SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_spools_barcode_trgm "
+    "ON spools USING gin (barcode gin_trgm_ops)",
+]
+
+
+def create_search_indexes():
+    try:
+        with engine.begin() as conn:
+            for statement in SEARCH_DDL:
+                conn.execute(text(statement))
+    except DBAPIError as e:
+        print(f"⚠️  pg_trgm unavailable, catalog search disabled: {e.orig}")
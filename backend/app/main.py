@@ -1,8 +1,12 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.database import create_tables
+from app.core.cache import lookup_cache
+from app.core.db_metrics import DbUsageMiddleware
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.database import AsyncSessionLocal, create_tables, async_engine
 from app.seed import seed_database
 from app.api import spools
 from app.api import materials
@@ -12,9 +16,11 @@ from app.api import trade_names
 from app.api import categories
 from app.api import statuses
 from app.api import inventory
+from app.api import scan
 from app.api import auth
 from app.api import users
 from app.api import dashboard
+from app.api import activity
 
 # Import models to register them with Base
 from app.models.color import Color
@@ -31,6 +37,7 @@ from app.models.job import Job
 from app.models.insight import Insight
 
 # Import worker and scheduler
+from app.services.activity_log_writer import activity_log_writer
 from app.services.job_worker import job_worker
 from app.services.scheduler import setup_scheduler, shutdown_scheduler
 
@@ -38,23 +45,43 @@ from app.services.scheduler import setup_scheduler, shutdown_scheduler
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
-    # Startup
-    create_tables()
-    print("✅ Database tables created")
+    # Startup (DDL is blocking; keep it off the event loop)
+    await asyncio.to_thread(create_tables)
     seed_database()
 
-    # Start background worker and scheduler
-    job_worker.start()
-    print("✅ Job worker started")
-    setup_scheduler()
-    print("✅ Scheduler started (daily insights at 6:00 AM)")
+    # Warm the lookup-table cache used by find_or_create
+    async with AsyncSessionLocal() as db:
+        cached = await lookup_cache.load(
+            db, [Color, Brand, Material, TradeName, Category, Status]
+        )
+    print(f"✅ Lookup cache loaded ({cached} rows)")
+
+    if settings.ACTIVITY_LOG_BUFFERED:
+        activity_log_writer.start()
+        print("✅ Buffered activity log writer started")
+
+    # Start background worker and scheduler, unless they run separately
+    # (python -m app.worker)
+    if settings.RUN_BACKGROUND_SERVICES:
+        job_worker.start()
+        print("✅ Job worker started")
+        setup_scheduler()
+        print("✅ Scheduler election started (leader runs daily insights at 6:00 AM)")
+    else:
+        print("ℹ️  Background services disabled (run them with python -m app.worker)")
 
     yield
 
     # Shutdown
-    job_worker.stop()
-    shutdown_scheduler()
-    print("✅ Background services stopped")
+    if settings.RUN_BACKGROUND_SERVICES:
+        await job_worker.stop()
+        await shutdown_scheduler()
+        print("✅ Background services stopped")
+    if activity_log_writer.running:
+        # Write buffered entries before the connections go away
+        await activity_log_writer.stop()
+        print("✅ Activity log writer flushed and stopped")
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -72,8 +99,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+
+# Per-request database usage (outermost, so it sees the whole request)
+app.add_middleware(DbUsageMiddleware)
+
+
 # Include routers
 app.include_router(spools.router)
 app.include_router(materials.router)
@@ -83,9 +116,11 @@ app.include_router(trade_names.router)
 app.include_router(categories.router)
 app.include_router(statuses.router)
 app.include_router(inventory.router)
+app.include_router(scan.router)
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(dashboard.router)
+app.include_router(activity.router)
 
 
 @app.get("/")
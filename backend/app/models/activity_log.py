@@ -4,7 +4,8 @@ Activity Log Model
 Tracks all operations in the system for audit trail and AI analysis.
 """
 
-from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy import Column, String, DateTime, Text, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from app.database import Base
 import uuid
@@ -36,9 +37,10 @@ class ActivityLog(Base):
     description = Column(Text, nullable=False)
     # Example: "User admin added 1000g Blue PLA spool to inventory"
 
-    # Additional context as JSON string
-    extra_data = Column(Text, nullable=True)
-    # Store extra details like old/new values, quantities, etc.
+    # Additional context as a JSON object (NULL when there is none)
+    extra_data = Column(JSONB(none_as_null=True), nullable=True)
+    # Store extra details like old/new values, quantities, etc.; inventory
+    # entries carry their spool_id
 
     # Who performed the action
     user_id = Column(String, nullable=True, index=True)
@@ -49,3 +51,16 @@ class ActivityLog(Base):
 
     def __repr__(self):
         return f"<ActivityLog(action='{self.action_type}', entity='{self.entity_type}', description='{self.description[:50]}...')>"
+
+
+# Keyset pagination order (app.core.pagination)
+Index("ix_activity_logs_created_at_id", ActivityLog.created_at, ActivityLog.id)
+# Containment filters on extra_data (extra_data @> '{"spool_id": ...}');
+# jsonb_path_ops only supports @>, and is smaller and faster for it
+Index(
+    "ix_activity_logs_extra_data",
+    ActivityLog.extra_data,
+    postgresql_using="gin",
+    postgresql_ops={"extra_data": "jsonb_path_ops"},
+)
+Index("ix_activity_logs_entity", ActivityLog.entity_type, ActivityLog.entity_id)
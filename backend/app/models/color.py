@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index, func
 from datetime import datetime
 from app.database import Base
 import uuid
@@ -15,3 +15,12 @@ class Color(Base):
 
     def __repr__(self):
         return f"<Color(name='{self.name}', hex='{self.hex_code}')>"
+
+
+# Names are unique case-insensitively; find_by_name and find_or_create's
+# upsert both go through this index
+Index("uq_colors_name_lower", func.lower(Color.name), unique=True)
+
+
+# Keyset pagination order (app.core.pagination)
+Index("ix_colors_created_at_id", Color.created_at, Color.id)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Float, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -12,7 +12,7 @@ class Inventory(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
 
     # Foreign key to spool catalog
-    spool_id = Column(String, ForeignKey("spools.id"), nullable=False)
+    spool_id = Column(String, ForeignKey("spools.id"), nullable=False, index=True)
 
     # Instance-specific data
     weight = Column(Float, nullable=False)  # Current weight (decreases as used)
@@ -32,3 +32,7 @@ class Inventory(Base):
 
     def __repr__(self):
         return f"<Inventory(spool_id='{self.spool_id}', weight={self.weight}, status={self.status.name})>"
+
+
+# Keyset pagination order (app.core.pagination)
+Index("ix_inventory_created_at_id", Inventory.created_at, Inventory.id)
@@ -4,7 +4,7 @@ Job Model
 Tracks background jobs for async processing (e.g., AI insight generation).
 """
 
-from sqlalchemy import Column, String, DateTime, Text, Integer
+from sqlalchemy import Column, String, DateTime, Text, Integer, Index
 from datetime import datetime
 from app.database import Base
 import uuid
@@ -19,10 +19,19 @@ class JobStatus:
     FAILED = "failed"
 
 
+class JobPriority:
+    """Job priority constants (higher runs first, any int is allowed)"""
+
+    LOW = -10
+    NORMAL = 0
+    HIGH = 10
+
+
 class JobType:
     """Job type constants"""
 
     GENERATE_INSIGHTS = "generate_insights"
+    IMPORT_SPOOLS = "import_spools"
 
 
 class Job(Base):
@@ -41,6 +50,10 @@ class Job(Base):
     # Job status
     status = Column(String(20), nullable=False, default=JobStatus.READY, index=True)
 
+    # Scheduling: ready jobs run highest priority first, and not before run_at
+    priority = Column(Integer, nullable=False, default=JobPriority.NORMAL)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
     # Payload - JSON string with job-specific data
     payload = Column(Text, nullable=True)
 
@@ -50,6 +63,10 @@ class Job(Base):
     # Error message if job failed
     error_message = Column(Text, nullable=True)
 
+    # Optional idempotency key, e.g. "daily_insights:2024-12-16" for
+    # scheduled runs; at most one job can exist per key
+    dedup_key = Column(String(100), nullable=True, unique=True)
+
     # Retry tracking
     retry_count = Column(Integer, default=0)
     max_retries = Column(Integer, default=2)
@@ -57,6 +74,9 @@ class Job(Base):
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     started_at = Column(DateTime, nullable=True)
+    # Refreshed periodically while a worker runs the job; a processing job
+    # whose heartbeat is too old belongs to a dead worker and is requeued
+    heartbeat_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
 
     def __repr__(self):
@@ -65,3 +85,13 @@ class Job(Base):
     def can_retry(self) -> bool:
         """Check if job can be retried"""
         return self.retry_count < self.max_retries
+
+
+# Claim order of ready jobs (see JobRepository.claim_next). Partial, so it
+# only holds the small ready set no matter how much job history piles up.
+Index(
+    "ix_jobs_ready_queue",
+    Job.priority.desc(),
+    Job.run_at,
+    postgresql_where=Job.status == JobStatus.READY,
+)
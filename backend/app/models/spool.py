@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Float, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -47,3 +47,24 @@ class Spool(Base):
 
     def __repr__(self):
         return f"<Spool(barcode='{self.barcode}', material={self.material.name}, brand={self.brand.name})>"
+
+
+# Keyset pagination order (app.core.pagination)
+Index("ix_spools_created_at_id", Spool.created_at, Spool.id)
+
+# Catalog search pages through the spools of a matching color, brand,
+# material or trade name (SpoolRepository.search)
+Index("ix_spools_color_id_created_at_id", Spool.color_id, Spool.created_at, Spool.id)
+Index("ix_spools_brand_id_created_at_id", Spool.brand_id, Spool.created_at, Spool.id)
+Index(
+    "ix_spools_material_id_created_at_id",
+    Spool.material_id,
+    Spool.created_at,
+    Spool.id,
+)
+Index(
+    "ix_spools_trade_name_id_created_at_id",
+    Spool.trade_name_id,
+    Spool.created_at,
+    Spool.id,
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index, func
 from datetime import datetime
 from app.database import Base
 import uuid
@@ -11,3 +11,12 @@ class Status(Base):
     name = Column(String(50), unique=True, nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+# Names are unique case-insensitively; find_by_name and find_or_create's
+# upsert both go through this index
+Index("uq_statuses_name_lower", func.lower(Status.name), unique=True)
+
+
+# Keyset pagination order (app.core.pagination)
+Index("ix_statuses_created_at_id", Status.created_at, Status.id)
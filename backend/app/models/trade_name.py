@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, DateTime, Index, func
 from datetime import datetime
 from app.database import Base
 import uuid
@@ -11,3 +11,12 @@ class TradeName(Base):
     name = Column(String(100), unique=True, nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+# Names are unique case-insensitively; find_by_name and find_or_create's
+# upsert both go through this index
+Index("uq_trade_names_name_lower", func.lower(TradeName.name), unique=True)
+
+
+# Keyset pagination order (app.core.pagination)
+Index("ix_trade_names_created_at_id", TradeName.created_at, TradeName.id)
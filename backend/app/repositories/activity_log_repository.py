@@ -2,71 +2,124 @@
 Activity Log Repository
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Tuple
+from sqlalchemy import and_, or_, select, desc
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.activity_log import ActivityLog
 from app.repositories.base import BaseRepository
 
 
 class ActivityLogRepository(BaseRepository[ActivityLog]):
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(ActivityLog, db)
 
-    def get_recent(self, limit: int = 100) -> List[ActivityLog]:
+    async def get_recent(self, limit: int = 100) -> List[ActivityLog]:
         """Get most recent activity logs"""
-        return (
-            self.db.query(ActivityLog)
-            .order_by(desc(ActivityLog.created_at))
-            .limit(limit)
-            .all()
+        result = await self.db.execute(
+            select(ActivityLog).order_by(desc(ActivityLog.created_at)).limit(limit)
         )
+        return list(result.scalars().all())
+
+    async def get_page_newest_first(
+        self, limit: int = 50, cursor: Optional[str] = None
+    ) -> Tuple[List[ActivityLog], Optional[str]]:
+        """Get one page of activity logs, newest first, and the next cursor"""
+        return await self.paginate(select(ActivityLog), limit, cursor, descending=True)
+
+    async def query(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        action_types: Optional[Collection[str]] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        contains: Optional[Dict[str, Any]] = None,
+        spool_id: Optional[str] = None,
+    ) -> Tuple[List[ActivityLog], Optional[str]]:
+        """
+        Get one page of matching activity logs, newest first, and the next
+        cursor. All given filters must match.
 
-    def get_by_entity(
+        `contains` is a JSON containment filter on extra_data (extra_data @>
+        contains), served by the GIN index. `spool_id` matches everything
+        about one spool type: the spool's own entries plus every entry whose
+        extra_data names it, i.e. its inventory units. `since` is inclusive,
+        `until` exclusive.
+        """
+        query = select(ActivityLog)
+        if action_types:
+            query = query.where(ActivityLog.action_type.in_(action_types))
+        if entity_type:
+            query = query.where(ActivityLog.entity_type == entity_type)
+        if entity_id:
+            query = query.where(ActivityLog.entity_id == entity_id)
+        if user_id:
+            query = query.where(ActivityLog.user_id == user_id)
+        if since:
+            query = query.where(ActivityLog.created_at >= since)
+        if until:
+            query = query.where(ActivityLog.created_at < until)
+        if contains:
+            query = query.where(ActivityLog.extra_data.contains(contains))
+        if spool_id:
+            query = query.where(
+                or_(
+                    and_(
+                        ActivityLog.entity_type == "spool",
+                        ActivityLog.entity_id == spool_id,
+                    ),
+                    ActivityLog.extra_data.contains({"spool_id": spool_id}),
+                )
+            )
+        return await self.paginate(query, limit, cursor, descending=True)
+
+    async def get_by_entity(
         self, entity_type: str, entity_id: str, limit: int = 50
     ) -> List[ActivityLog]:
         """Get logs for a specific entity"""
-        return (
-            self.db.query(ActivityLog)
-            .filter(
+        result = await self.db.execute(
+            select(ActivityLog)
+            .where(
                 ActivityLog.entity_type == entity_type,
                 ActivityLog.entity_id == entity_id,
             )
             .order_by(desc(ActivityLog.created_at))
             .limit(limit)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_by_action_type(
+    async def get_by_action_type(
         self, action_type: str, limit: int = 50
     ) -> List[ActivityLog]:
         """Get logs by action type"""
-        return (
-            self.db.query(ActivityLog)
-            .filter(ActivityLog.action_type == action_type)
+        result = await self.db.execute(
+            select(ActivityLog)
+            .where(ActivityLog.action_type == action_type)
             .order_by(desc(ActivityLog.created_at))
             .limit(limit)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_by_user(self, user_id: str, limit: int = 50) -> List[ActivityLog]:
+    async def get_by_user(self, user_id: str, limit: int = 50) -> List[ActivityLog]:
         """Get logs for a specific user"""
-        return (
-            self.db.query(ActivityLog)
-            .filter(ActivityLog.user_id == user_id)
+        result = await self.db.execute(
+            select(ActivityLog)
+            .where(ActivityLog.user_id == user_id)
             .order_by(desc(ActivityLog.created_at))
             .limit(limit)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_for_ai_analysis(self, limit: int = 500) -> List[ActivityLog]:
+    async def get_for_ai_analysis(self, limit: int = 500) -> List[ActivityLog]:
         """
         Get logs formatted for AI analysis.
         Returns recent logs that are useful for generating insights.
         """
-        return (
-            self.db.query(ActivityLog)
-            .order_by(desc(ActivityLog.created_at))
-            .limit(limit)
-            .all()
+        result = await self.db.execute(
+            select(ActivityLog).order_by(desc(ActivityLog.created_at)).limit(limit)
         )
+        return list(result.scalars().all())
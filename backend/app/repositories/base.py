@@ -1,41 +1,277 @@
-from typing import Generic, TypeVar, Type, Optional, List
+from typing import Any, Callable, Dict, Generic, TypeVar, Type, Optional, List, Tuple
+from sqlalchemy import Select, String, event, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.cache import lookup_cache
+from app.core.pagination import decode_cursor, encode_cursor
 from app.database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)  # type: ignore
 
 # Now this is something new. A generic base repository class. Like a template that will accept any model type that conforms to the Base class from SQLAlchemy. TODO: better understand it but generally it is a type placeholder.
 
+# Session.info key of the callbacks waiting for the transaction to commit
+_AFTER_COMMIT = "after_commit"
+
+
+def on_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run `callback` once the session's current transaction has committed.
+
+    Caches use this to learn only about committed rows; the callbacks are
+    dropped if the transaction rolls back instead.
+    """
+    db.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT, None)
+
 
 class BaseRepository(Generic[ModelType]):
-    """Base repository with common CRUD operations"""
+    """
+    Base repository with common CRUD operations.
 
-    def __init__(self, model: Type[ModelType], db: Session):
+    Repositories never commit: writes are flushed, so generated values and
+    constraint errors show up right away, and the service method that owns
+    the request's unit of work ends it with a single commit(). A request
+    that fails before then leaves nothing behind; get_db rolls it back.
+    """
+
+    def __init__(self, model: Type[ModelType], db: AsyncSession):
         self.model = model
         self.db = db
 
-    def get_by_id(self, id: str) -> Optional[ModelType]:
+    async def get_by_id(self, id: str) -> Optional[ModelType]:
         """Get single record by ID"""
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        result = await self.db.execute(select(self.model).where(self.model.id == id))
+        return result.scalars().first()
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
+        """Get all records with pagination (oldest first)"""
+        result = await self.db.execute(
+            select(self.model)
+            .order_by(self.model.created_at, self.model.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        """Get all records with pagination"""
-        return self.db.query(self.model).offset(skip).limit(limit).all()
+    async def get_page(
+        self, limit: int = 100, cursor: Optional[str] = None, skip: int = 0
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """Get one page of all records (oldest first) and the next page's cursor"""
+        return await self.paginate(select(self.model), limit, cursor, skip=skip)
 
-    def create(self, obj: ModelType) -> ModelType:
-        """Create new record"""
+    async def paginate(
+        self,
+        query: Select,
+        limit: int,
+        cursor: Optional[str] = None,
+        descending: bool = False,
+        skip: int = 0,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        Run `query` as one keyset page ordered by (created_at, id).
+
+        Continues after `cursor` when given; `skip` is only honoured on the
+        first page, for clients still paging by offset. Returns the rows and
+        the cursor of the next page, or None on the last page.
+        """
+        key = tuple_(self.model.created_at, self.model.id)
+        if cursor:
+            after = decode_cursor(cursor)
+            query = query.where(key < after if descending else key > after)
+        elif skip:
+            query = query.offset(skip)
+
+        if descending:
+            query = query.order_by(self.model.created_at.desc(), self.model.id.desc())
+        else:
+            query = query.order_by(self.model.created_at, self.model.id)
+
+        # One extra row tells whether another page follows
+        result = await self.db.execute(query.limit(limit + 1))
+        rows = list(result.scalars().all())
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    async def create(self, obj: ModelType) -> ModelType:
+        """
+        Create new record (flushed, not committed).
+
+        All column defaults are computed in Python, so the INSERT leaves
+        nothing to read back; relationships the caller needs in the
+        response should be set on `obj` rather than reloaded.
+        """
         self.db.add(obj)
-        self.db.commit()
-        self.db.refresh(obj)
+        await self.db.flush()
+        return obj
+
+    async def insert_many(self, rows: List[dict]) -> None:
+        """
+        Insert plain row dicts with multi-row INSERT statements.
+
+        Like every write, this does not commit, so several batches can
+        share one transaction. The statement is compiled once; RETURNING
+        makes SQLAlchemy send the rows as INSERT ... VALUES (...), (...)
+        pages of up to 1000 rows ("insertmanyvalues") instead of one
+        statement per row.
+        """
+        if rows:
+            table = self.model.__table__
+            await self.db.execute(insert(table).returning(table.c.id), rows)
+
+    async def commit(self) -> None:
+        """End the unit of work: commit everything flushed in this session"""
+        await self.db.commit()
+
+    async def rollback(self) -> None:
+        """Abandon the unit of work: discard everything flushed since commit"""
+        await self.db.rollback()
+
+    async def update(self, obj: ModelType) -> ModelType:
+        """Update existing record (flushed, not committed)"""
+        await self.db.flush()
+        return obj
+
+    async def delete(self, obj: ModelType) -> None:
+        """Delete record (flushed, not committed)"""
+        await self.db.delete(obj)
+        await self.db.flush()
+
+
+# Order in which a unit of work creates lookup rows (see find_or_create)
+LOOKUP_LOCK_ORDER = (
+    "colors",
+    "brands",
+    "materials",
+    "trade_names",
+    "categories",
+    "statuses",
+)
+
+
+class LookupRepository(BaseRepository[ModelType]):
+    """
+    Base repository for small name-keyed lookup tables (colors, brands, ...).
+
+    Name lookups go through the in-process lookup_cache; writes keep it
+    up to date once they are committed, so the cache never hands out a row
+    that was rolled back. Names are unique case-insensitively, backed by a
+    unique index on lower(name) on each table.
+    """
+
+    async def find_by_name(self, name: str) -> Optional[ModelType]:
+        """Find record by name (case-insensitive)"""
+        cached = lookup_cache.get(self.model, name)
+        if cached is not None:
+            # Attach the cached row to this session without a query
+            return await self.db.merge(cached, load=False)
+
+        result = await self.db.execute(
+            select(self.model).where(func.lower(self.model.name) == func.lower(name))
+        )
+        obj = result.scalars().first()
+        if obj:
+            # The row may be one this transaction inserted and may still
+            # roll back, so only cache it once the transaction commits
+            on_commit(self.db, lambda: lookup_cache.put(obj))
         return obj
 
-    def update(self, obj: ModelType) -> ModelType:
-        """Update existing record"""
-        self.db.commit()
-        self.db.refresh(obj)
+    async def find_or_create(self, name: str, **defaults: Any) -> ModelType:
+        """
+        Find existing record by name or create a new one.
+
+        Creation is an INSERT ... ON CONFLICT DO NOTHING, so concurrent
+        callers racing on the same name all end up with the one row instead
+        of a unique violation for the losers: a loser's INSERT waits for the
+        winner's transaction and then finds its row.
+
+        The new row's unique-index entry stays locked until the caller's
+        unit of work commits. A unit of work that may create several
+        lookups must therefore create them in LOOKUP_LOCK_ORDER, and several
+        names of one table sorted; two requests taking the same locks in
+        opposite orders would deadlock.
+        """
+        obj = await self.find_by_name(name)
+        if obj:
+            return obj
+
+        obj = await self.db.scalar(
+            insert(self.model)
+            .values(name=name, **defaults)
+            .on_conflict_do_nothing()
+            .returning(self.model)
+        )
+        if obj is None:
+            # Lost the race: the winner's row is committed and visible now
+            return await self.find_by_name(name)
+
+        on_commit(self.db, lambda: lookup_cache.put(obj))
         return obj
 
-    def delete(self, obj: ModelType) -> None:
-        """Delete record"""
-        self.db.delete(obj)
-        self.db.commit()
+    async def upsert_names(self, rows: Dict[str, dict]) -> Dict[str, str]:
+        """
+        Find or create many records by name, without committing.
+
+        `rows` maps each name to the extra columns of a new record (e.g.
+        a color's hex_code); existing records are left as they are. One
+        INSERT ... ON CONFLICT DO NOTHING plus one SELECT, whatever the
+        number of names. Returns name -> id for every name exactly as given.
+
+        Names are matched with Postgres lower() on both sides, like the
+        unique index, never with Python's str.lower(): the two disagree for
+        some non-ASCII names (e.g. "İ", or anything outside ASCII under a C
+        locale).
+        """
+        if not rows:
+            return {}
+        # Sorted, so transactions upserting overlapping names take their
+        # row and index locks in the same order instead of deadlocking
+        await self.db.execute(
+            insert(self.model.__table__).on_conflict_do_nothing(),
+            [{"name": name, **rows[name]} for name in sorted(rows)],
+        )
+        submitted = func.unnest(literal(list(rows), ARRAY(String))).table_valued("name")
+        result = await self.db.execute(
+            select(submitted.c.name, self.model.id).join(
+                self.model,
+                func.lower(self.model.name) == func.lower(submitted.c.name),
+            )
+        )
+        return dict(result.all())
+
+    async def create(self, obj: ModelType) -> ModelType:
+        """Create new record and cache it once committed"""
+        created = await super().create(obj)
+        on_commit(self.db, lambda: lookup_cache.put(created))
+        return created
+
+    async def update(self, obj: ModelType) -> ModelType:
+        """Update existing record (the name may change, so drop cached rows)"""
+        updated = await super().update(obj)
+        self._invalidate()
+        return updated
+
+    async def delete(self, obj: ModelType) -> None:
+        """Delete record and drop cached rows"""
+        await super().delete(obj)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        # Now, so this request doesn't read old names back from the cache,
+        # and again on commit, in case another request cached the old row
+        # in the meantime
+        lookup_cache.invalidate(self.model)
+        on_commit(self.db, lambda: lookup_cache.invalidate(self.model))
@@ -3,26 +3,31 @@ Insight Repository
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import select, desc
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.insight import Insight
 from app.repositories.base import BaseRepository
 
 
 class InsightRepository(BaseRepository[Insight]):
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(Insight, db)
 
-    def get_latest(self) -> Optional[Insight]:
+    async def get_latest(self) -> Optional[Insight]:
         """Get the most recent insight"""
-        return self.db.query(Insight).order_by(desc(Insight.created_at)).first()
+        result = await self.db.execute(
+            select(Insight).order_by(desc(Insight.created_at)).limit(1)
+        )
+        return result.scalars().first()
 
-    def get_recent(self, limit: int = 10) -> List[Insight]:
+    async def get_recent(self, limit: int = 10) -> List[Insight]:
         """Get most recent insights"""
-        return (
-            self.db.query(Insight).order_by(desc(Insight.created_at)).limit(limit).all()
+        result = await self.db.execute(
+            select(Insight).order_by(desc(Insight.created_at)).limit(limit)
         )
+        return list(result.scalars().all())
 
-    def get_by_job_id(self, job_id: str) -> Optional[Insight]:
+    async def get_by_job_id(self, job_id: str) -> Optional[Insight]:
         """Get insight generated by a specific job"""
-        return self.db.query(Insight).filter(Insight.job_id == job_id).first()
+        result = await self.db.execute(select(Insight).where(Insight.job_id == job_id))
+        return result.scalars().first()
@@ -1,26 +1,187 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
-
+from datetime import datetime
+from typing import Dict, Optional, List
+from sqlalchemy import Float, String, bindparam, column, select, func, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from app.models.brand import Brand
+from app.models.color import Color
 from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
 from app.repositories.base import BaseRepository
 
 
 class InventoryRepository(BaseRepository[Inventory]):
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(Inventory, db)
 
-    def find_by_spool_id(self, spool_id: str) -> List[Inventory]:
+    async def find_by_spool_id(self, spool_id: str) -> List[Inventory]:
         """Find all inventory items for a specific spool type"""
-        return self.db.query(Inventory).filter(Inventory.spool_id == spool_id).all()
+        result = await self.db.execute(
+            select(Inventory).where(Inventory.spool_id == spool_id)
+        )
+        return list(result.scalars().all())
 
-    def find_by_status_id(self, status_id: str) -> List[Inventory]:
+    async def find_by_status_id(self, status_id: str) -> List[Inventory]:
         """Find all inventory items with a specific status"""
-        return self.db.query(Inventory).filter(Inventory.status_id == status_id).all()
+        result = await self.db.execute(
+            select(Inventory).where(Inventory.status_id == status_id)
+        )
+        return list(result.scalars().all())
 
-    def find_in_use(self) -> List[Inventory]:
+    async def find_in_use(self) -> List[Inventory]:
         """Find all inventory items currently in use"""
-        return self.db.query(Inventory).filter(Inventory.is_in_use == True).all()
+        result = await self.db.execute(
+            select(Inventory).where(Inventory.is_in_use == True)
+        )
+        return list(result.scalars().all())
 
-    def count_by_spool_id(self, spool_id: str) -> int:
+    async def count_by_spool_id(self, spool_id: str) -> int:
         """Count how many units of a spool type are in inventory"""
-        return self.db.query(Inventory).filter(Inventory.spool_id == spool_id).count()
+        result = await self.db.execute(
+            select(func.count(Inventory.id)).where(Inventory.spool_id == spool_id)
+        )
+        return result.scalar_one()
+
+    async def get_stats(self, low_stock_ratio: float = 0.2) -> dict:
+        """
+        Aggregate inventory statistics in a single query.
+
+        Only spools.base_weight is joined; low stock means the remaining
+        weight is below low_stock_ratio of the spool's base weight.
+        """
+        stmt = select(
+            func.count(Inventory.id).label("total_spools"),
+            func.coalesce(func.sum(Inventory.weight), 0.0).label("total_weight"),
+            func.count(Inventory.id)
+            .filter(Inventory.is_in_use.is_(True))
+            .label("spools_in_use"),
+            func.count(Inventory.id)
+            .filter(Inventory.weight < Spool.base_weight * low_stock_ratio)
+            .label("low_stock_count"),
+        ).join_from(Inventory, Spool, Inventory.spool_id == Spool.id)
+
+        result = await self.db.execute(stmt)
+        return dict(result.one()._mapping)
+
+    async def get_summary_by_spool(
+        self,
+        material: Optional[str] = None,
+        brand: Optional[str] = None,
+        status: Optional[str] = None,
+        low_stock_ratio: float = 0.2,
+    ) -> List[dict]:
+        """
+        Per-spool unit counts and weights in a single GROUP BY query.
+
+        Optional filters match material, brand and status names
+        (case-insensitive); the status filter restricts which units are
+        counted. Spools without matching units are not listed.
+        """
+        stmt = (
+            select(
+                Inventory.spool_id,
+                func.count(Inventory.id).label("units"),
+                func.sum(Inventory.weight).label("total_weight"),
+                func.count(Inventory.id)
+                .filter(Inventory.is_in_use.is_(True))
+                .label("in_use_count"),
+                func.count(Inventory.id)
+                .filter(Inventory.weight < Spool.base_weight * low_stock_ratio)
+                .label("low_stock_count"),
+            )
+            .join_from(Inventory, Spool, Inventory.spool_id == Spool.id)
+            .group_by(Inventory.spool_id)
+            .order_by(Inventory.spool_id)
+        )
+        if material:
+            stmt = stmt.join(Material, Spool.material_id == Material.id).where(
+                func.lower(Material.name) == material.lower()
+            )
+        if brand:
+            stmt = stmt.join(Brand, Spool.brand_id == Brand.id).where(
+                func.lower(Brand.name) == brand.lower()
+            )
+        if status:
+            stmt = stmt.join(Status, Inventory.status_id == Status.id).where(
+                func.lower(Status.name) == status.lower()
+            )
+
+        result = await self.db.execute(stmt)
+        return [dict(row._mapping) for row in result]
+
+    async def update_weights(self, weights: Dict[str, float]) -> List[dict]:
+        """
+        Set the weight of many items with a single UPDATE, without committing.
+
+        The rows are first locked (SELECT ... FOR UPDATE, in id order, so
+        overlapping batches queue up instead of deadlocking) and their old
+        weights read. That way a batch that had to wait for another one
+        sees the weights the other batch committed, not its own stale
+        snapshot. The (id, weight) pairs are passed as two array parameters
+        and joined in with unnest(), so the statements are the same for any
+        batch size. Returns id, spool_id, old_weight and weight for each
+        updated item; unknown IDs are simply not returned.
+        """
+        if not weights:
+            return []
+        table = Inventory.__table__
+        ids = bindparam("ids", type_=ARRAY(String))
+        locked = await self.db.execute(
+            select(table.c.id, table.c.weight)
+            .where(table.c.id == func.any(ids))
+            .order_by(table.c.id)
+            .with_for_update(),
+            {"ids": list(weights)},
+        )
+        old_weights = dict(locked.all())
+        if not old_weights:
+            return []
+
+        readings = (
+            func.unnest(ids, bindparam("weights", type_=ARRAY(Float)))
+            .table_valued(column("id", String), column("weight", Float))
+            .render_derived(name="readings")
+        )
+        stmt = (
+            update(table)
+            .where(table.c.id == readings.c.id)
+            .values(weight=readings.c.weight, updated_at=datetime.utcnow())
+            .returning(table.c.id, table.c.spool_id, table.c.weight)
+        )
+        result = await self.db.execute(
+            stmt, {"ids": list(weights), "weights": list(weights.values())}
+        )
+        return [{**row._mapping, "old_weight": old_weights[row.id]} for row in result]
+
+    async def stream_export(self, batch_size: int = 1000) -> AsyncResult:
+        """
+        All inventory items as flat rows (lookup names instead of nested
+        objects), oldest first, streamed from a server-side cursor
+        `batch_size` rows at a time.
+        """
+        stmt = (
+            select(
+                Inventory.id,
+                Inventory.spool_id,
+                Spool.barcode,
+                Color.name.label("color"),
+                Brand.name.label("brand"),
+                Material.name.label("material"),
+                Status.name.label("status"),
+                Inventory.weight,
+                Inventory.is_in_use,
+                Inventory.custom_properties,
+                Inventory.created_at,
+                Inventory.updated_at,
+            )
+            .join_from(Inventory, Spool, Inventory.spool_id == Spool.id)
+            .join(Color, Spool.color_id == Color.id)
+            .join(Brand, Spool.brand_id == Brand.id)
+            .join(Material, Spool.material_id == Material.id)
+            .join(Status, Inventory.status_id == Status.id)
+            .order_by(Inventory.created_at, Inventory.id)
+            .execution_options(yield_per=batch_size)
+        )
+        return await self.db.stream(stmt)
@@ -2,50 +2,214 @@
 Job Repository
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import asc
+from datetime import datetime, timedelta
+from typing import Collection, List, Optional
+from sqlalchemy import case, func, select, update, asc, desc
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.job import Job, JobStatus
 from app.repositories.base import BaseRepository
 
+# Postgres NOTIFY channel announcing newly enqueued jobs (payload: job id)
+JOB_NOTIFY_CHANNEL = "jobs_ready"
+
 
 class JobRepository(BaseRepository[Job]):
-    def __init__(self, db: Session):
+    """
+    Jobs and the queue operations of the workers.
+
+    Enqueueing (create, create_unique) is part of the caller's unit of
+    work. The queue operations (claim_next, heartbeat, requeue_expired,
+    release, next_run_at) commit themselves: each is a transaction of its
+    own, and committing is what releases their row locks.
+    """
+
+    def __init__(self, db: AsyncSession):
         super().__init__(Job, db)
 
-    def get_ready_jobs(self, limit: int = 10) -> List[Job]:
-        """Get jobs ready for processing (FIFO order)"""
-        return (
-            self.db.query(Job)
-            .filter(Job.status == JobStatus.READY)
-            .order_by(asc(Job.created_at))
-            .limit(limit)
-            .all()
+    async def _notify(self, job_id: str) -> None:
+        """Announce a claimable job; delivered when the transaction commits"""
+        await self.db.execute(select(func.pg_notify(JOB_NOTIFY_CHANNEL, job_id)))
+
+    async def create(self, obj: Job) -> Job:
+        """
+        Enqueue a job and wake up listening workers (not committed).
+
+        The NOTIFY is issued in the same transaction as the INSERT, so
+        Postgres only delivers it once the job is committed and claimable.
+        """
+        self.db.add(obj)
+        await self.db.flush()
+        await self._notify(obj.id)
+        return obj
+
+    async def create_unique(self, obj: Job) -> Optional[Job]:
+        """
+        Enqueue a job unless one with the same dedup_key already exists.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING, so concurrent callers cannot
+        both succeed. Returns the new job, or None if it was a duplicate.
+        Not committed, like create.
+        """
+        values = {
+            column.key: getattr(obj, column.key)
+            for column in Job.__table__.columns
+            if getattr(obj, column.key) is not None
+        }
+        job = await self.db.scalar(
+            insert(Job)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[Job.dedup_key])
+            .returning(Job)
+        )
+        if job is not None:
+            await self._notify(job.id)
+        return job
+
+    def _ready_query(self, exclude_types: Optional[Collection[str]] = None):
+        """Due ready jobs in claim order"""
+        query = select(Job).where(
+            Job.status == JobStatus.READY, Job.run_at <= datetime.utcnow()
+        )
+        if exclude_types:
+            query = query.where(Job.job_type.notin_(exclude_types))
+        return query.order_by(desc(Job.priority), asc(Job.run_at))
+
+    async def get_ready_jobs(self, limit: int = 10) -> List[Job]:
+        """Get jobs ready for processing (claim order)"""
+        result = await self.db.execute(self._ready_query().limit(limit))
+        return list(result.scalars().all())
+
+    async def next_run_at(
+        self, exclude_types: Optional[Collection[str]] = None
+    ) -> Optional[datetime]:
+        """Earliest run_at among ready jobs (due or not), None if there are none"""
+        query = select(func.min(Job.run_at)).where(Job.status == JobStatus.READY)
+        if exclude_types:
+            query = query.where(Job.job_type.notin_(exclude_types))
+        run_at = await self.db.scalar(query)
+        # End the read-only transaction so the connection goes back to the pool
+        await self.db.commit()
+        return run_at
+
+    async def claim_next(
+        self, exclude_types: Optional[Collection[str]] = None
+    ) -> Optional[Job]:
+        """
+        Atomically claim the next due job and mark it as processing.
+
+        Jobs are claimed highest priority first, then by run_at. That order
+        matches the partial ix_jobs_ready_queue index, so the claim is an
+        index scan over ready jobs only, however large the history gets.
+
+        SELECT ... FOR UPDATE SKIP LOCKED lets several worker processes claim
+        concurrently: a row locked by one claimer is skipped by the others,
+        so each job is handed out exactly once. The claim is committed
+        before returning, which releases the row lock.
+
+        Args:
+            exclude_types: Job types the caller has no capacity for right now
+        """
+        query = self._ready_query(exclude_types)
+        result = await self.db.execute(query.limit(1).with_for_update(skip_locked=True))
+        job = result.scalars().first()
+        if job is None:
+            # End the (empty) transaction so the connection is not left idle
+            # in it; commit rather than rollback, which would expire objects
+            # already loaded in this session
+            await self.db.commit()
+            return None
+
+        job.status = JobStatus.PROCESSING
+        job.started_at = datetime.utcnow()
+        job.heartbeat_at = job.started_at
+        await self.db.commit()
+        return job
+
+    async def heartbeat(self, job_ids: Collection[str]) -> None:
+        """Mark processing jobs as still being worked on"""
+        await self.db.execute(
+            update(Job)
+            .where(Job.id.in_(job_ids), Job.status == JobStatus.PROCESSING)
+            .values(heartbeat_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
         )
+        await self.db.commit()
+
+    async def requeue_expired(self, timeout_seconds: float) -> List[str]:
+        """
+        Requeue processing jobs whose heartbeat expired (their worker died).
 
-    def get_by_status(self, status: str, limit: int = 50) -> List[Job]:
+        Counts as a retry attempt: the job goes back to ready if it has
+        retries left, otherwise it fails. Safe to run from every worker, as
+        the conditional UPDATE reaps each job only once.
+
+        Returns:
+            IDs of the jobs that were reaped
+        """
+        now = datetime.utcnow()
+        cutoff = now - timedelta(seconds=timeout_seconds)
+        can_retry = Job.retry_count + 1 < Job.max_retries
+        result = await self.db.execute(
+            update(Job)
+            .where(
+                Job.status == JobStatus.PROCESSING,
+                # Jobs claimed before heartbeats existed only have started_at
+                func.coalesce(Job.heartbeat_at, Job.started_at) < cutoff,
+            )
+            .values(
+                retry_count=Job.retry_count + 1,
+                status=case((can_retry, JobStatus.READY), else_=JobStatus.FAILED),
+                error_message="Worker stopped responding (heartbeat expired)",
+                heartbeat_at=None,
+                completed_at=case((can_retry, None), else_=now),
+            )
+            .returning(Job.id, Job.status)
+            .execution_options(synchronize_session=False)
+        )
+        reaped = result.all()
+        for job_id, status in reaped:
+            if status == JobStatus.READY:
+                await self._notify(job_id)
+        await self.db.commit()
+        return [job_id for job_id, _ in reaped]
+
+    async def release(self, job_ids: Collection[str]) -> None:
+        """Put interrupted processing jobs back in the queue without a retry"""
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id.in_(job_ids), Job.status == JobStatus.PROCESSING)
+            .values(status=JobStatus.READY, started_at=None, heartbeat_at=None)
+            .returning(Job.id)
+            .execution_options(synchronize_session=False)
+        )
+        for job_id in result.scalars().all():
+            await self._notify(job_id)
+        await self.db.commit()
+
+    async def get_by_status(self, status: str, limit: int = 50) -> List[Job]:
         """Get jobs by status"""
-        return (
-            self.db.query(Job)
-            .filter(Job.status == status)
+        result = await self.db.execute(
+            select(Job)
+            .where(Job.status == status)
             .order_by(asc(Job.created_at))
             .limit(limit)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_recent_jobs(self, limit: int = 20) -> List[Job]:
+    async def get_recent_jobs(self, limit: int = 20) -> List[Job]:
         """Get most recent jobs regardless of status"""
-        from sqlalchemy import desc
-
-        return self.db.query(Job).order_by(desc(Job.created_at)).limit(limit).all()
+        result = await self.db.execute(
+            select(Job).order_by(desc(Job.created_at)).limit(limit)
+        )
+        return list(result.scalars().all())
 
-    def get_failed_retryable(self) -> List[Job]:
+    async def get_failed_retryable(self) -> List[Job]:
         """Get failed jobs that can be retried"""
-        return (
-            self.db.query(Job)
-            .filter(
+        result = await self.db.execute(
+            select(Job).where(
                 Job.status == JobStatus.FAILED,
                 Job.retry_count < Job.max_retries,
             )
-            .all()
         )
+        return list(result.scalars().all())
@@ -1,22 +1,215 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterable, Optional, List, Tuple
+from sqlalchemy import func, literal_column, select, true, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.orm import raiseload
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
 from app.models.spool import Spool
+from app.models.trade_name import TradeName
 from app.repositories.base import BaseRepository
 
 
+def like_pattern(value: str) -> str:
+    """Substring pattern for ILIKE, with the user's wildcards escaped"""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
 class SpoolRepository(BaseRepository[Spool]):
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(Spool, db)
 
-    def find_by_barcode(self, barcode: str) -> Optional[Spool]:
+    async def find_by_barcode(self, barcode: str) -> Optional[Spool]:
         """Find spool by exact barcode match"""
-        return self.db.query(Spool).filter(Spool.barcode == barcode).first()
+        result = await self.db.execute(select(Spool).where(Spool.barcode == barcode))
+        return result.scalars().first()
+
+    async def get_by_ids(self, ids: Iterable[str]) -> List[Spool]:
+        """Get the spools with these IDs in one query (unknown IDs are skipped)"""
+        result = await self.db.execute(select(Spool).where(Spool.id.in_(list(ids))))
+        return list(result.scalars().unique().all())
+
+    async def find_with_inventory(
+        self, barcode: str
+    ) -> Optional[Tuple[Spool, List[Inventory]]]:
+        """
+        Resolve a scanned barcode to its spool and inventory units.
+
+        One query loads the spool, its lookups and its inventory units (with
+        status), using the unique barcode index and ix_inventory_spool_id.
+        """
+        result = await self.db.execute(
+            select(Spool, Inventory)
+            .outerjoin(Inventory, Inventory.spool_id == Spool.id)
+            .where(Spool.barcode == barcode)
+            .order_by(Inventory.created_at, Inventory.id)
+            # The spool is already the row's first entity; don't join it again
+            .options(raiseload(Inventory.spool))
+        )
+        rows = result.all()
+        if not rows:
+            return None
+        return rows[0][0], [inventory for _, inventory in rows if inventory]
+
+    async def upsert_many(
+        self, rows: List[dict], update_existing: bool = False
+    ) -> List[Tuple[str, str, bool]]:
+        """
+        Insert many spools (plain row dicts), without committing.
+
+        Barcodes that already exist are updated with the new values when
+        `update_existing` is set and skipped otherwise (INSERT ... ON
+        CONFLICT (barcode)). The statement is compiled once and sent in
+        multi-row pages. Returns (id, barcode, inserted) for every row that
+        was inserted or updated; skipped barcodes are missing.
+        """
+        if not rows:
+            return []
+        table = Spool.__table__
+        stmt = insert(table)
+        if update_existing:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.barcode],
+                set_={
+                    **{
+                        key: stmt.excluded[key]
+                        for key in rows[0]
+                        if key not in ("id", "barcode", "created_at")
+                    },
+                    "updated_at": datetime.utcnow(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.barcode])
+        # xmax is 0 for a freshly inserted row version, set for an update
+        stmt = stmt.returning(
+            table.c.id, table.c.barcode, (literal_column("xmax") == 0).label("inserted")
+        )
+        result = await self.db.execute(stmt, rows)
+        return [tuple(row) for row in result]
 
-    def find_by_barcode_partial(self, barcode: str) -> List[Spool]:
+    async def find_by_barcode_partial(
+        self, barcode: str, skip: int = 0, limit: int = 100
+    ) -> List[Spool]:
         """Find spools by partial barcode match (case-insensitive)"""
-        return self.db.query(Spool).filter(Spool.barcode.ilike(f"%{barcode}%")).all()
+        result = await self.db.execute(
+            select(Spool)
+            .where(Spool.barcode.ilike(like_pattern(barcode), escape="\\"))
+            .order_by(Spool.barcode)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
 
-    def get_all_with_relations(self, skip: int = 0, limit: int = 100) -> List[Spool]:
-        """Get all spools with eager-loaded relationships"""
+    async def search(self, query: str, limit: int = 20) -> List[Spool]:
+        """
+        Catalog search ranked by trigram similarity (requires pg_trgm).
+
+        Matches `query` as a substring of the barcode or of the color, brand,
+        material or trade name. Each spool scores the best similarity of its
+        matching fields; results are ordered by score, then oldest first.
+
+        Every branch is capped at `limit` before ranking: barcode matches
+        come from the trigram GIN index, and spools of a matching lookup row
+        from the (fk, created_at, id) indexes, so a broad term like "PLA"
+        does not score the whole catalog.
+
+        Barcodes must also pass the `%` operator (similarity at least
+        pg_trgm.similarity_threshold, 0.3 by default). A short fragment
+        matches a large share of the catalog by substring alone; `%` lets the
+        GIN index drop the dissimilar ones before they are scored and sorted.
+        """
+        pattern = like_pattern(query)
+        barcode_score = func.similarity(Spool.barcode, query)
+        branches = [
+            select(Spool.id.label("id"), barcode_score.label("score"))
+            .where(
+                Spool.barcode.ilike(pattern, escape="\\"),
+                Spool.barcode.op("%")(query),
+            )
+            .order_by(barcode_score.desc())
+            .limit(limit)
+        ]
+        for model, foreign_key in [
+            (Color, Spool.color_id),
+            (Brand, Spool.brand_id),
+            (Material, Spool.material_id),
+            (TradeName, Spool.trade_name_id),
+        ]:
+            name_score = func.similarity(model.name, query)
+            hits = (
+                select(model.id, name_score.label("score"))
+                .where(model.name.ilike(pattern, escape="\\"))
+                .order_by(name_score.desc())
+                .limit(limit)
+                .subquery()
+            )
+            spools = (
+                select(Spool.id)
+                .where(foreign_key == hits.c.id)
+                .order_by(Spool.created_at, Spool.id)
+                .limit(limit)
+                .lateral()
+            )
+            branches.append(
+                select(spools.c.id, hits.c.score).select_from(hits).join(spools, true())
+            )
+
+        candidates = union_all(*branches).subquery()
+        scores = (
+            select(candidates.c.id, func.max(candidates.c.score).label("score"))
+            .group_by(candidates.c.id)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(Spool)
+            .join(scores, Spool.id == scores.c.id)
+            .order_by(scores.c.score.desc(), Spool.created_at, Spool.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_all_with_relations(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Spool], Optional[str]]:
+        """Get one page of spools with eager-loaded relationships"""
         # Already configured in model with lazy="joined"
-        return self.get_all(skip, limit)
+        return await self.get_page(limit, cursor, skip)
+
+    async def stream_export(self, batch_size: int = 1000) -> AsyncResult:
+        """
+        The whole catalog as flat rows (lookup names instead of nested
+        objects), oldest first, streamed from a server-side cursor
+        `batch_size` rows at a time.
+        """
+        stmt = (
+            select(
+                Spool.id,
+                Spool.barcode,
+                Spool.base_weight,
+                Spool.is_box,
+                Spool.thickness,
+                Spool.spool_return,
+                Color.name.label("color"),
+                Color.hex_code.label("color_hex_code"),
+                Brand.name.label("brand"),
+                Material.name.label("material"),
+                TradeName.name.label("trade_name"),
+                Category.name.label("category"),
+                Spool.created_at,
+                Spool.updated_at,
+            )
+            .join(Color, Spool.color_id == Color.id)
+            .join(Brand, Spool.brand_id == Brand.id)
+            .join(Material, Spool.material_id == Material.id)
+            .outerjoin(TradeName, Spool.trade_name_id == TradeName.id)
+            .outerjoin(Category, Spool.category_id == Category.id)
+            .order_by(Spool.created_at, Spool.id)
+            .execution_options(yield_per=batch_size)
+        )
+        return await self.db.stream(stmt)
@@ -1,31 +1,35 @@
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User, UserRole
 from app.repositories.base import BaseRepository
 
 
 class UserRepository(BaseRepository[User]):
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(User, db)
 
-    def find_by_email(self, email: str) -> Optional[User]:
+    async def find_by_email(self, email: str) -> Optional[User]:
         """Find user by email (case-insensitive)"""
-        return self.db.query(User).filter(User.email.ilike(email)).first()
+        result = await self.db.execute(select(User).where(User.email.ilike(email)))
+        return result.scalars().first()
 
-    def find_by_id(self, user_id: str) -> Optional[User]:
+    async def find_by_id(self, user_id: str) -> Optional[User]:
         """Find user by ID"""
-        return self.get_by_id(user_id)
+        return await self.get_by_id(user_id)
 
-    def find_all(self) -> List[User]:
+    async def find_all(self) -> List[User]:
         """Get all users"""
-        return self.db.query(User).order_by(User.created_at.desc()).all()
+        result = await self.db.execute(select(User).order_by(User.created_at.desc()))
+        return list(result.scalars().all())
 
-    def count_users(self) -> int:
+    async def count_users(self) -> int:
         """Count total number of users"""
-        return self.db.query(User).count()
+        result = await self.db.execute(select(func.count(User.id)))
+        return result.scalar_one()
 
-    def create_user(
+    async def create_user(
         self,
         email: str,
         hashed_password: str,
@@ -39,4 +43,4 @@ class UserRepository(BaseRepository[User]):
             full_name=full_name,
             role=role,
         )
-        return self.create(new_user)
+        return await self.create(new_user)
@@ -4,7 +4,7 @@ Activity Log Schemas
 
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
 class ActivityLogCreate(BaseModel):
@@ -14,7 +14,7 @@ class ActivityLogCreate(BaseModel):
     entity_type: str
     entity_id: Optional[str] = None
     description: str
-    extra_data: Optional[str] = None
+    extra_data: Optional[Dict[str, Any]] = None
     user_id: Optional[str] = None
     user_email: Optional[str] = None
 
@@ -27,7 +27,7 @@ class ActivityLogResponse(BaseModel):
     entity_type: str
     entity_id: Optional[str]
     description: str
-    extra_data: Optional[str]
+    extra_data: Optional[Dict[str, Any]]
     user_id: Optional[str]
     user_email: Optional[str]
     created_at: datetime
@@ -1,7 +1,7 @@
 # app/schemas/inventory.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from app.schemas.spool import SpoolResponse
 from app.schemas.status import StatusResponse
@@ -28,6 +28,69 @@ class InventoryCreate(BaseModel):
     )
 
 
+# Upper bound on units per bulk intake request
+MAX_BULK_UNITS = 10_000
+
+
+class InventoryBulkItem(InventoryCreate):
+    """`quantity` identical units of one spool type"""
+
+    quantity: int = Field(
+        default=1, ge=1, le=MAX_BULK_UNITS, description="Number of units to add"
+    )
+
+
+class InventoryBulkCreate(BaseModel):
+    """Schema for adding many units to inventory in one request"""
+
+    items: List[InventoryBulkItem] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def check_total_units(self) -> "InventoryBulkCreate":
+        total = sum(item.quantity for item in self.items)
+        if total > MAX_BULK_UNITS:
+            raise ValueError(f"At most {MAX_BULK_UNITS} units per request, got {total}")
+        return self
+
+
+class InventoryBulkResponse(BaseModel):
+    """IDs of the inventory items created by a bulk intake, in request order"""
+
+    created: int
+    ids: List[str]
+
+
+class WeightReading(BaseModel):
+    """One scale reading"""
+
+    id: str = Field(..., description="Inventory item ID")
+    weight: float = Field(..., gt=0)
+
+
+class WeightBatchUpdate(BaseModel):
+    """Schema for applying many scale readings at once"""
+
+    readings: List[WeightReading] = Field(..., min_length=1, max_length=MAX_BULK_UNITS)
+
+
+class WeightUpdateResult(BaseModel):
+    """Outcome of one reading; `error` says why it was not applied"""
+
+    id: str
+    updated: bool
+    old_weight: Optional[float] = None
+    weight: Optional[float] = None
+    error: Optional[str] = None
+
+
+class WeightBatchResponse(BaseModel):
+    """Per-reading results, in request order"""
+
+    updated: int
+    failed: int
+    results: List[WeightUpdateResult]
+
+
 class InventoryUpdate(BaseModel):
     """Schema for updating an inventory item"""
 
@@ -53,3 +116,13 @@ class InventoryResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class InventorySummary(BaseModel):
+    """Aggregated inventory of one spool type"""
+
+    spool_id: str
+    units: int
+    total_weight: float
+    in_use_count: int
+    low_stock_count: int  # units with weight < 20% of the spool's base weight
@@ -0,0 +1,34 @@
+# app/schemas/scan.py
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.schemas.spool import SpoolResponse
+from app.schemas.status import StatusResponse
+
+
+class ScanInventoryItem(BaseModel):
+    """One physical unit of the scanned spool (the spool itself is not repeated)"""
+
+    id: str
+    weight: float
+    is_in_use: bool
+    custom_properties: Optional[str]
+    status: StatusResponse
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ScanResponse(BaseModel):
+    """Everything a scanner needs about a barcode, in one response"""
+
+    spool: SpoolResponse
+    inventory: List[ScanInventoryItem]
+
+    # Aggregates over the inventory units above
+    count: int
+    in_use_count: int
+    total_weight: float
+    status_counts: Dict[str, int]
@@ -39,6 +39,14 @@ class UserResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class UserCacheStats(BaseModel):
+    size: int
+    hits: int
+    misses: int
+    hit_rate: float
+    ttl_seconds: float
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
@@ -2,13 +2,21 @@
 Activity Log Service
 
 Service for logging all operations in the system.
+
+Entries are written in the caller's transaction, unless a running
+ActivityLogWriter is passed in: then they are buffered once the caller's
+transaction commits, and written in batches in the background.
 """
 
 import json
-from typing import Optional, List
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.base import on_commit
 from app.models.activity_log import ActivityLog
 from app.models.user import User
+from app.services.activity_log_writer import ActivityLogWriter
 
 
 class ActionType:
@@ -46,10 +54,28 @@ class EntityType:
 class ActivityLogService:
     """Service for managing activity logs"""
 
-    def __init__(self, activity_log_repo: ActivityLogRepository):
+    def __init__(
+        self,
+        activity_log_repo: ActivityLogRepository,
+        writer: Optional[ActivityLogWriter] = None,
+    ):
         self.activity_log_repo = activity_log_repo
+        self.writer = writer
+
+    def _buffered(self, rows: List[dict]) -> bool:
+        """
+        Hand rows to the writer once the caller's transaction commits.
+
+        Returns False, leaving the rows to be written synchronously, when
+        there is no running writer or its buffer is full.
+        """
+        if not self.writer or not self.writer.accepts(len(rows)):
+            return False
+        writer = self.writer
+        on_commit(self.activity_log_repo.db, lambda: writer.enqueue(rows))
+        return True
 
-    def log(
+    async def log(
         self,
         action_type: str,
         entity_type: str,
@@ -59,43 +85,100 @@ class ActivityLogService:
         user: Optional[User] = None,
     ) -> ActivityLog:
         """
-        Log an activity.
+        Log an activity, as part of the caller's unit of work.
+
+        The entry is flushed, not committed: it is committed together with
+        the change it describes, or not at all. With a running writer it is
+        buffered instead, once that change has committed.
 
         Args:
             action_type: Type of action (use ActionType constants)
             entity_type: Type of entity affected (use EntityType constants)
             description: Human-readable description
             entity_id: ID of the affected entity
-            metadata: Additional context as dict (will be JSON serialized)
+            metadata: Additional context as dict (stored as JSONB)
             user: User who performed the action
 
         Returns:
-            Created ActivityLog entry
+            Created ActivityLog entry (not yet in the database if buffered)
+        """
+        row = _row(
+            {
+                "action_type": action_type,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "description": description,
+                "metadata": metadata,
+            },
+            user,
+            datetime.utcnow(),
+        )
+        if self._buffered([row]):
+            return ActivityLog(**row)
+        return await self.activity_log_repo.create(ActivityLog(**row))
+
+    async def log_many(self, entries: List[dict], user: Optional[User] = None) -> None:
         """
-        log_entry = ActivityLog(
-            action_type=action_type,
+        Log many activities with multi-row INSERTs, without committing.
+
+        Each entry holds the keyword arguments of log() (except user). The
+        caller commits, together with the rows the entries describe; with a
+        running writer the rows are buffered after that commit instead.
+        """
+        now = datetime.utcnow()
+        rows = [_row(entry, user, now) for entry in entries]
+        if rows and not self._buffered(rows):
+            await self.activity_log_repo.insert_many(rows)
+
+    async def query(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        action_types: Optional[List[str]] = None,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        contains: Optional[Dict[str, Any]] = None,
+        spool_id: Optional[str] = None,
+    ) -> Tuple[List[ActivityLog], Optional[str]]:
+        """
+        Get one page of filtered activity logs (newest first) and the next
+        cursor; see ActivityLogRepository.query for the filters.
+
+        Raises:
+            ValueError: If the time range is empty
+        """
+        since, until = _naive_utc(since), _naive_utc(until)
+        if since and until and since >= until:
+            raise ValueError("'since' must be before 'until'")
+        return await self.activity_log_repo.query(
+            limit,
+            cursor,
+            action_types=action_types,
             entity_type=entity_type,
             entity_id=entity_id,
-            description=description,
-            extra_data=json.dumps(metadata) if metadata else None,
-            user_id=user.id if user else None,
-            user_email=user.email if user else None,
+            user_id=user_id,
+            since=since,
+            until=until,
+            contains=contains,
+            spool_id=spool_id,
         )
-        return self.activity_log_repo.create(log_entry)
 
-    def get_recent(self, limit: int = 100) -> List[ActivityLog]:
+    async def get_recent(self, limit: int = 100) -> List[ActivityLog]:
         """Get recent activity logs"""
-        return self.activity_log_repo.get_recent(limit)
+        return await self.activity_log_repo.get_recent(limit)
 
-    def get_by_entity(
+    async def get_by_entity(
         self, entity_type: str, entity_id: str, limit: int = 50
     ) -> List[ActivityLog]:
         """Get logs for a specific entity"""
-        return self.activity_log_repo.get_by_entity(entity_type, entity_id, limit)
+        return await self.activity_log_repo.get_by_entity(entity_type, entity_id, limit)
 
-    def get_for_ai_analysis(self, limit: int = 500) -> List[ActivityLog]:
+    async def get_for_ai_analysis(self, limit: int = 500) -> List[ActivityLog]:
         """Get logs formatted for AI analysis"""
-        return self.activity_log_repo.get_for_ai_analysis(limit)
+        return await self.activity_log_repo.get_for_ai_analysis(limit)
 
     def format_logs_for_ai(self, logs: List[ActivityLog]) -> str:
         """
@@ -112,10 +195,30 @@ class ActivityLogService:
                 "description": log.description,
             }
             if log.extra_data:
-                try:
-                    entry["details"] = json.loads(log.extra_data)
-                except json.JSONDecodeError:
-                    entry["details"] = log.extra_data
+                entry["details"] = log.extra_data
             formatted_logs.append(entry)
 
         return json.dumps(formatted_logs, indent=2)
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """created_at is naive UTC; convert aware bounds to match"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _row(entry: dict, user: Optional[User], now: datetime) -> dict:
+    """activity_logs row for a log entry (the keyword arguments of log())"""
+    metadata = entry.get("metadata")
+    return {
+        "id": str(uuid.uuid4()),
+        "action_type": entry["action_type"],
+        "entity_type": entry["entity_type"],
+        "entity_id": entry.get("entity_id"),
+        "description": entry["description"],
+        "extra_data": metadata or None,
+        "user_id": user.id if user else None,
+        "user_email": user.email if user else None,
+        "created_at": now,
+    }
@@ -0,0 +1,187 @@
+"""
+Activity Log Writer
+
+Optional buffered writer for activity log entries (ACTIVITY_LOG_BUFFERED).
+
+By default every entry is inserted in the transaction of the change it
+describes, so the two are committed together. With the writer running,
+ActivityLogService hands its rows over once that transaction has committed
+instead: the request commits without them, and a background task writes
+the buffered rows with multi-row INSERTs in their own transaction, as soon
+as ACTIVITY_LOG_BATCH_SIZE rows are waiting or every
+ACTIVITY_LOG_FLUSH_INTERVAL_MS otherwise.
+
+The price is durability: rows still in the buffer are lost if the process
+dies. A graceful shutdown (stop) writes them first, and rows of
+transactions that commit after that final flush are written on the spot.
+When the buffer holds ACTIVITY_LOG_MAX_PENDING rows, for instance because
+the database keeps rejecting the batches, new entries go back to
+synchronous writes rather than piling up in memory.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Deque, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.activity_log import ActivityLog
+from app.repositories.activity_log_repository import ActivityLogRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityLogWriter:
+    """Buffers activity log rows in memory and writes them in batches"""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[float] = None,
+        max_pending: Optional[int] = None,
+    ):
+        self.batch_size = batch_size or settings.ACTIVITY_LOG_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval_ms
+            if flush_interval_ms is not None
+            else settings.ACTIVITY_LOG_FLUSH_INTERVAL_MS
+        ) / 1000
+        self.max_pending = max_pending or settings.ACTIVITY_LOG_MAX_PENDING
+        self.written = 0
+        self._pending: Deque[dict] = deque()
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._batch_ready = asyncio.Event()
+        # Only one flush writes at a time, so rows keep their order
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        """Rows waiting to be written"""
+        return len(self._pending)
+
+    def accepts(self, count: int = 1) -> bool:
+        """Whether `count` more rows can be buffered right now"""
+        return self._running and len(self._pending) + count <= self.max_pending
+
+    def enqueue(self, rows: List[dict]) -> None:
+        """
+        Buffer rows for the next batch.
+
+        Always takes the rows: callers check accepts() when they log, and
+        the rows only arrive once their transaction has committed. Rows that
+        arrive after stop() has flushed the buffer are written right away,
+        since no flush would ever pick them up.
+        """
+        if not self._running and self._task is None:
+            self._write_now(rows)
+            return
+        self._pending.extend(rows)
+        if len(self._pending) >= self.batch_size:
+            self._batch_ready.set()
+
+    def _get_db(self) -> AsyncSession:
+        """Get a new database session"""
+        return AsyncSessionLocal()
+
+    def _get_sync_db(self) -> Session:
+        """Get a new synchronous database session (for writes after stop)"""
+        return SessionLocal()
+
+    def _write_now(self, rows: List[dict]) -> None:
+        """
+        Insert rows in their own transaction, blocking.
+
+        enqueue runs in a commit hook and cannot await; this only happens
+        during shutdown, for the few transactions still committing.
+        """
+        try:
+            with self._get_sync_db() as db:
+                db.execute(insert(ActivityLog.__table__), rows)
+                db.commit()
+            self.written += len(rows)
+        except Exception as e:
+            logger.error(
+                f"Activity log write after shutdown failed, {len(rows)} rows lost: "
+                f"{str(e)}"
+            )
+
+    async def flush(self) -> None:
+        """Write every buffered row now, one transaction per batch"""
+        async with self._flush_lock:
+            while self._pending:
+                count = min(self.batch_size, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(count)]
+                try:
+                    async with self._get_db() as db:
+                        activity_log_repo = ActivityLogRepository(db)
+                        await activity_log_repo.insert_many(batch)
+                        await activity_log_repo.commit()
+                except Exception:
+                    # Keep the rows, in order, for the next attempt
+                    self._pending.extendleft(reversed(batch))
+                    raise
+                self.written += count
+
+    async def _flush_loop(self) -> None:
+        """Flush when a batch is full or the interval has passed"""
+        while self._running:
+            try:
+                await asyncio.wait_for(
+                    self._batch_ready.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(
+                    f"Activity log flush failed, {self.pending} rows kept: {str(e)}"
+                )
+
+    def start(self) -> None:
+        """Start buffering and the background flush task"""
+        if self._running:
+            logger.warning("Activity log writer already running")
+            return
+
+        self._running = True
+        self._batch_ready = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.info("Activity log writer started")
+
+    async def stop(self) -> None:
+        """
+        Stop buffering and write what is left.
+
+        Entries logged from now on are written synchronously again.
+        """
+        # Wake the loop rather than cancel it, so a batch being written is
+        # not cut off between its INSERT and its commit
+        self._running = False
+        self._batch_ready.set()
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(
+                f"Activity log flush on shutdown failed, {self.pending} rows lost: "
+                f"{str(e)}"
+            )
+        logger.info("Activity log writer stopped")
+
+
+# Global writer instance
+activity_log_writer = ActivityLogWriter()
@@ -15,7 +15,7 @@ from app.repositories.insight_repository import InsightRepository
 from app.repositories.job_repository import JobRepository
 from app.repositories.inventory_repository import InventoryRepository
 from app.models.insight import Insight
-from app.models.job import Job, JobStatus, JobType
+from app.models.job import Job, JobPriority, JobStatus, JobType
 from app.services.activity_log_service import ActivityLogService
 
 
@@ -63,28 +63,24 @@ Please analyze this data and provide:
         self.inventory_repo = inventory_repo
         self.activity_log_service = ActivityLogService(activity_log_repo)
 
-    def _get_inventory_summary(self) -> dict:
+    async def _get_inventory_summary(self) -> dict:
         """Get current inventory summary for context"""
-        inventory_items = self.inventory_repo.get_all(limit=1000)
-
-        total_spools = len(inventory_items)
-        total_weight = sum(item.weight for item in inventory_items)
-        in_use_count = sum(1 for item in inventory_items if item.is_in_use)
+        stats = await self.inventory_repo.get_stats()
 
         return {
-            "total_spools": total_spools,
-            "total_weight": round(total_weight, 2),
-            "in_use_count": in_use_count,
+            "total_spools": stats["total_spools"],
+            "total_weight": round(stats["total_weight"], 2),
+            "in_use_count": stats["spools_in_use"],
         }
 
-    def _build_prompt(self) -> str:
+    async def _build_prompt(self) -> str:
         """Build the prompt for OpenAI"""
         # Get activity logs
-        logs = self.activity_log_repo.get_for_ai_analysis(limit=200)
+        logs = await self.activity_log_repo.get_for_ai_analysis(limit=200)
         formatted_logs = self.activity_log_service.format_logs_for_ai(logs)
 
         # Get inventory summary
-        summary = self._get_inventory_summary()
+        summary = await self._get_inventory_summary()
 
         return self.USER_PROMPT_TEMPLATE.format(
             total_spools=summary["total_spools"],
@@ -142,7 +138,10 @@ Please analyze this data and provide:
                 return data["choices"][0]["message"]["content"]
 
     async def generate_insight(
-        self, job_id: Optional[str] = None, generated_by: str = "manual"
+        self,
+        job_id: Optional[str] = None,
+        generated_by: str = "manual",
+        raise_on_error: bool = False,
     ) -> Insight:
         """
         Generate a new AI insight.
@@ -150,15 +149,22 @@ Please analyze this data and provide:
         Args:
             job_id: Optional job ID if triggered by a job
             generated_by: How the insight was triggered ("manual", "scheduled", "openai")
+            raise_on_error: Let a failed OpenAI call propagate (so a job can be
+                retried) instead of storing the error as the insight
 
         Returns:
             Created Insight with AI-generated content
         """
-        prompt = self._build_prompt()
+        prompt = await self._build_prompt()
+        # End the read transaction: the session's pooled connection would
+        # otherwise sit idle in transaction for the whole OpenAI call
+        await self.insight_repo.commit()
 
         try:
             content = await self._call_openai(prompt, stream=False)
         except Exception as e:
+            if raise_on_error:
+                raise
             content = f"❌ Failed to generate insight: {str(e)}"
 
         insight = Insight(
@@ -167,7 +173,9 @@ Please analyze this data and provide:
             generated_by=generated_by,
         )
 
-        return self.insight_repo.create(insight)
+        created = await self.insight_repo.create(insight)
+        await self.insight_repo.commit()
+        return created
 
     async def generate_insight_stream(self, generated_by: str = "manual"):
         """
@@ -179,7 +187,8 @@ Please analyze this data and provide:
         Yields:
             Server-sent events with streaming content and final insight data
         """
-        prompt = self._build_prompt()
+        prompt = await self._build_prompt()
+        await self.insight_repo.commit()
         accumulated_content = []
 
         try:
@@ -217,7 +226,8 @@ Please analyze this data and provide:
                     job_id=None,
                     generated_by=generated_by,
                 )
-                saved_insight = self.insight_repo.create(insight)
+                saved_insight = await self.insight_repo.create(insight)
+                await self.insight_repo.commit()
 
                 # Send the final insight data
                 yield f"data: {json.dumps({'type': 'complete', 'insight': {'id': saved_insight.id, 'content': saved_insight.content, 'created_at': saved_insight.created_at.isoformat(), 'generated_by': saved_insight.generated_by}})}\n\n"
@@ -226,18 +236,21 @@ Please analyze this data and provide:
             error_message = f"❌ Failed to generate insight: {str(e)}"
             yield f"data: {json.dumps({'type': 'error', 'error': error_message})}\n\n"
 
-    def get_latest_insight(self) -> Optional[Insight]:
+    async def get_latest_insight(self) -> Optional[Insight]:
         """Get the most recent insight"""
-        return self.insight_repo.get_latest()
+        return await self.insight_repo.get_latest()
 
-    def get_recent_insights(self, limit: int = 10) -> list[Insight]:
+    async def get_recent_insights(self, limit: int = 10) -> list[Insight]:
         """Get recent insights"""
-        return self.insight_repo.get_recent(limit)
+        return await self.insight_repo.get_recent(limit)
 
-    def create_insight_job(self) -> Job:
+    async def create_insight_job(self, priority: int = JobPriority.NORMAL) -> Job:
         """Create a job for generating insights (for background processing)"""
         job = Job(
             job_type=JobType.GENERATE_INSIGHTS,
             status=JobStatus.READY,
+            priority=priority,
         )
-        return self.job_repo.create(job)
+        created = await self.job_repo.create(job)
+        await self.job_repo.commit()
+        return created
@@ -1,12 +1,15 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Optional, Tuple, TypeVar
 import logging
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
+from app.core.cache import user_cache
 from app.core.config import settings
 from app.models.user import User, UserRole
 from app.repositories.user_repository import UserRepository
@@ -16,8 +19,24 @@ from app.database import get_db
 # Configure auth logger
 auth_logger = logging.getLogger("authentication")
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. Pinning min/max rounds to the configured cost
+# makes hashes of any other cost "need update", so they are rehashed on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt takes hundreds of milliseconds of CPU per call (and releases the
+# GIL while doing it), so it runs on a small dedicated pool instead of the
+# event loop. Bursts of logins queue here rather than stalling other requests
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+)
+
+T = TypeVar("T")
 
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -33,6 +52,31 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def run_password_work(func: Callable[..., T], *args) -> T:
+    """Run a blocking bcrypt call on the password pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, func, *args)
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password without blocking the event loop"""
+    return await run_password_work(get_password_hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password without blocking the event loop.
+
+    Returns (valid, new_hash); new_hash is set when the stored hash was made
+    with a different bcrypt cost and should be replaced.
+    """
+    return await run_password_work(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token with proper claims.
@@ -106,14 +150,14 @@ def decode_token(token: str) -> Optional[TokenData]:
 
 
 class AuthService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.user_repo = UserRepository(db)
 
-    def register_user(self, user_data: UserCreate) -> User:
+    async def register_user(self, user_data: UserCreate) -> User:
         """Register a new user with role. First user gets ADMIN role, all others get VIEWER role."""
         # Check if user already exists
-        existing_user = self.user_repo.find_by_email(user_data.email)
+        existing_user = await self.user_repo.find_by_email(user_data.email)
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -121,10 +165,10 @@ class AuthService:
             )
 
         # Hash password and create user with role
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await hash_password(user_data.password)
 
         # Determine role: first user gets ADMIN, all others get VIEWER
-        user_count = self.user_repo.count_users()
+        user_count = await self.user_repo.count_users()
         if user_count == 0:
             role = UserRole.ADMIN
             auth_logger.info(f"Creating first user with ADMIN role: {user_data.email}")
@@ -132,35 +176,54 @@ class AuthService:
             role = UserRole.VIEWER
             auth_logger.info(f"Creating user with VIEWER role: {user_data.email}")
 
-        user = self.user_repo.create_user(
+        user = await self.user_repo.create_user(
             email=user_data.email,
             hashed_password=hashed_password,
             full_name=user_data.full_name,
             role=role,
         )
+        await self.user_repo.commit()
 
         auth_logger.info(f"New user registered: {user.email} with role {role.value}")
         return user
 
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """Authenticate a user by email and password"""
-        user = self.user_repo.find_by_email(email)
+        user = await self.user_repo.find_by_email(email)
         if not user:
             auth_logger.warning(f"Login failed: user not found ({email})")
             return None
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = await verify_and_update_password(
+            password, user.hashed_password
+        )
+        if not valid:
             auth_logger.warning(f"Login failed: invalid password ({email})")
             return None
+        if new_hash:
+            # The configured bcrypt cost changed since this hash was made
+            user.hashed_password = new_hash
+            await self.user_repo.update(user)
+            await self.user_repo.commit()
+            user_cache.invalidate(user.id)
+            auth_logger.info(f"Password rehashed with current cost: {email}")
         auth_logger.info(f"User logged in: {email}")
         return user
 
-    def get_user_by_id(self, user_id: str) -> Optional[User]:
-        """Get a user by their ID"""
-        return self.user_repo.get_by_id(user_id)
+    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """Get a user by their ID, from the user cache when possible"""
+        cached = user_cache.get(user_id)
+        if cached is not None:
+            # Attach to this session without a query
+            return await self.db.merge(cached, load=False)
+
+        user = await self.user_repo.get_by_id(user_id)
+        if user is not None:
+            user_cache.put(user)
+        return user
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
 ) -> User:
     """
     Dependency to get the current authenticated user.
@@ -183,7 +246,7 @@ async def get_current_user(
         raise credentials_exception
 
     auth_service = AuthService(db)
-    user = auth_service.get_user_by_id(token_data.user_id)
+    user = await auth_service.get_user_by_id(token_data.user_id)
 
     if user is None:
         auth_logger.warning(
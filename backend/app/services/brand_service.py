@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 from app.repositories.brand_repository import BrandRepository
 from app.models.brand import Brand
 
@@ -9,30 +9,33 @@ class BrandService:
     def __init__(self, brand_repo: BrandRepository):
         self.brand_repo = brand_repo
 
-    def get_all_brands(self, skip: int = 0, limit: int = 100) -> List[Brand]:
-        """Get all brands with pagination"""
-        return self.brand_repo.get_all(skip, limit)
+    async def get_all_brands(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Brand], Optional[str]]:
+        """Get one page of brands and the cursor of the next page"""
+        return await self.brand_repo.get_page(limit, cursor, skip)
 
-    def get_brand_by_id(self, brand_id: str) -> Brand:
+    async def get_brand_by_id(self, brand_id: str) -> Brand:
         """Get a brand by ID"""
-        brand = self.brand_repo.get_by_id(brand_id)
+        brand = await self.brand_repo.get_by_id(brand_id)
         if not brand:
             raise ValueError(f"Brand with id {brand_id} not found")
         return brand
 
-    def create_brand(self, name: str) -> Brand:
+    async def create_brand(self, name: str) -> Brand:
         """Create a new brand"""
         # Check if brand already exists
-        existing = self.brand_repo.find_by_name(name)
+        existing = await self.brand_repo.find_by_name(name)
         if existing:
             raise ValueError(f"Brand '{name}' already exists")
 
         new_brand = Brand(name=name)
-        return self.brand_repo.create(new_brand)
+        created = await self.brand_repo.create(new_brand)
+        await self.brand_repo.commit()
+        return created
 
-    def find_or_create(
+    async def find_or_create(
         self,
         name: str,
     ) -> Brand:
-
-        return self.brand_repo.find_or_create(name)
+        return await self.brand_repo.find_or_create(name)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 from app.repositories.category_repository import CategoryRepository
 from app.models.category import Category
 
@@ -9,25 +9,29 @@ class CategoryService:
     def __init__(self, category_repo: CategoryRepository):
         self.category_repo = category_repo
 
-    def get_all_categories(self, skip: int = 0, limit: int = 100) -> List[Category]:
-        """Get all categories with pagination"""
-        return self.category_repo.get_all(skip, limit)
+    async def get_all_categories(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Category], Optional[str]]:
+        """Get one page of categories and the cursor of the next page"""
+        return await self.category_repo.get_page(limit, cursor, skip)
 
-    def get_category_by_id(self, category_id: str) -> Category:
+    async def get_category_by_id(self, category_id: str) -> Category:
         """Get a category by ID"""
-        category = self.category_repo.get_by_id(category_id)
+        category = await self.category_repo.get_by_id(category_id)
         if not category:
             raise ValueError(f"Category with id {category_id} not found")
         return category
 
-    def create_category(self, name: str) -> Category:
+    async def create_category(self, name: str) -> Category:
         """Create a new category"""
-        existing = self.category_repo.find_by_name(name)
+        existing = await self.category_repo.find_by_name(name)
         if existing:
             raise ValueError(f"Category '{name}' already exists")
 
         new_category = Category(name=name)
-        return self.category_repo.create(new_category)
+        created = await self.category_repo.create(new_category)
+        await self.category_repo.commit()
+        return created
 
-    def find_or_create(self, name: str) -> Category:
-        return self.category_repo.find_or_create(name)
+    async def find_or_create(self, name: str) -> Category:
+        return await self.category_repo.find_or_create(name)
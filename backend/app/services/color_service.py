@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 from app.repositories.color_repository import ColorRepository
 from app.models.color import Color
 
@@ -10,28 +10,32 @@ class ColorService:
     def __init__(self, color_repo: ColorRepository):
         self.color_repo = color_repo
 
-    def get_all_colors(self, skip: int = 0, limit: int = 100) -> List[Color]:
-        """Get all colors with pagination"""
-        return self.color_repo.get_all(skip, limit)
+    async def get_all_colors(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Color], Optional[str]]:
+        """Get one page of colors and the cursor of the next page"""
+        return await self.color_repo.get_page(limit, cursor, skip)
 
-    def get_color_by_id(self, color_id: str) -> Color:
+    async def get_color_by_id(self, color_id: str) -> Color:
         """Get a color by ID"""
-        color = self.color_repo.get_by_id(color_id)
+        color = await self.color_repo.get_by_id(color_id)
         if not color:
             raise ValueError(f"Color with id {color_id} not found")
         return color
 
-    def create_color(self, name: str, hex_code: str) -> Color:
+    async def create_color(self, name: str, hex_code: str) -> Color:
         """Create a new color"""
         # Check if color already exists
-        existing = self.color_repo.find_by_name(name)
+        existing = await self.color_repo.find_by_name(name)
         if existing:
             raise ValueError(f"Color '{name}' already exists")
 
         new_color = Color(name=name, hex_code=hex_code)
-        return self.color_repo.create(new_color)
+        created = await self.color_repo.create(new_color)
+        await self.color_repo.commit()
+        return created
 
-    def find_or_create(self, name: str, hex_code: str = "#000000") -> Color:
+    async def find_or_create(self, name: str, hex_code: str = "#000000") -> Color:
         """
         Find existing color by name, or create new one.
 
@@ -42,4 +46,4 @@ class ColorService:
         Returns:
             Color object (existing or newly created)
         """
-        return self.color_repo.find_or_create(name, hex_code)
+        return await self.color_repo.find_or_create(name, hex_code)
@@ -4,7 +4,7 @@ Dashboard Service
 Service for aggregating dashboard data.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from app.repositories.inventory_repository import InventoryRepository
 from app.repositories.activity_log_repository import ActivityLogRepository
 from app.repositories.insight_repository import InsightRepository
@@ -30,51 +30,47 @@ class DashboardService:
         self.insight_repo = insight_repo
         self.job_repo = job_repo
 
-    def get_inventory_stats(self) -> InventoryStats:
+    async def get_inventory_stats(self) -> InventoryStats:
         """Get inventory statistics for dashboard"""
-        inventory_items = self.inventory_repo.get_all(limit=10000)
-
-        total_spools = len(inventory_items)
-        total_weight = sum(item.weight for item in inventory_items)
-        spools_in_use = sum(1 for item in inventory_items if item.is_in_use)
-
         # Low stock: items with weight < 20% of their spool's base weight
-        low_stock_count = 0
-        for item in inventory_items:
-            if item.spool and item.spool.base_weight:
-                threshold = item.spool.base_weight * 0.2
-                if item.weight < threshold:
-                    low_stock_count += 1
+        stats = await self.inventory_repo.get_stats(low_stock_ratio=0.2)
 
         return InventoryStats(
-            total_spools=total_spools,
-            total_weight=round(total_weight, 2),
-            spools_in_use=spools_in_use,
-            low_stock_count=low_stock_count,
+            total_spools=stats["total_spools"],
+            total_weight=round(stats["total_weight"], 2),
+            spools_in_use=stats["spools_in_use"],
+            low_stock_count=stats["low_stock_count"],
         )
 
-    def get_recent_activity(self, limit: int = 20) -> List[ActivityLog]:
+    async def get_recent_activity(self, limit: int = 20) -> List[ActivityLog]:
         """Get recent activity logs for dashboard"""
-        return self.activity_log_repo.get_recent(limit)
+        return await self.activity_log_repo.get_recent(limit)
+
+    async def get_activity_page(
+        self, limit: int = 50, cursor: Optional[str] = None
+    ) -> Tuple[List[ActivityLog], Optional[str]]:
+        """Get one page of activity logs (newest first) and the next cursor"""
+        return await self.activity_log_repo.get_page_newest_first(limit, cursor)
 
-    def get_latest_insight(self) -> Optional[Insight]:
+    async def get_latest_insight(self) -> Optional[Insight]:
         """Get the most recent AI insight"""
-        return self.insight_repo.get_latest()
+        return await self.insight_repo.get_latest()
 
-    def get_insights_history(self, limit: int = 10) -> List[Insight]:
+    async def get_insights_history(self, limit: int = 10) -> List[Insight]:
         """Get historical insights"""
-        return self.insight_repo.get_recent(limit)
+        return await self.insight_repo.get_recent(limit)
 
-    def get_recent_jobs(self, limit: int = 20) -> List[Job]:
+    async def get_recent_jobs(self, limit: int = 20) -> List[Job]:
         """Get recent jobs for dashboard"""
         if self.job_repo:
-            return self.job_repo.get_recent_jobs(limit)
+            return await self.job_repo.get_recent_jobs(limit)
         return []
 
-    def delete_insight(self, insight_id: str) -> bool:
+    async def delete_insight(self, insight_id: str) -> bool:
         """Delete an insight by ID"""
-        insight = self.insight_repo.get_by_id(insight_id)
+        insight = await self.insight_repo.get_by_id(insight_id)
         if insight:
-            self.insight_repo.delete(insight)
+            await self.insight_repo.delete(insight)
+            await self.insight_repo.commit()
             return True
         return False
@@ -1,4 +1,9 @@
-from typing import List, Optional
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncResult
+from app.core.export import EXPORT_BATCH_SIZE
 from app.repositories.inventory_repository import InventoryRepository
 from app.repositories.spool_repository import SpoolRepository
 from app.repositories.activity_log_repository import ActivityLogRepository
@@ -6,7 +11,12 @@ from app.services.status_service import StatusService
 from app.services.activity_log_service import ActivityLogService, ActionType, EntityType
 from app.models.inventory import Inventory
 from app.models.user import User
-from app.schemas.inventory import InventoryCreate, InventoryUpdate
+from app.schemas.inventory import (
+    InventoryBulkCreate,
+    InventoryCreate,
+    InventoryUpdate,
+    WeightBatchUpdate,
+)
 
 
 class InventoryService:
@@ -24,7 +34,7 @@ class InventoryService:
         self.status_service = status_service
         self.activity_log_service = activity_log_service
 
-    def _log_activity(
+    async def _log_activity(
         self,
         action_type: str,
         description: str,
@@ -34,7 +44,7 @@ class InventoryService:
     ) -> None:
         """Helper to log activity if service is available"""
         if self.activity_log_service:
-            self.activity_log_service.log(
+            await self.activity_log_service.log(
                 action_type=action_type,
                 entity_type=EntityType.INVENTORY,
                 entity_id=entity_id,
@@ -43,49 +53,55 @@ class InventoryService:
                 user=user,
             )
 
-    def get_all_inventory(self, skip: int = 0, limit: int = 100) -> List[Inventory]:
-        """Get all inventory items with pagination"""
-        return self.inventory_repo.get_all(skip, limit)
+    async def get_all_inventory(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Inventory], Optional[str]]:
+        """Get one page of inventory items and the cursor of the next page"""
+        return await self.inventory_repo.get_page(limit, cursor, skip)
 
-    def get_inventory_by_id(self, inventory_id: str) -> Inventory:
+    async def stream_export(self) -> AsyncResult:
+        """Stream all inventory items as flat rows, for CSV/NDJSON export"""
+        return await self.inventory_repo.stream_export(EXPORT_BATCH_SIZE)
+
+    async def get_inventory_by_id(self, inventory_id: str) -> Inventory:
         """Get an inventory item by ID"""
-        inventory = self.inventory_repo.get_by_id(inventory_id)
+        inventory = await self.inventory_repo.get_by_id(inventory_id)
         if not inventory:
             raise ValueError(f"Inventory item with id {inventory_id} not found")
         return inventory
 
-    def get_inventory_by_spool(self, spool_id: str) -> List[Inventory]:
+    async def get_inventory_by_spool(self, spool_id: str) -> List[Inventory]:
         """Get all inventory items for a specific spool type"""
-        return self.inventory_repo.find_by_spool_id(spool_id)
+        return await self.inventory_repo.find_by_spool_id(spool_id)
 
-    def get_in_use_inventory(self) -> List[Inventory]:
+    async def get_in_use_inventory(self) -> List[Inventory]:
         """Get all inventory items currently in use"""
-        return self.inventory_repo.find_in_use()
+        return await self.inventory_repo.find_in_use()
 
-    def add_to_inventory(
+    async def add_to_inventory(
         self, data: InventoryCreate, user: Optional[User] = None
     ) -> Inventory:
         """Add a spool to inventory"""
         # Verify spool exists
-        spool = self.spool_repo.get_by_id(data.spool_id)
+        spool = await self.spool_repo.get_by_id(data.spool_id)
         if not spool:
             raise ValueError(f"Spool type with id {data.spool_id} not found")
 
         # Find or create status
-        status = self.status_service.find_or_create(data.status_name)
+        status = await self.status_service.find_or_create(data.status_name)
 
         # Use spool's base_weight if weight not provided
         weight = data.weight if data.weight is not None else spool.base_weight
 
         new_inventory = Inventory(
-            spool_id=data.spool_id,
+            spool=spool,
             weight=weight,
             is_in_use=data.is_in_use,
-            status_id=status.id,
+            status=status,
             custom_properties=data.custom_properties,
         )
 
-        created = self.inventory_repo.create(new_inventory)
+        created = await self.inventory_repo.create(new_inventory)
 
         # Log the activity
         spool_desc = (
@@ -93,7 +109,7 @@ class InventoryService:
             if spool.color and spool.material
             else "spool"
         )
-        self._log_activity(
+        await self._log_activity(
             action_type=ActionType.INVENTORY_ADDED,
             description=f"Added {weight}g {spool_desc} ({spool.brand.name if spool.brand else 'Unknown'}) to inventory",
             entity_id=created.id,
@@ -105,14 +121,86 @@ class InventoryService:
             },
             user=user,
         )
+        await self.inventory_repo.commit()
 
         return created
 
-    def update_inventory(
+    async def add_bulk(
+        self, data: InventoryBulkCreate, user: Optional[User] = None
+    ) -> List[str]:
+        """
+        Add many units to inventory in one transaction.
+
+        All spools are checked with one query and each distinct status is
+        resolved once; the units and their activity log entries are then
+        written with multi-row INSERTs and committed together. Returns the
+        new inventory IDs in request order.
+        """
+        spool_ids = {item.spool_id for item in data.items}
+        spools = {
+            spool.id: spool for spool in await self.spool_repo.get_by_ids(spool_ids)
+        }
+        missing = sorted(spool_ids - spools.keys())
+        if missing:
+            raise ValueError(f"Spool types not found: {', '.join(missing)}")
+
+        # Sorted, so concurrent batches create new statuses in the same order
+        statuses = {}
+        for name in sorted({item.status_name for item in data.items}):
+            statuses[name] = await self.status_service.find_or_create(name)
+
+        now = datetime.utcnow()
+        rows, log_entries = [], []
+        for item in data.items:
+            spool = spools[item.spool_id]
+            weight = item.weight if item.weight is not None else spool.base_weight
+            spool_desc = (
+                f"{spool.color.name} {spool.material.name}"
+                if spool.color and spool.material
+                else "spool"
+            )
+            brand_name = spool.brand.name if spool.brand else "Unknown"
+            for _ in range(item.quantity):
+                inventory_id = str(uuid.uuid4())
+                rows.append(
+                    {
+                        "id": inventory_id,
+                        "spool_id": spool.id,
+                        "weight": weight,
+                        "is_in_use": item.is_in_use,
+                        "status_id": statuses[item.status_name].id,
+                        "custom_properties": item.custom_properties,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+                log_entries.append(
+                    {
+                        "action_type": ActionType.INVENTORY_ADDED,
+                        "entity_type": EntityType.INVENTORY,
+                        "entity_id": inventory_id,
+                        "description": f"Added {weight}g {spool_desc} ({brand_name}) to inventory",
+                        "metadata": {
+                            "spool_id": spool.id,
+                            "weight": weight,
+                            "status": item.status_name,
+                            "barcode": spool.barcode,
+                            "bulk": True,
+                        },
+                    }
+                )
+
+        await self.inventory_repo.insert_many(rows)
+        if self.activity_log_service:
+            await self.activity_log_service.log_many(log_entries, user=user)
+        await self.inventory_repo.commit()
+        return [row["id"] for row in rows]
+
+    async def update_inventory(
         self, inventory_id: str, data: InventoryUpdate, user: Optional[User] = None
     ) -> Inventory:
         """Update an inventory item"""
-        inventory = self.get_inventory_by_id(inventory_id)
+        inventory = await self.get_inventory_by_id(inventory_id)
 
         changes = {}
         old_weight = inventory.weight
@@ -125,13 +213,13 @@ class InventoryService:
             changes["is_in_use"] = {"old": inventory.is_in_use, "new": data.is_in_use}
             inventory.is_in_use = data.is_in_use
         if data.status_name is not None:
-            status = self.status_service.find_or_create(data.status_name)
+            status = await self.status_service.find_or_create(data.status_name)
             changes["status"] = {"old": old_status, "new": data.status_name}
-            inventory.status_id = status.id
+            inventory.status = status
         if data.custom_properties is not None:
             inventory.custom_properties = data.custom_properties
 
-        updated = self.inventory_repo.update(inventory)
+        updated = await self.inventory_repo.update(inventory)
 
         # Log the activity
         spool = inventory.spool
@@ -159,19 +247,100 @@ class InventoryService:
             description = f"Updated {spool_desc} inventory item"
             action_type = ActionType.INVENTORY_UPDATED
 
-        self._log_activity(
+        await self._log_activity(
             action_type=action_type,
             description=description,
             entity_id=inventory_id,
-            metadata=changes,
+            metadata={"spool_id": inventory.spool_id, **changes},
             user=user,
         )
+        await self.inventory_repo.commit()
 
         return updated
 
-    def delete_inventory(self, inventory_id: str, user: Optional[User] = None) -> None:
+    async def update_weights(
+        self, data: WeightBatchUpdate, user: Optional[User] = None
+    ) -> List[dict]:
+        """
+        Apply many scale readings with one UPDATE and log the changes.
+
+        Readings for unknown items fail without affecting the others; when
+        an item is read twice, the last reading wins. Returns one result per
+        reading, in request order.
+        """
+        weights = {reading.id: reading.weight for reading in data.readings}
+        updated = {
+            row["id"]: row for row in await self.inventory_repo.update_weights(weights)
+        }
+
+        if self.activity_log_service:
+            changed = [
+                row for row in updated.values() if row["weight"] != row["old_weight"]
+            ]
+            spools = {
+                spool.id: spool
+                for spool in await self.spool_repo.get_by_ids(
+                    {row["spool_id"] for row in changed}
+                )
+            }
+            log_entries = []
+            for row in changed:
+                spool = spools.get(row["spool_id"])
+                spool_desc = (
+                    f"{spool.color.name} {spool.material.name}"
+                    if spool and spool.color and spool.material
+                    else "spool"
+                )
+                old_weight, weight = row["old_weight"], row["weight"]
+                if weight < old_weight:
+                    action_type = ActionType.WEIGHT_UPDATED
+                    description = f"Used {old_weight - weight:.1f}g of {spool_desc} (remaining: {weight}g)"
+                else:
+                    action_type = ActionType.INVENTORY_UPDATED
+                    description = (
+                        f"Updated {spool_desc} weight from {old_weight}g to {weight}g"
+                    )
+                log_entries.append(
+                    {
+                        "action_type": action_type,
+                        "entity_type": EntityType.INVENTORY,
+                        "entity_id": row["id"],
+                        "description": description,
+                        "metadata": {
+                            "spool_id": row["spool_id"],
+                            "weight": {"old": old_weight, "new": weight},
+                        },
+                    }
+                )
+            await self.activity_log_service.log_many(log_entries, user=user)
+        await self.inventory_repo.commit()
+
+        last_index = {reading.id: i for i, reading in enumerate(data.readings)}
+        results = []
+        for index, reading in enumerate(data.readings):
+            row = updated.get(reading.id)
+            if row is None:
+                error = f"Inventory item with id {reading.id} not found"
+                results.append({"id": reading.id, "updated": False, "error": error})
+            elif last_index[reading.id] != index:
+                error = "Superseded by a later reading of the same item"
+                results.append({"id": reading.id, "updated": False, "error": error})
+            else:
+                results.append(
+                    {
+                        "id": reading.id,
+                        "updated": True,
+                        "old_weight": row["old_weight"],
+                        "weight": row["weight"],
+                    }
+                )
+        return results
+
+    async def delete_inventory(
+        self, inventory_id: str, user: Optional[User] = None
+    ) -> None:
         """Remove an inventory item"""
-        inventory = self.get_inventory_by_id(inventory_id)
+        inventory = await self.get_inventory_by_id(inventory_id)
 
         # Capture info before deletion
         spool = inventory.spool
@@ -182,10 +351,10 @@ class InventoryService:
         )
         weight = inventory.weight
 
-        self.inventory_repo.delete(inventory)
+        await self.inventory_repo.delete(inventory)
 
         # Log the activity
-        self._log_activity(
+        await self._log_activity(
             action_type=ActionType.INVENTORY_DELETED,
             description=f"Removed {spool_desc} ({weight}g) from inventory",
             entity_id=inventory_id,
@@ -196,7 +365,42 @@ class InventoryService:
             },
             user=user,
         )
+        await self.inventory_repo.commit()
+
+    async def scan(self, barcode: str) -> dict:
+        """
+        Look up a scanned barcode: the spool, its inventory units and their
+        aggregates, from a single query.
+
+        Raises:
+            ValueError: If no spool has this barcode
+        """
+        found = await self.spool_repo.find_with_inventory(barcode)
+        if not found:
+            raise ValueError(f"Spool with barcode '{barcode}' not found")
+        spool, inventory = found
+
+        status_counts = Counter(item.status.name for item in inventory)
+        return {
+            "spool": spool,
+            "inventory": inventory,
+            "count": len(inventory),
+            "in_use_count": sum(1 for item in inventory if item.is_in_use),
+            "total_weight": sum(item.weight for item in inventory),
+            "status_counts": dict(status_counts),
+        }
+
+    async def get_summary(
+        self,
+        material: Optional[str] = None,
+        brand: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[dict]:
+        """Units, weight, in-use and low-stock counts per spool type"""
+        return await self.inventory_repo.get_summary_by_spool(
+            material=material, brand=brand, status=status, low_stock_ratio=0.2
+        )
 
-    def count_by_spool(self, spool_id: str) -> int:
+    async def count_by_spool(self, spool_id: str) -> int:
         """Count how many units of a spool type are in inventory"""
-        return self.inventory_repo.count_by_spool_id(spool_id)
+        return await self.inventory_repo.count_by_spool_id(spool_id)
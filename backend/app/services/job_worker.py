@@ -2,73 +2,146 @@
 Job Worker Service
 
 Background worker that processes jobs from the queue.
+
+The worker sleeps until JobRepository.create announces a new job with a
+Postgres NOTIFY, which it receives on a dedicated LISTEN connection. Polling
+only remains as a slow fallback for notifications that get lost (e.g. while
+the LISTEN connection is reconnecting).
+
+Up to `concurrency` jobs run at once, each with its own session, so jobs
+that mostly wait on I/O (LLM calls) overlap. Per-type limits keep one slow
+job type from taking every slot: a type at its limit is simply not claimed
+until one of its jobs finishes.
+
+While jobs run, a maintenance task refreshes their heartbeat and requeues
+jobs whose heartbeat expired because their worker died. On shutdown the
+worker stops claiming and lets in-flight jobs finish within a deadline.
 """
 
 import asyncio
+import json
 import logging
-from datetime import datetime
-from typing import Optional
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 
-from sqlalchemy.orm import Session
-from app.database import SessionLocal
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.database import AsyncSessionLocal
 from app.models.job import Job, JobStatus, JobType
-from app.repositories.job_repository import JobRepository
+from app.repositories.job_repository import JOB_NOTIFY_CHANNEL, JobRepository
 from app.repositories.activity_log_repository import ActivityLogRepository
 from app.repositories.insight_repository import InsightRepository
 from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.brand_repository import BrandRepository
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.color_repository import ColorRepository
+from app.repositories.material_repository import MaterialRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.trade_name_repository import TradeNameRepository
+from app.repositories.user_repository import UserRepository
+from app.services.activity_log_service import ActivityLogService
 from app.services.ai_insights_service import AIInsightsService
+from app.services.spool_import_service import SpoolImportService
 
 logger = logging.getLogger(__name__)
 
 
+def retry_backoff(retry_count: int) -> timedelta:
+    """
+    Delay before retry attempt `retry_count` (1-based).
+
+    Exponential (base * 2^(retry_count-1), capped) with "equal jitter": half
+    the delay is fixed, the other half random, so jobs that failed together
+    (e.g. during an LLM outage) do not all retry at the same moment.
+    """
+    delay = min(
+        settings.JOB_RETRY_BACKOFF_MAX_SECONDS,
+        settings.JOB_RETRY_BACKOFF_BASE_SECONDS * 2 ** max(retry_count - 1, 0),
+    )
+    return timedelta(seconds=delay / 2 + random.uniform(0, delay / 2))
+
+
 class JobWorker:
     """Background worker for processing jobs"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        poll_interval: Optional[float] = None,
+        listen: bool = True,
+        concurrency: Optional[int] = None,
+        type_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else settings.JOB_POLL_INTERVAL_SECONDS
+        )
+        self.listen = listen
+        self.concurrency = concurrency or settings.JOB_CONCURRENCY
+        self.type_limits = (
+            type_limits
+            if type_limits is not None
+            else dict(settings.JOB_TYPE_CONCURRENCY)
+        )
+        self.heartbeat_interval = settings.JOB_HEARTBEAT_INTERVAL_SECONDS
+        self.visibility_timeout = settings.JOB_VISIBILITY_TIMEOUT_SECONDS
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._in_flight: Counter = Counter()
+        # Running job tasks -> id of the job they process
+        self._job_tasks: Dict[asyncio.Task, str] = {}
 
-    def _get_db(self) -> Session:
+    def _get_db(self) -> AsyncSession:
         """Get a new database session"""
-        return SessionLocal()
+        return AsyncSessionLocal()
 
-    async def process_job(self, job: Job, db: Session) -> None:
+    async def process_job(self, job: Job, db: AsyncSession) -> None:
         """
-        Process a single job.
+        Process a single job that was claimed with JobRepository.claim_next.
 
         Args:
-            job: The job to process
+            job: The claimed job (already marked as processing)
             db: Database session
         """
         job_repo = JobRepository(db)
 
-        # Mark as processing
-        job.status = JobStatus.PROCESSING
-        job.started_at = datetime.utcnow()
-        job_repo.update(job)
-
         try:
             if job.job_type == JobType.GENERATE_INSIGHTS:
                 await self._process_insights_job(job, db)
+            elif job.job_type == JobType.IMPORT_SPOOLS:
+                await self._process_import_job(job, db)
             else:
                 raise ValueError(f"Unknown job type: {job.job_type}")
 
             # Mark as completed
             job.status = JobStatus.COMPLETED
             job.completed_at = datetime.utcnow()
-            job_repo.update(job)
+            await job_repo.update(job)
+            await job_repo.commit()
             logger.info(f"Job {job.id} completed successfully")
 
         except Exception as e:
             logger.error(f"Job {job.id} failed: {str(e)}")
+            # Drop the handler's uncommitted work; a failed statement also
+            # leaves the session unusable until it is rolled back
+            await db.rollback()
+            await db.refresh(job)
             job.retry_count += 1
 
             if job.can_retry():
-                # Reset to ready for retry
+                # Reset to ready for retry, after a backoff
                 job.status = JobStatus.READY
+                job.run_at = datetime.utcnow() + retry_backoff(job.retry_count)
                 job.error_message = f"Retry {job.retry_count}: {str(e)}"
                 logger.info(
-                    f"Job {job.id} will be retried (attempt {job.retry_count}/{job.max_retries})"
+                    f"Job {job.id} will be retried at {job.run_at} (attempt {job.retry_count}/{job.max_retries})"
                 )
             else:
                 # Mark as failed
@@ -79,9 +152,10 @@ class JobWorker:
                     f"Job {job.id} failed permanently after {job.retry_count} retries"
                 )
 
-            job_repo.update(job)
+            await job_repo.update(job)
+            await job_repo.commit()
 
-    async def _process_insights_job(self, job: Job, db: Session) -> None:
+    async def _process_insights_job(self, job: Job, db: AsyncSession) -> None:
         """Process an insights generation job"""
         activity_log_repo = ActivityLogRepository(db)
         insight_repo = InsightRepository(db)
@@ -98,33 +172,149 @@ class JobWorker:
         insight = await ai_service.generate_insight(
             job_id=job.id,
             generated_by="scheduled",
+            raise_on_error=True,
         )
 
         job.result = f"Generated insight: {insight.id}"
 
+    async def _process_import_job(self, job: Job, db: AsyncSession) -> None:
+        """Process a spool catalog CSV import job"""
+        import_service = SpoolImportService(
+            spool_repo=SpoolRepository(db),
+            color_repo=ColorRepository(db),
+            brand_repo=BrandRepository(db),
+            material_repo=MaterialRepository(db),
+            trade_name_repo=TradeNameRepository(db),
+            category_repo=CategoryRepository(db),
+            job_repo=JobRepository(db),
+            user_repo=UserRepository(db),
+            activity_log_service=ActivityLogService(ActivityLogRepository(db)),
+        )
+
+        report = await import_service.run_import(job)
+
+        job.result = json.dumps(report)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        """asyncpg notification callback: a job was enqueued"""
+        self._wakeup.set()
+
+    async def _listen(self) -> None:
+        """Keep a dedicated LISTEN connection open, reconnecting on failure"""
+        while self._running:
+            conn = None
+            try:
+                conn = await asyncpg.connect(settings.DATABASE_URL)
+                closed = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: closed.set())
+                await conn.add_listener(JOB_NOTIFY_CHANNEL, self._on_notify)
+                logger.info(f"Listening for jobs on channel '{JOB_NOTIFY_CHANNEL}'")
+
+                # Jobs enqueued while we were not listening sent no wakeup
+                self._wakeup.set()
+                await closed.wait()
+                logger.warning("Job notification connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job listener error: {str(e)}")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+            await asyncio.sleep(5)
+
+    async def _wait_for_jobs(self, next_run_at: Optional[datetime] = None) -> None:
+        """
+        Sleep until a job is announced, the next scheduled job is due, or
+        the fallback poll interval passes.
+        """
+        if not self._running:
+            return
+        timeout = self.poll_interval
+        if next_run_at is not None:
+            due_in = (next_run_at - datetime.utcnow()).total_seconds()
+            timeout = min(timeout, max(due_in, 0))
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _saturated_types(self) -> List[str]:
+        """Job types that have reached their concurrency limit"""
+        return [
+            job_type
+            for job_type, limit in self.type_limits.items()
+            if self._in_flight[job_type] >= limit
+        ]
+
+    async def _run_job(self, job: Job, db: AsyncSession) -> None:
+        """Process a claimed job in its own task, then free its slot"""
+        try:
+            logger.info(f"Processing job {job.id} (type: {job.job_type})")
+            await self.process_job(job, db)
+        except Exception as e:
+            logger.error(f"Job {job.id} crashed the worker task: {str(e)}")
+        finally:
+            await db.close()
+            self._in_flight[job.job_type] -= 1
+            self._slots.release()
+            # A freed slot may unblock a job type that was at its limit
+            self._wakeup.set()
+
     async def _worker_loop(self) -> None:
-        """Main worker loop that polls for jobs"""
-        logger.info("Job worker started")
+        """Main worker loop: fill free slots with jobs, wait when idle"""
+        logger.info(f"Job worker started ({self.concurrency} slots)")
 
         while self._running:
+            await self._slots.acquire()
+            if not self._running:
+                self._slots.release()
+                break
             db = self._get_db()
             try:
+                # Clear before claiming: a job enqueued after this point sets
+                # the event again, so the wait below cannot miss it
+                self._wakeup.clear()
                 job_repo = JobRepository(db)
-                ready_jobs = job_repo.get_ready_jobs(limit=1)
-
-                if ready_jobs:
-                    job = ready_jobs[0]
-                    logger.info(f"Processing job {job.id} (type: {job.job_type})")
-                    await self.process_job(job, db)
-                else:
-                    # No jobs, wait before polling again
-                    await asyncio.sleep(5)
-
+                saturated = self._saturated_types()
+                job = await job_repo.claim_next(exclude_types=saturated)
+                next_run_at = None
+                if job is None:
+                    next_run_at = await job_repo.next_run_at(exclude_types=saturated)
             except Exception as e:
                 logger.error(f"Worker loop error: {str(e)}")
+                await db.close()
+                self._slots.release()
                 await asyncio.sleep(10)
-            finally:
-                db.close()
+                continue
+
+            if job:
+                self._in_flight[job.job_type] += 1
+                task = asyncio.create_task(self._run_job(job, db))
+                self._job_tasks[task] = job.id
+                task.add_done_callback(self._job_tasks.pop)
+            else:
+                await db.close()
+                self._slots.release()
+                await self._wait_for_jobs(next_run_at)
+
+    async def _maintenance_loop(self) -> None:
+        """Heartbeat in-flight jobs and requeue jobs whose worker died"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                async with self._get_db() as db:
+                    job_repo = JobRepository(db)
+                    if self._job_tasks:
+                        await job_repo.heartbeat(list(self._job_tasks.values()))
+                    reaped = await job_repo.requeue_expired(self.visibility_timeout)
+                    if reaped:
+                        logger.warning(f"Requeued {len(reaped)} expired jobs: {reaped}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job maintenance error: {str(e)}")
 
     def start(self) -> None:
         """Start the worker in the background"""
@@ -133,15 +323,70 @@ class JobWorker:
             return
 
         self._running = True
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._in_flight.clear()
+        if self.listen:
+            self._listener_task = asyncio.create_task(self._listen())
+        self._maintenance_task = asyncio.create_task(self._maintenance_loop())
         self._task = asyncio.create_task(self._worker_loop())
         logger.info("Job worker scheduled to start")
 
-    def stop(self) -> None:
-        """Stop the worker"""
+    async def _cancel(self, task: Optional[asyncio.Task]) -> None:
+        """Cancel a background task and wait until it has finished"""
+        if task:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the worker, draining in-flight jobs first.
+
+        Claiming stops immediately. Running jobs get `timeout` seconds
+        (default JOB_SHUTDOWN_TIMEOUT_SECONDS) to finish; any still running
+        after that are cancelled and put back in the queue.
+        """
+        if timeout is None:
+            timeout = settings.JOB_SHUTDOWN_TIMEOUT_SECONDS
+
+        # The loop exits on its own once it sees _running is False. It is not
+        # cancelled right away, so a claim already under way can finish (its
+        # job is then drained like the others) instead of being cut mid-query
         self._running = False
-        if self._task:
-            self._task.cancel()
-            self._task = None
+        self._wakeup.set()
+        await self._cancel(self._listener_task)
+        self._listener_task = None
+
+        if self._job_tasks:
+            logger.info(f"Draining {len(self._job_tasks)} in-flight jobs")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            pending = [t for t in (self._task, *self._job_tasks) if t and not t.done()]
+            remaining = deadline - loop.time()
+            if not pending or remaining <= 0:
+                break
+            await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+
+        if self._job_tasks:
+            interrupted = list(self._job_tasks.values())
+            for task in list(self._job_tasks):
+                await self._cancel(task)
+            try:
+                async with self._get_db() as db:
+                    await JobRepository(db).release(interrupted)
+                logger.warning(f"Requeued {len(interrupted)} unfinished jobs")
+            except Exception as e:
+                # The heartbeat reaper will requeue them instead
+                logger.error(f"Failed to requeue unfinished jobs: {str(e)}")
+
+        # Only still running if it was waiting for a slot or an error backoff
+        await self._cancel(self._task)
+        self._task = None
+        await self._cancel(self._maintenance_task)
+        self._maintenance_task = None
         logger.info("Job worker stopped")
 
 
@@ -0,0 +1,107 @@
+"""
+Leader Election Service
+
+Elects one leader among all processes sharing the database using a
+Postgres session-level advisory lock.
+
+The lock is held on a dedicated connection for as long as the process is
+leader. If the leader process dies, or its connection does, Postgres
+releases the lock and the next candidate to retry takes over. The leader
+pings its connection every LEADER_RETRY_INTERVAL_SECONDS and steps down if
+a ping fails or goes unanswered for that long.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+import asyncpg
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    """Run callbacks when this process gains or loses leadership"""
+
+    def __init__(
+        self,
+        lock_id: int,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]],
+        retry_interval: Optional[float] = None,
+        dsn: Optional[str] = None,
+    ):
+        self.lock_id = lock_id
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.retry_interval = (
+            retry_interval
+            if retry_interval is not None
+            else settings.LEADER_RETRY_INTERVAL_SECONDS
+        )
+        self.dsn = dsn or settings.DATABASE_URL
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+
+    async def _hold_leadership(self, conn: asyncpg.Connection) -> None:
+        """Stay leader until the lock connection stops answering"""
+        self.is_leader = True
+        logger.info(f"Elected leader (advisory lock {self.lock_id})")
+        try:
+            await self.on_elected()
+            while True:
+                await asyncio.sleep(self.retry_interval)
+                # Raises once the connection (and with it the lock) is gone.
+                # A half-open connection never answers at all, while Postgres
+                # may already have dropped the session and its lock and
+                # another process may be leading: a ping that times out ends
+                # leadership as well
+                await asyncio.wait_for(
+                    conn.fetchval("SELECT 1"), timeout=self.retry_interval
+                )
+        finally:
+            self.is_leader = False
+            logger.info(f"Stepped down as leader (advisory lock {self.lock_id})")
+            await self.on_demoted()
+
+    async def _run(self) -> None:
+        """Campaign for leadership until cancelled"""
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(self.dsn)
+                acquired = await conn.fetchval(
+                    "SELECT pg_try_advisory_lock($1)", self.lock_id
+                )
+                if acquired:
+                    await self._hold_leadership(conn)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Leader election error: {str(e)}")
+            finally:
+                # Closing the session releases the advisory lock; a connection
+                # that does not answer is aborted after the timeout
+                if conn is not None and not conn.is_closed():
+                    try:
+                        await conn.close(timeout=self.retry_interval)
+                    except Exception as e:
+                        logger.warning(f"Leader lock connection aborted: {str(e)}")
+
+            await asyncio.sleep(self.retry_interval)
+
+    def start(self) -> None:
+        """Start campaigning in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop campaigning and give up leadership if held"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
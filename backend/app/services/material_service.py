@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Tuple
 from app.repositories.material_repository import MaterialRepository
 from app.models.material import Material
 
@@ -9,28 +9,32 @@ class MaterialService:
     def __init__(self, material_repo: MaterialRepository):
         self.material_repo = material_repo
 
-    def get_all_materials(self, skip: int = 0, limit: int = 100) -> List[Material]:
-        """Get all materials with pagination"""
-        return self.material_repo.get_all(skip, limit)
+    async def get_all_materials(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Material], Optional[str]]:
+        """Get one page of materials and the cursor of the next page"""
+        return await self.material_repo.get_page(limit, cursor, skip)
 
-    def get_material_by_id(self, material_id: str) -> Material:
+    async def get_material_by_id(self, material_id: str) -> Material:
         """Get a material by ID"""
-        material = self.material_repo.get_by_id(material_id)
+        material = await self.material_repo.get_by_id(material_id)
         if not material:
             raise ValueError(f"Material with id {material_id} not found")
         return material
 
-    def create_material(self, name: str) -> Material:
+    async def create_material(self, name: str) -> Material:
         """Create a new material"""
         # Check if material already exists
-        existing = self.material_repo.find_by_name(name)
+        existing = await self.material_repo.find_by_name(name)
         if existing:
             raise ValueError(f"Material '{name}' already exists")
 
         new_material = Material(name=name)
-        return self.material_repo.create(new_material)
+        created = await self.material_repo.create(new_material)
+        await self.material_repo.commit()
+        return created
 
-    def find_or_create(
+    async def find_or_create(
         self,
         name: str,
     ) -> Material:
@@ -43,4 +47,4 @@ class MaterialService:
         Returns:
             Material object (existing or newly created)
         """
-        return self.material_repo.find_or_create(name)
+        return await self.material_repo.find_or_create(name)
@@ -2,47 +2,64 @@
 Scheduler Service
 
 APScheduler-based scheduler for periodic tasks.
+
+Every API process campaigns for leadership, but only the elected leader
+runs the scheduler, so periodic jobs are enqueued once rather than once per
+process. Scheduled jobs also carry a dedup key, so a leader change or
+restart around the trigger time cannot enqueue the same run twice.
 """
 
 import logging
+from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal
 from app.repositories.job_repository import JobRepository
-from app.models.job import Job, JobStatus, JobType
+from app.models.job import Job, JobPriority, JobStatus, JobType
+from app.services.leader_election import LeaderElection
 
 logger = logging.getLogger(__name__)
 
+# Advisory lock id shared by all processes competing to run the scheduler
+SCHEDULER_LOCK_ID = 727001
+
 # Global scheduler instance
 scheduler = AsyncIOScheduler()
 
 
-def create_daily_insights_job() -> None:
+async def create_daily_insights_job() -> None:
     """
     Create a job for daily insights generation.
     This is called by the scheduler at 6 AM daily.
     """
     logger.info("Creating scheduled daily insights job")
 
-    db = SessionLocal()
-    try:
-        job_repo = JobRepository(db)
-        job = Job(
-            job_type=JobType.GENERATE_INSIGHTS,
-            status=JobStatus.READY,
-        )
-        job_repo.create(job)
-        logger.info(f"Created daily insights job: {job.id}")
-    except Exception as e:
-        logger.error(f"Failed to create daily insights job: {str(e)}")
-    finally:
-        db.close()
+    async with AsyncSessionLocal() as db:
+        try:
+            job_repo = JobRepository(db)
+            job = Job(
+                job_type=JobType.GENERATE_INSIGHTS,
+                status=JobStatus.READY,
+                # Background batch work; on-demand jobs go first
+                priority=JobPriority.LOW,
+                # UTC like every other timestamp, so nodes in different
+                # timezones agree on the key
+                dedup_key=f"daily_insights:{datetime.utcnow().date().isoformat()}",
+            )
+            created = await job_repo.create_unique(job)
+            await job_repo.commit()
+            if created:
+                logger.info(f"Created daily insights job: {created.id}")
+            else:
+                logger.info(f"Daily insights job already exists: {job.dedup_key}")
+        except Exception as e:
+            logger.error(f"Failed to create daily insights job: {str(e)}")
 
 
-def setup_scheduler() -> None:
+async def start_scheduler() -> None:
     """
-    Configure and start the scheduler.
+    Configure and start the scheduler (called once elected leader).
     Schedules daily insights generation at 6 AM.
     """
     # Schedule daily insights job at 6:00 AM
@@ -54,12 +71,33 @@ def setup_scheduler() -> None:
         replace_existing=True,
     )
 
-    scheduler.start()
+    if not scheduler.running:
+        scheduler.start()
     logger.info("Scheduler started - Daily insights job scheduled for 6:00 AM")
 
 
-def shutdown_scheduler() -> None:
-    """Shutdown the scheduler gracefully"""
+async def stop_scheduler() -> None:
+    """Stop the scheduler (called when leadership is lost)"""
     if scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("Scheduler shutdown")
+
+
+# Global election deciding which process runs the scheduler
+scheduler_election = LeaderElection(
+    lock_id=SCHEDULER_LOCK_ID,
+    on_elected=start_scheduler,
+    on_demoted=stop_scheduler,
+)
+
+
+def setup_scheduler() -> None:
+    """Campaign for scheduler leadership in the background"""
+    scheduler_election.start()
+    logger.info("Scheduler leader election started")
+
+
+async def shutdown_scheduler() -> None:
+    """Give up scheduler leadership and shutdown the scheduler gracefully"""
+    await scheduler_election.stop()
+    await stop_scheduler()
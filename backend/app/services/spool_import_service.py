@@ -0,0 +1,393 @@
+"""
+Spool Import Service
+
+Bulk catalog onboarding from a supplier CSV, run as a background job.
+
+The API streams the upload into IMPORT_DIR and enqueues an import_spools
+job. The worker reads the file in batches of IMPORT_BATCH_SIZE rows, parsed
+in a thread so the event loop stays responsive. Per batch, each lookup
+table gets one find-or-create upsert for all of the batch's names, the
+spools go in with one INSERT ... ON CONFLICT (barcode), and the batch is
+committed together with its activity log entries. Rows that cannot be
+imported end up in a per-row report stored as the job result.
+
+An import is not atomic: each batch commits on its own, so when a job fails
+midway the batches before the failure stay imported. The failed job's
+result then holds the report up to that point, with the number of
+committed rows and the error.
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import os
+import uuid
+from enum import Enum
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from app.core.config import settings
+from app.models.job import Job, JobStatus, JobType
+from app.models.user import User
+from app.repositories.brand_repository import BrandRepository
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.color_repository import ColorRepository
+from app.repositories.job_repository import JobRepository
+from app.repositories.material_repository import MaterialRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.trade_name_repository import TradeNameRepository
+from app.repositories.user_repository import UserRepository
+from app.services.activity_log_service import ActivityLogService, ActionType, EntityType
+from app.schemas.spool import SpoolCreate, generate_barcode
+
+logger = logging.getLogger(__name__)
+
+# Rows per upsert round (lookups, spools, activity logs) and commit
+IMPORT_BATCH_SIZE = 1000
+# The report lists at most this many problem rows; counts are always exact
+MAX_REPORTED_ROWS = 1000
+REQUIRED_COLUMNS = {"base_weight", "color_name", "brand_name", "material_name"}
+
+
+class OnConflict(str, Enum):
+    """What to do with rows whose barcode is already in the catalog"""
+
+    SKIP = "skip"
+    UPDATE = "update"
+
+
+class SpoolImportService:
+    """Imports spool types from CSV files in background jobs"""
+
+    def __init__(
+        self,
+        spool_repo: SpoolRepository,
+        color_repo: ColorRepository,
+        brand_repo: BrandRepository,
+        material_repo: MaterialRepository,
+        trade_name_repo: TradeNameRepository,
+        category_repo: CategoryRepository,
+        job_repo: JobRepository,
+        user_repo: UserRepository,
+        activity_log_service: Optional[ActivityLogService] = None,
+    ):
+        self.spool_repo = spool_repo
+        self.color_repo = color_repo
+        self.brand_repo = brand_repo
+        self.material_repo = material_repo
+        self.trade_name_repo = trade_name_repo
+        self.category_repo = category_repo
+        self.job_repo = job_repo
+        self.user_repo = user_repo
+        self.activity_log_service = activity_log_service
+
+    async def start_import(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        on_conflict: OnConflict = OnConflict.SKIP,
+        user: Optional[User] = None,
+    ) -> Job:
+        """
+        Save an uploaded CSV to IMPORT_DIR and enqueue its import job.
+
+        The upload is written chunk by chunk as it arrives, so its size
+        does not matter for memory; it is capped at IMPORT_MAX_BYTES. The
+        disk writes run in a worker thread, off the event loop.
+
+        Raises:
+            ValueError: If the upload is empty or too large
+        """
+        await asyncio.to_thread(os.makedirs, settings.IMPORT_DIR, exist_ok=True)
+        path = os.path.join(settings.IMPORT_DIR, f"{uuid.uuid4()}.csv")
+        size = 0
+        try:
+            file = await asyncio.to_thread(open, path, "wb")
+            try:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > settings.IMPORT_MAX_BYTES:
+                        raise ValueError(
+                            f"File is larger than {settings.IMPORT_MAX_BYTES} bytes"
+                        )
+                    await asyncio.to_thread(file.write, chunk)
+            finally:
+                await asyncio.to_thread(file.close)
+            if size == 0:
+                raise ValueError("The uploaded file is empty")
+
+            job = Job(
+                job_type=JobType.IMPORT_SPOOLS,
+                status=JobStatus.READY,
+                # A rerun would report the rows of committed batches as
+                # already existing; failed imports are re-uploaded instead
+                max_retries=0,
+                payload=json.dumps(
+                    {
+                        "path": path,
+                        "filename": filename,
+                        "on_conflict": on_conflict.value,
+                        "user_id": user.id if user else None,
+                    }
+                ),
+            )
+            created = await self.job_repo.create(job)
+            await self.job_repo.commit()
+            return created
+        except BaseException:
+            _remove(path)
+            raise
+
+    async def get_import_job(self, job_id: str) -> Job:
+        """Get an import job by ID"""
+        job = await self.job_repo.get_by_id(job_id)
+        if not job or job.job_type != JobType.IMPORT_SPOOLS:
+            raise ValueError(f"Import job with id {job_id} not found")
+        return job
+
+    async def run_import(self, job: Job) -> dict:
+        """
+        Import the CSV file of an import_spools job, then delete it.
+
+        Returns the report: row counts and the rows that were skipped or
+        failed, with their CSV line number, barcode and reason. If the
+        import fails, batches committed so far stay imported; the report up
+        to that point (committed_rows, error) is saved as the job's result
+        before the exception propagates.
+
+        Raises:
+            ValueError: If the file lacks required columns
+        """
+        payload = json.loads(job.payload)
+        update_existing = payload["on_conflict"] == OnConflict.UPDATE.value
+        user = None
+        if payload.get("user_id"):
+            user = await self.user_repo.get_by_id(payload["user_id"])
+
+        report = {
+            "filename": payload["filename"],
+            "rows": 0,
+            "created": 0,
+            "updated": 0,
+            "skipped": 0,
+            "failed": 0,
+            "committed_rows": 0,
+            "problems": [],
+        }
+        try:
+            with open(payload["path"], newline="", encoding="utf-8-sig") as file:
+                reader = csv.DictReader(file)
+                # Reading and validating rows is blocking, CPU-bound work; it
+                # runs in a thread so a large file does not stall the worker's
+                # event loop (heartbeats, LISTEN, other jobs)
+                fieldnames = await asyncio.to_thread(lambda: reader.fieldnames)
+                missing = REQUIRED_COLUMNS - set(fieldnames or [])
+                if missing:
+                    raise ValueError(
+                        f"Missing CSV columns: {', '.join(sorted(missing))}"
+                    )
+
+                seen_barcodes: Set[str] = set()
+                while True:
+                    batch = await asyncio.to_thread(
+                        _read_batch, reader, seen_barcodes, report
+                    )
+                    if not batch:
+                        break
+                    await self._import_batch(
+                        batch, update_existing, job.id, user, report
+                    )
+        except Exception as e:
+            await self._save_partial_report(job, report, e)
+            raise
+        finally:
+            _remove(payload["path"])
+        return report
+
+    async def _save_partial_report(
+        self, job: Job, report: dict, error: Exception
+    ) -> None:
+        """Store the report of a failed import as the job's result"""
+        report["error"] = str(error)
+        try:
+            # Drop the failed batch; earlier batches are already committed
+            await self.job_repo.rollback()
+            job.result = json.dumps(report)
+            await self.job_repo.update(job)
+            await self.job_repo.commit()
+        except Exception as e:
+            logger.error(f"Could not save the report of import job {job.id}: {str(e)}")
+
+    async def _import_batch(
+        self,
+        batch: List[Tuple[int, SpoolCreate]],
+        update_existing: bool,
+        job_id: str,
+        user: Optional[User],
+        report: dict,
+    ) -> None:
+        """
+        Upsert one batch of validated rows and commit it. Its outcomes are
+        added to `report` only once committed.
+        """
+        spools = [spool_data for _, spool_data in batch]
+        # Lookups in LOOKUP_LOCK_ORDER, like SpoolService.create_spool
+        color_ids = await self.color_repo.upsert_names(
+            _names(spools, "color_name", lambda s: {"hex_code": s.color_hex_code})
+        )
+        brand_ids = await self.brand_repo.upsert_names(_names(spools, "brand_name"))
+        material_ids = await self.material_repo.upsert_names(
+            _names(spools, "material_name")
+        )
+        trade_name_ids = await self.trade_name_repo.upsert_names(
+            _names(spools, "trade_name")
+        )
+        category_ids = await self.category_repo.upsert_names(
+            _names(spools, "category_name")
+        )
+
+        rows = [
+            {
+                "barcode": s.barcode,
+                "base_weight": s.base_weight,
+                "is_box": s.is_box,
+                "thickness": s.thickness,
+                "spool_return": s.spool_return,
+                "color_id": color_ids[s.color_name],
+                "brand_id": brand_ids[s.brand_name],
+                "material_id": material_ids[s.material_name],
+                "trade_name_id": (
+                    trade_name_ids[s.trade_name] if s.trade_name else None
+                ),
+                "category_id": (
+                    category_ids[s.category_name] if s.category_name else None
+                ),
+            }
+            for s in spools
+        ]
+        # Locks are held until the batch commits; take them in barcode order
+        # like the lookups (sorted by name), so concurrent imports of
+        # overlapping files wait for each other instead of deadlocking
+        rows.sort(key=lambda row: row["barcode"])
+        written = {
+            barcode: (spool_id, inserted)
+            for spool_id, barcode, inserted in await self.spool_repo.upsert_many(
+                rows, update_existing=update_existing
+            )
+        }
+
+        outcome = {"created": 0, "updated": 0, "skipped": 0, "problems": []}
+        log_entries = []
+        for line, s in batch:
+            if s.barcode not in written:
+                reason = f"Spool with barcode '{s.barcode}' already exists"
+                _report(outcome, "skipped", line, s.barcode, reason)
+                continue
+            spool_id, inserted = written[s.barcode]
+            outcome["created" if inserted else "updated"] += 1
+            spool_desc = (
+                f"{s.color_name} {s.material_name} ({s.brand_name}) - {s.base_weight}g"
+            )
+            log_entries.append(
+                {
+                    "action_type": (
+                        ActionType.SPOOL_CREATED
+                        if inserted
+                        else ActionType.SPOOL_UPDATED
+                    ),
+                    "entity_type": EntityType.SPOOL,
+                    "entity_id": spool_id,
+                    "description": (
+                        f"Created new spool type: {spool_desc}"
+                        if inserted
+                        else f"Updated spool type from import: {spool_desc}"
+                    ),
+                    "metadata": {
+                        "barcode": s.barcode,
+                        "color": s.color_name,
+                        "material": s.material_name,
+                        "brand": s.brand_name,
+                        "base_weight": s.base_weight,
+                        "import_job_id": job_id,
+                    },
+                }
+            )
+        if self.activity_log_service:
+            await self.activity_log_service.log_many(log_entries, user=user)
+        await self.spool_repo.commit()
+
+        for key in ("created", "updated", "skipped"):
+            report[key] += outcome[key]
+        report["committed_rows"] += len(batch)
+        free = MAX_REPORTED_ROWS - len(report["problems"])
+        report["problems"].extend(outcome["problems"][:free])
+
+
+def _read_batch(
+    reader: csv.DictReader, seen_barcodes: Set[str], report: dict
+) -> List[Tuple[int, SpoolCreate]]:
+    """
+    Read and validate rows until IMPORT_BATCH_SIZE are valid or the file
+    ends; invalid and duplicate rows go straight to the report. Blocking:
+    run_import calls it in a thread.
+    """
+    batch: List[Tuple[int, SpoolCreate]] = []
+    for record in reader:
+        report["rows"] += 1
+        line = reader.line_num
+        values = {
+            key: value.strip()
+            for key, value in record.items()
+            if key and value and value.strip()
+        }
+        barcode = values.get("barcode") or generate_barcode()
+        try:
+            spool_data = SpoolCreate(**{**values, "barcode": barcode})
+        except ValidationError as e:
+            reason = "; ".join(
+                f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                for error in e.errors()
+            )
+            _report(report, "failed", line, barcode, reason)
+            continue
+        if barcode in seen_barcodes:
+            _report(report, "failed", line, barcode, "Duplicate barcode in file")
+            continue
+        seen_barcodes.add(barcode)
+
+        batch.append((line, spool_data))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            break
+    return batch
+
+
+def _names(spools: List[SpoolCreate], field: str, extra=None) -> Dict[str, dict]:
+    """
+    Distinct values of a lookup name field, for upsert_names.
+
+    Every spelling is kept ("Red" and "red" both): upsert_names leaves the
+    case-insensitive matching to Postgres and returns an id for each.
+    """
+    names: Dict[str, dict] = {}
+    for spool_data in spools:
+        name = getattr(spool_data, field)
+        if name and name not in names:
+            names[name] = extra(spool_data) if extra else {}
+    return names
+
+
+def _report(report: dict, outcome: str, line: int, barcode: str, reason: str) -> None:
+    """Count a skipped or failed row and list it, up to MAX_REPORTED_ROWS"""
+    report[outcome] += 1
+    if len(report["problems"]) < MAX_REPORTED_ROWS:
+        report["problems"].append(
+            {"line": line, "barcode": barcode, "outcome": outcome, "reason": reason}
+        )
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -1,4 +1,6 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncResult
+from app.core.export import EXPORT_BATCH_SIZE
 from app.repositories.spool_repository import SpoolRepository
 from app.services.color_service import ColorService
 from app.services.brand_service import BrandService
@@ -32,7 +34,7 @@ class SpoolService:
         self.category_service = category_service
         self.activity_log_service = activity_log_service
 
-    def _log_activity(
+    async def _log_activity(
         self,
         action_type: str,
         description: str,
@@ -42,7 +44,7 @@ class SpoolService:
     ) -> None:
         """Helper to log activity if service is available"""
         if self.activity_log_service:
-            self.activity_log_service.log(
+            await self.activity_log_service.log(
                 action_type=action_type,
                 entity_type=EntityType.SPOOL,
                 entity_id=entity_id,
@@ -51,7 +53,7 @@ class SpoolService:
                 user=user,
             )
 
-    def create_spool(
+    async def create_spool(
         self, spool_data: SpoolCreate, user: Optional[User] = None
     ) -> Spool:
         """
@@ -80,52 +82,57 @@ class SpoolService:
         if not barcode:
             barcode = generate_barcode()
             # Ensure uniqueness (very unlikely collision but check anyway)
-            while self.spool_repo.find_by_barcode(barcode):
+            while await self.spool_repo.find_by_barcode(barcode):
                 barcode = generate_barcode()
         else:
             # Validation: Check duplicate barcode if user provided one
-            existing = self.spool_repo.find_by_barcode(barcode)
+            existing = await self.spool_repo.find_by_barcode(barcode)
             if existing:
                 raise ValueError(f"Spool with barcode '{barcode}' already exists")
 
-        # Find or create lookup entities
-        color = self.color_service.find_or_create(
+        # Find or create lookup entities, in LOOKUP_LOCK_ORDER: new rows stay
+        # locked until the commit, and other requests (and catalog imports)
+        # take the same locks in the same order
+        color = await self.color_service.find_or_create(
             spool_data.color_name, spool_data.color_hex_code
         )
 
-        brand = self.brand_service.find_or_create(spool_data.brand_name)
+        brand = await self.brand_service.find_or_create(spool_data.brand_name)
 
-        material = self.material_service.find_or_create(spool_data.material_name)
+        material = await self.material_service.find_or_create(spool_data.material_name)
 
         # Optional lookups
-        trade_name_id = None
+        trade_name = None
         if spool_data.trade_name and self.trade_name_service:
-            trade_name = self.trade_name_service.find_or_create(spool_data.trade_name)
-            trade_name_id = trade_name.id
+            trade_name = await self.trade_name_service.find_or_create(
+                spool_data.trade_name
+            )
 
-        category_id = None
+        category = None
         if spool_data.category_name and self.category_service:
-            category = self.category_service.find_or_create(spool_data.category_name)
-            category_id = category.id
+            category = await self.category_service.find_or_create(
+                spool_data.category_name
+            )
 
-        # Create spool
+        # Create spool; the relationships are set from the lookups at hand,
+        # so the response needs no reload
         spool = Spool(
             barcode=barcode,
             base_weight=spool_data.base_weight,
             is_box=spool_data.is_box,
             thickness=spool_data.thickness,
             spool_return=spool_data.spool_return,
-            material_id=material.id,
-            color_id=color.id,
-            brand_id=brand.id,
-            trade_name_id=trade_name_id,
-            category_id=category_id,
+            material=material,
+            color=color,
+            brand=brand,
+            trade_name=trade_name,
+            category=category,
         )
 
-        created = self.spool_repo.create(spool)
+        created = await self.spool_repo.create(spool)
 
         # Log the activity
-        self._log_activity(
+        await self._log_activity(
             action_type=ActionType.SPOOL_CREATED,
             description=f"Created new spool type: {spool_data.color_name} {spool_data.material_name} ({spool_data.brand_name}) - {spool_data.base_weight}g",
             entity_id=created.id,
@@ -138,43 +145,62 @@ class SpoolService:
             },
             user=user,
         )
+        await self.spool_repo.commit()
 
         return created
 
-    def get_all_spools(self, skip: int = 0, limit: int = 100) -> List[Spool]:
+    async def get_all_spools(
+        self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> Tuple[List[Spool], Optional[str]]:
         """
-        Get all spools with relationships loaded.
+        Get one page of spools with relationships loaded.
 
-        Returns spools with color, brand, and material data included.
+        Returns spools with color, brand, and material data included, and
+        the cursor of the next page.
         """
-        return self.spool_repo.get_all_with_relations(skip, limit)
+        return await self.spool_repo.get_all_with_relations(skip, limit, cursor)
 
-    def get_spool_by_id(self, spool_id: str) -> Spool:
+    async def stream_export(self) -> AsyncResult:
+        """Stream the whole catalog as flat rows, for CSV/NDJSON export"""
+        return await self.spool_repo.stream_export(EXPORT_BATCH_SIZE)
+
+    async def get_spool_by_id(self, spool_id: str) -> Spool:
         """
         Get single spool by ID.
 
         Raises:
             ValueError: If spool not found
         """
-        spool = self.spool_repo.get_by_id(spool_id)
+        spool = await self.spool_repo.get_by_id(spool_id)
         if not spool:
             raise ValueError(f"Spool with id '{spool_id}' not found")
         return spool
 
-    def get_spool_by_barcode(self, barcode: str) -> Optional[Spool]:
+    async def get_spool_by_barcode(self, barcode: str) -> Optional[Spool]:
         """
         Get single spool by exact barcode match.
 
         Returns:
             Spool if found, None otherwise
         """
-        return self.spool_repo.find_by_barcode(barcode)
+        return await self.spool_repo.find_by_barcode(barcode)
 
-    def search_spools_by_barcode(self, barcode: str) -> List[Spool]:
+    async def search_spools_by_barcode(
+        self, barcode: str, skip: int = 0, limit: int = 100
+    ) -> List[Spool]:
         """
         Search spools by partial barcode match (case-insensitive).
 
         Returns:
-            List of all matching spools
+            One page of matching spools, ordered by barcode
+        """
+        return await self.spool_repo.find_by_barcode_partial(barcode, skip, limit)
+
+    async def search_spools(self, query: str, limit: int = 20) -> List[Spool]:
+        """
+        Search the catalog by barcode, color, brand, material or trade name.
+
+        Returns:
+            Up to `limit` spools, most relevant first
         """
-        return self.spool_repo.find_by_barcode_partial(barcode)
+        return await self.spool_repo.search(query.strip(), limit)
@@ -0,0 +1,20 @@
+-- Migration: Add dedup_key column to jobs table
+-- Date: 2026-10-17
+-- Description: Lets scheduled jobs be enqueued at most once per run, even
+-- when several processes or a restart race around the trigger time
+
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS dedup_key VARCHAR(100);
+
+-- Unique constraint (NULLs allowed for ad-hoc jobs)
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'jobs_dedup_key_key'
+    ) THEN
+        ALTER TABLE jobs
+        ADD CONSTRAINT jobs_dedup_key_key UNIQUE (dedup_key);
+    END IF;
+END $$;
+
+COMMENT ON COLUMN jobs.dedup_key IS 'Idempotency key for scheduled jobs, e.g. daily_insights:YYYY-MM-DD';
@@ -0,0 +1,9 @@
+-- Migration: Add heartbeat_at column to jobs table
+-- Date: 2026-10-17
+-- Description: Running jobs refresh heartbeat_at periodically so jobs left
+-- in 'processing' by a dead worker can be detected and requeued
+
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP;
+
+COMMENT ON COLUMN jobs.heartbeat_at IS 'Last heartbeat from the worker processing this job';
@@ -0,0 +1,24 @@
+-- Migration: Add priority and run_at scheduling to jobs table
+-- Date: 2026-10-17
+-- Description: Ready jobs are claimed by priority, then run_at (used for
+-- retry backoff); a partial index keeps the claim cheap with large history
+
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS priority INTEGER NOT NULL DEFAULT 0;
+
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS run_at TIMESTAMP;
+
+-- Existing jobs become due from when they were created
+UPDATE jobs SET run_at = COALESCE(created_at, NOW() AT TIME ZONE 'utc') WHERE run_at IS NULL;
+
+ALTER TABLE jobs ALTER COLUMN run_at SET DEFAULT (NOW() AT TIME ZONE 'utc');
+ALTER TABLE jobs ALTER COLUMN run_at SET NOT NULL;
+
+-- Claim order index over ready jobs only
+CREATE INDEX IF NOT EXISTS ix_jobs_ready_queue
+ON jobs (priority DESC, run_at)
+WHERE status = 'ready';
+
+COMMENT ON COLUMN jobs.priority IS 'Higher runs first (LOW=-10, NORMAL=0, HIGH=10)';
+COMMENT ON COLUMN jobs.run_at IS 'Job is not claimed before this time (UTC); set by retry backoff';
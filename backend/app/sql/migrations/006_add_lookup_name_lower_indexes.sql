@@ -0,0 +1,15 @@
+-- Migration: Case-insensitive unique names on lookup tables
+-- Date: 2026-10-17
+-- Description: Unique indexes on lower(name) back find_by_name lookups and
+-- the INSERT ... ON CONFLICT DO NOTHING used by find_or_create.
+--
+-- Creating an index fails if a table already holds names that differ only
+-- in case. Find them first with e.g.:
+--   SELECT lower(name), array_agg(name) FROM colors GROUP BY 1 HAVING count(*) > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_colors_name_lower ON colors (lower(name));
+CREATE UNIQUE INDEX IF NOT EXISTS uq_brands_name_lower ON brands (lower(name));
+CREATE UNIQUE INDEX IF NOT EXISTS uq_materials_name_lower ON materials (lower(name));
+CREATE UNIQUE INDEX IF NOT EXISTS uq_trade_names_name_lower ON trade_names (lower(name));
+CREATE UNIQUE INDEX IF NOT EXISTS uq_categories_name_lower ON categories (lower(name));
+CREATE UNIQUE INDEX IF NOT EXISTS uq_statuses_name_lower ON statuses (lower(name));
@@ -0,0 +1,15 @@
+-- Migration: Keyset pagination indexes
+-- Date: 2026-10-17
+-- Description: List endpoints page on (created_at, id) with a cursor
+-- instead of OFFSET. A composite index per table makes every page an index
+-- range scan (forward for catalog/inventory lists, backward for activity).
+
+CREATE INDEX IF NOT EXISTS ix_inventory_created_at_id ON inventory (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_spools_created_at_id ON spools (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_activity_logs_created_at_id ON activity_logs (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_colors_created_at_id ON colors (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_brands_created_at_id ON brands (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_materials_created_at_id ON materials (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_trade_names_created_at_id ON trade_names (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_categories_created_at_id ON categories (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_statuses_created_at_id ON statuses (created_at, id);
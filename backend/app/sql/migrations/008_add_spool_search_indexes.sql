@@ -0,0 +1,17 @@
+-- Migration: Catalog search indexes
+-- Date: 2026-10-17
+-- Description: GET /api/spools/search and the ?barcode= filter match
+-- barcodes with ILIKE '%...%', which a btree cannot serve. A pg_trgm GIN
+-- index makes them an index lookup. The (fk, created_at, id) indexes let
+-- search page through the spools of a matching color, brand, material or
+-- trade name without sorting them all.
+--
+-- pg_trgm ships with Postgres contrib (included in the official images).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_spools_barcode_trgm ON spools USING gin (barcode gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_spools_color_id_created_at_id ON spools (color_id, created_at, id);
+CREATE INDEX IF NOT EXISTS ix_spools_brand_id_created_at_id ON spools (brand_id, created_at, id);
+CREATE INDEX IF NOT EXISTS ix_spools_material_id_created_at_id ON spools (material_id, created_at, id);
+CREATE INDEX IF NOT EXISTS ix_spools_trade_name_id_created_at_id ON spools (trade_name_id, created_at, id);
@@ -0,0 +1,7 @@
+-- Migration: Index inventory by spool
+-- Date: 2026-10-17
+-- Description: /api/scan/{barcode}, /api/inventory/by-spool/{id} and
+-- /count/{id} all select inventory units of one spool, which scanned the
+-- whole inventory table without this index.
+
+CREATE INDEX IF NOT EXISTS ix_inventory_spool_id ON inventory (spool_id);
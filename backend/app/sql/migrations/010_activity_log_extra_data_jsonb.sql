@@ -0,0 +1,37 @@
+-- Migration: Store activity log extra_data as JSONB
+-- Date: 2026-10-17
+-- Description: extra_data was a JSON string in a TEXT column, so queries on
+-- it meant LIKE scans over the whole table. As JSONB with a GIN index,
+-- containment filters (extra_data @> '{"spool_id": "..."}') used by
+-- /api/activity are index lookups. Values that are not valid JSON are kept
+-- as {"text": <value>}.
+
+CREATE OR REPLACE FUNCTION pg_temp.try_jsonb(value TEXT) RETURNS JSONB AS $$
+BEGIN
+    RETURN value::jsonb;
+EXCEPTION WHEN others THEN
+    RETURN jsonb_build_object('text', value);
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+DO $$
+BEGIN
+    IF (
+        SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema()
+            AND table_name = 'activity_logs' AND column_name = 'extra_data'
+    ) = 'text' THEN
+        ALTER TABLE activity_logs
+            ALTER COLUMN extra_data TYPE JSONB USING pg_temp.try_jsonb(extra_data);
+        -- JSON null means no extra data
+        UPDATE activity_logs SET extra_data = NULL
+        WHERE extra_data = 'null'::jsonb;
+    END IF;
+END;
+$$;
+
+CREATE INDEX IF NOT EXISTS ix_activity_logs_extra_data
+    ON activity_logs USING gin (extra_data jsonb_path_ops);
+
+CREATE INDEX IF NOT EXISTS ix_activity_logs_entity
+    ON activity_logs (entity_type, entity_id);
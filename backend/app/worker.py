@@ -0,0 +1,59 @@
+"""
+Background Worker Process
+
+Runs the job worker and the scheduler on their own, without the web server,
+so background work does not compete with API requests for the event loop.
+
+Usage:
+    python -m app.worker
+
+Pair it with RUN_BACKGROUND_SERVICES=false on the API processes. Any number
+of worker processes can run side by side: jobs are claimed with SKIP LOCKED
+and only the elected leader runs the scheduler. Workers do not create the
+schema; on a fresh database they wait until the API has.
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.database import async_engine, wait_for_schema
+from app.services.job_worker import job_worker
+from app.services.scheduler import setup_scheduler, shutdown_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(stop: asyncio.Event) -> None:
+    """Run background services until `stop` is set"""
+    # The API process creates the schema; don't race it with the same DDL
+    await wait_for_schema()
+    print("✅ Database tables ready")
+
+    job_worker.start()
+    print("✅ Job worker started")
+    setup_scheduler()
+    print("✅ Scheduler election started (leader runs daily insights at 6:00 AM)")
+
+    await stop.wait()
+
+    await job_worker.stop()
+    await shutdown_scheduler()
+    await async_engine.dispose()
+    print("✅ Background services stopped")
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    # docker stop sends SIGTERM; Ctrl+C sends SIGINT. Both drain in-flight jobs
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    await run_worker(stop)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""
+Activity log benchmark: synchronous vs. buffered activity log writes.
+
+Seeds a throwaway spool, then runs `--ops` inventory writes (add a unit,
+then a weight update on it), each in its own session like a request,
+with `--concurrency` in flight:
+  - sync: the log entry is inserted in the request's transaction,
+  - buffered: the entry is handed to an ActivityLogWriter after commit
+    and written in batches in the background,
+and reports p50/p95 latency per write and the time the writer needed to
+drain what was still buffered. Deletes everything afterwards.
+
+Usage:
+    python -m benchmarks.activity_log --ops 2000 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import delete, func, select
+
+from app.database import AsyncSessionLocal, create_tables
+from app.models.activity_log import ActivityLog
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.status_repository import StatusRepository
+from app.schemas.inventory import InventoryCreate, InventoryUpdate
+from app.services.activity_log_service import ActivityLogService
+from app.services.activity_log_writer import ActivityLogWriter
+from app.services.inventory_service import InventoryService
+from app.services.status_service import StatusService
+
+PREFIX = "bench-log"
+
+
+def inventory_service(db, writer=None) -> InventoryService:
+    return InventoryService(
+        InventoryRepository(db),
+        SpoolRepository(db),
+        StatusService(StatusRepository(db)),
+        ActivityLogService(ActivityLogRepository(db), writer),
+    )
+
+
+async def seed() -> str:
+    async with AsyncSessionLocal() as db:
+        color = Color(name=f"{PREFIX}-color", hex_code="#000000")
+        brand = Brand(name=f"{PREFIX}-brand")
+        material = Material(name=f"{PREFIX}-material")
+        db.add_all([color, brand, material, Status(name=f"{PREFIX}-status")])
+        await db.flush()
+        spool = Spool(
+            barcode="BLOG-1",
+            base_weight=1000,
+            color_id=color.id,
+            brand_id=brand.id,
+            material_id=material.id,
+        )
+        db.add(spool)
+        await db.commit()
+        return spool.id
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        spool_ids = select(Spool.id).where(Spool.barcode == "BLOG-1")
+        unit_ids = select(Inventory.id).where(Inventory.spool_id.in_(spool_ids))
+        await db.execute(delete(ActivityLog).where(ActivityLog.entity_id.in_(unit_ids)))
+        await db.execute(delete(Inventory).where(Inventory.spool_id.in_(spool_ids)))
+        await db.execute(delete(Spool).where(Spool.barcode == "BLOG-1"))
+        for model in (Color, Brand, Material, Status):
+            await db.execute(delete(model).where(model.name.like(f"{PREFIX}-%")))
+        await db.commit()
+
+
+async def run(spool_id: str, ops: int, concurrency: int, writer=None) -> list:
+    """Latencies (ms) of `ops` writes, `concurrency` at a time"""
+    latencies = []
+    slots = asyncio.Semaphore(concurrency)
+
+    async def timed(write):
+        async with slots, AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            result = await write(inventory_service(db, writer))
+            latencies.append((time.perf_counter() - start) * 1000)
+            return result
+
+    async def add(service):
+        data = InventoryCreate(spool_id=spool_id, status_name=f"{PREFIX}-status")
+        return (await service.add_to_inventory(data)).id
+
+    unit_ids = await asyncio.gather(*[timed(add) for _ in range(ops // 2)])
+
+    def use(unit_id: str):
+        data = InventoryUpdate(weight=750)
+        return lambda service: service.update_inventory(unit_id, data)
+
+    await asyncio.gather(*[timed(use(unit_id)) for unit_id in unit_ids])
+    return latencies
+
+
+def report(name: str, latencies: list) -> None:
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{name:<9} p50 {cuts[49]:6.2f} ms   p95 {cuts[94]:6.2f} ms")
+
+
+async def main_async(ops: int, concurrency: int) -> None:
+    await cleanup()
+    spool_id = await seed()
+    try:
+        # Warm up connections and the lookup cache
+        await run(spool_id, 50, concurrency)
+
+        report("sync", await run(spool_id, ops, concurrency))
+
+        writer = ActivityLogWriter()
+        writer.start()
+        latencies = await run(spool_id, ops, concurrency, writer)
+        pending = writer.pending
+        start = time.perf_counter()
+        await writer.stop()
+        drain_ms = (time.perf_counter() - start) * 1000
+        report("buffered", latencies)
+        print(f"          {pending} rows still buffered, drained in {drain_ms:.0f} ms")
+
+        async with AsyncSessionLocal() as db:
+            units = select(Inventory.id).where(Inventory.spool_id == spool_id)
+            logs = await db.scalar(
+                select(func.count(ActivityLog.id)).where(
+                    ActivityLog.entity_id.in_(units)
+                )
+            )
+        print(f"          {logs} activity log rows written in total")
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    create_tables()
+    asyncio.run(main_async(args.ops, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
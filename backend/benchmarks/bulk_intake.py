@@ -0,0 +1,156 @@
+"""
+Bulk intake benchmark: one POST per unit vs. /api/inventory/bulk.
+
+Seeds `--spool-types` throwaway spools, then receives `--units` units
+spread over them
+  - one add_to_inventory call per unit (the old pallet workflow: spool
+    lookup, status find_or_create, insert, activity log, commit),
+  - with one add_bulk call,
+and reports units per second for each, server side. Deletes everything
+afterwards.
+
+Usage:
+    python -m benchmarks.bulk_intake --units 10000 --spool-types 20
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import delete, select
+
+from app.database import AsyncSessionLocal, create_tables
+from app.models.activity_log import ActivityLog
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.status_repository import StatusRepository
+from app.schemas.inventory import InventoryBulkCreate, InventoryCreate
+from app.services.activity_log_service import ActivityLogService
+from app.services.inventory_service import InventoryService
+from app.services.status_service import StatusService
+
+PREFIX = "bench-bulk"
+
+
+def inventory_service(db) -> InventoryService:
+    return InventoryService(
+        InventoryRepository(db),
+        SpoolRepository(db),
+        StatusService(StatusRepository(db)),
+        ActivityLogService(ActivityLogRepository(db)),
+    )
+
+
+async def seed(spool_types: int) -> list[str]:
+    async with AsyncSessionLocal() as db:
+        color = Color(name=f"{PREFIX}-color", hex_code="#000000")
+        brand = Brand(name=f"{PREFIX}-brand")
+        material = Material(name=f"{PREFIX}-material")
+        db.add_all([color, brand, material])
+        await db.flush()
+        spools = [
+            Spool(
+                barcode=f"BBULK-{i}",
+                base_weight=1000,
+                color_id=color.id,
+                brand_id=brand.id,
+                material_id=material.id,
+            )
+            for i in range(spool_types)
+        ]
+        db.add_all(spools)
+        await db.commit()
+        return [spool.id for spool in spools]
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        spool_ids = select(Spool.id).where(Spool.barcode.like("BBULK-%"))
+        await db.execute(
+            delete(ActivityLog).where(
+                ActivityLog.extra_data["barcode"].astext.like("BBULK-%")
+            )
+        )
+        await db.execute(delete(Inventory).where(Inventory.spool_id.in_(spool_ids)))
+        await db.execute(delete(Spool).where(Spool.barcode.like("BBULK-%")))
+        for model in (Color, Brand, Material, Status):
+            await db.execute(delete(model).where(model.name.like(f"{PREFIX}-%")))
+        await db.commit()
+
+
+async def one_by_one(spool_ids: list[str], units: int) -> float:
+    async with AsyncSessionLocal() as db:
+        service = inventory_service(db)
+        start = time.perf_counter()
+        for i in range(units):
+            await service.add_to_inventory(
+                InventoryCreate(
+                    spool_id=spool_ids[i % len(spool_ids)],
+                    status_name=f"{PREFIX}-status",
+                )
+            )
+        return time.perf_counter() - start
+
+
+async def bulk(spool_ids: list[str], units: int) -> float:
+    per_type, extra = divmod(units, len(spool_ids))
+    data = InventoryBulkCreate(
+        items=[
+            {
+                "spool_id": spool_id,
+                "quantity": per_type + (i < extra),
+                "status_name": f"{PREFIX}-status",
+            }
+            for i, spool_id in enumerate(spool_ids)
+            if per_type + (i < extra)
+        ]
+    )
+    async with AsyncSessionLocal() as db:
+        start = time.perf_counter()
+        await inventory_service(db).add_bulk(data)
+        return time.perf_counter() - start
+
+
+async def main_async(units: int, spool_types: int, single_units: int) -> None:
+    await cleanup()
+    spool_ids = await seed(spool_types)
+    try:
+        single_s = await one_by_one(spool_ids, single_units)
+        bulk_s = await bulk(spool_ids, units)
+        print(
+            f"one call per unit  {single_units / single_s:9.0f} units/s "
+            f"({single_units} units in {single_s:.2f} s)"
+        )
+        print(
+            f"bulk               {units / bulk_s:9.0f} units/s "
+            f"({units} units in {bulk_s:.2f} s)"
+        )
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--units", type=int, default=10_000)
+    parser.add_argument("--spool-types", type=int, default=20)
+    parser.add_argument(
+        "--single-units",
+        type=int,
+        default=1000,
+        help="Units for the one-call-per-unit run (it is slow)",
+    )
+    args = parser.parse_args()
+
+    create_tables()
+    asyncio.run(main_async(args.units, args.spool_types, args.single_units))
+
+
+if __name__ == "__main__":
+    main()
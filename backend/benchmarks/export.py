@@ -0,0 +1,182 @@
+"""
+Export benchmark: streaming CSV/NDJSON export vs. paging through the API.
+
+Seeds `--rows` throwaway inventory units, then exports all of them
+  - as CSV, NDJSON and gzipped CSV through the streaming export,
+  - the old way: GET /api/inventory pages of 1000 (ORM objects plus
+    nested InventoryResponse models per row),
+each in a fresh process, and reports rows/s, output size and the peak
+RSS of that process. Deletes everything afterwards.
+
+Usage:
+    python -m benchmarks.export --rows 1000000
+"""
+
+import argparse
+import asyncio
+import resource
+import sys
+import time
+
+from sqlalchemy import delete, func, select, text
+
+from app.core.export import ExportFormat, encode_rows, gzip_chunks
+from app.database import AsyncSessionLocal, create_tables
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.repositories.inventory_repository import InventoryRepository
+from app.schemas.inventory import InventoryResponse
+
+PREFIX = "bench-export"
+MODES = ["csv", "ndjson", "csv-gzip", "api-pages"]
+
+
+async def seed(rows: int) -> None:
+    async with AsyncSessionLocal() as db:
+        db.add_all(
+            [
+                Color(name=f"{PREFIX}-color", hex_code="#000000"),
+                Brand(name=f"{PREFIX}-brand"),
+                Material(name=f"{PREFIX}-material"),
+                Status(name=f"{PREFIX}-status"),
+            ]
+        )
+        await db.commit()
+        await db.execute(
+            text(
+                """
+                INSERT INTO spools (id, barcode, base_weight, is_box, spool_return,
+                                    color_id, brand_id, material_id,
+                                    created_at, updated_at)
+                SELECT gen_random_uuid()::text, 'BEXPORT-' || i, 1000, false, false,
+                       (SELECT id FROM colors WHERE name = :prefix || '-color'),
+                       (SELECT id FROM brands WHERE name = :prefix || '-brand'),
+                       (SELECT id FROM materials WHERE name = :prefix || '-material'),
+                       now(), now()
+                FROM generate_series(1, 100) AS i
+                """
+            ),
+            {"prefix": PREFIX},
+        )
+        await db.execute(
+            text(
+                """
+                WITH s AS (SELECT array_agg(id) ids FROM spools
+                           WHERE barcode LIKE 'BEXPORT-%')
+                INSERT INTO inventory (id, spool_id, weight, is_in_use, status_id,
+                                       custom_properties, created_at, updated_at)
+                SELECT gen_random_uuid()::text, s.ids[1 + i % 100], 1000 - i % 900,
+                       i % 7 = 0,
+                       (SELECT id FROM statuses WHERE name = :prefix || '-status'),
+                       'shelf ' || i % 40,
+                       now() - (i || ' seconds')::interval, now()
+                FROM generate_series(1, :rows) AS i, s
+                """
+            ),
+            {"prefix": PREFIX, "rows": rows},
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE inventory"))
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        spool_ids = select(Spool.id).where(Spool.barcode.like("BEXPORT-%"))
+        await db.execute(delete(Inventory).where(Inventory.spool_id.in_(spool_ids)))
+        await db.execute(delete(Spool).where(Spool.barcode.like("BEXPORT-%")))
+        for model in (Color, Brand, Material, Status):
+            await db.execute(delete(model).where(model.name.like(f"{PREFIX}-%")))
+        await db.commit()
+
+
+async def export(mode: str) -> tuple[int, int]:
+    """Run one export to nowhere; returns (rows, bytes)"""
+    async with AsyncSessionLocal() as db:
+        inventory_repo = InventoryRepository(db)
+        size = rows = 0
+        if mode == "api-pages":
+            cursor = None
+            while True:
+                page, cursor = await inventory_repo.get_page(1000, cursor)
+                body = (
+                    "["
+                    + ",".join(
+                        InventoryResponse.model_validate(item).model_dump_json()
+                        for item in page
+                    )
+                    + "]"
+                )
+                size += len(body)
+                rows += len(page)
+                db.expunge_all()
+                if cursor is None:
+                    return rows, size
+
+        fmt = ExportFormat.NDJSON if mode == "ndjson" else ExportFormat.CSV
+        chunks = encode_rows(await inventory_repo.stream_export(), fmt)
+        if mode == "csv-gzip":
+            chunks = gzip_chunks(chunks)
+        async for chunk in chunks:
+            size += len(chunk)
+        return await db.scalar(select(func.count(Inventory.id))), size
+
+
+def run_mode(mode: str) -> None:
+    """Child process: one export, then print rows, bytes, seconds, peak RSS"""
+    start = time.perf_counter()
+    rows, size = asyncio.run(export(mode))
+    elapsed = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{rows} {size} {elapsed} {peak_mb}")
+
+
+async def run_child(mode: str) -> str:
+    child = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "benchmarks.export",
+        "--run",
+        mode,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await child.communicate()
+    if child.returncode:
+        raise RuntimeError(f"{mode} export failed")
+    return stdout.decode()
+
+
+async def main_async(rows: int) -> None:
+    await cleanup()
+    await seed(rows)
+    try:
+        for mode in MODES:
+            out = (await run_child(mode)).split()
+            count, size = int(out[-4]), int(out[-3])
+            elapsed, peak_mb = float(out[-2]), float(out[-1])
+            print(
+                f"{mode:<10} {count / elapsed:9.0f} rows/s  {size / 2**20:8.1f} MiB  "
+                f"peak RSS {peak_mb:7.1f} MiB"
+            )
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--run", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    create_tables()  # also registers all models in the child processes
+    if args.run:
+        run_mode(args.run)
+    else:
+        asyncio.run(main_async(args.rows))
+
+
+if __name__ == "__main__":
+    main()
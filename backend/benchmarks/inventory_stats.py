@@ -0,0 +1,126 @@
+"""
+Dashboard inventory stats benchmark.
+
+Seeds N inventory rows into the configured database, then compares the old
+Python-side aggregation (load up to 10,000 ORM rows and loop over them)
+with the SQL aggregate in InventoryRepository.get_stats(). Reports latency
+and peak Python memory (tracemalloc). Seeded rows are removed afterwards.
+
+Usage:
+    python -m benchmarks.inventory_stats --rows 100000 --rows 1000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from sqlalchemy import text
+
+from app.database import AsyncSessionLocal, create_tables
+from app.repositories.inventory_repository import InventoryRepository
+from app.seed import seed_database
+
+MARKER = "benchmark:inventory_stats"
+
+
+async def legacy_stats(repo: InventoryRepository) -> dict:
+    """The pre-aggregate implementation of DashboardService.get_inventory_stats"""
+    inventory_items = await repo.get_all(limit=10000)
+    low_stock_count = 0
+    for item in inventory_items:
+        if item.spool and item.spool.base_weight:
+            if item.weight < item.spool.base_weight * 0.2:
+                low_stock_count += 1
+    return {
+        "total_spools": len(inventory_items),
+        "total_weight": sum(item.weight for item in inventory_items),
+        "spools_in_use": sum(1 for item in inventory_items if item.is_in_use),
+        "low_stock_count": low_stock_count,
+    }
+
+
+async def seed(rows: int) -> None:
+    async with AsyncSessionLocal() as db:
+        spool_id = (await db.execute(text("SELECT id FROM spools LIMIT 1"))).scalar()
+        status_id = (await db.execute(text("SELECT id FROM statuses LIMIT 1"))).scalar()
+        await db.execute(
+            text(
+                """
+                INSERT INTO inventory
+                    (id, spool_id, weight, is_in_use, status_id,
+                     custom_properties, created_at, updated_at)
+                SELECT gen_random_uuid()::text, :spool_id, (random() * 1000) + 1,
+                       random() < 0.1, :status_id, :marker, now(), now()
+                FROM generate_series(1, :rows)
+                """
+            ),
+            {
+                "spool_id": spool_id,
+                "status_id": status_id,
+                "marker": MARKER,
+                "rows": rows,
+            },
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE inventory"))
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            text("DELETE FROM inventory WHERE custom_properties = :marker"),
+            {"marker": MARKER},
+        )
+        await db.commit()
+
+
+async def measure(fn, repeat: int) -> tuple[float, float, dict]:
+    timings = []
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            result = await fn(InventoryRepository(db))
+            timings.append((time.perf_counter() - start) * 1000)
+
+    # Separate pass for memory: tracemalloc slows allocation-heavy code down
+    async with AsyncSessionLocal() as db:
+        tracemalloc.start()
+        await fn(InventoryRepository(db))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return statistics.median(timings), peak / 1024 / 1024, result
+
+
+async def run(row_counts: list[int], repeat: int) -> None:
+    for rows in row_counts:
+        await seed(rows)
+        try:
+            for name, fn in (
+                ("legacy (limit=10000)", legacy_stats),
+                ("sql aggregate", lambda repo: repo.get_stats()),
+            ):
+                ms, mib, result = await measure(fn, repeat)
+                print(
+                    f"rows={rows:>9,}  {name:<22} {ms:9.1f} ms  {mib:8.1f} MiB  "
+                    f"total_spools={result['total_spools']}"
+                )
+        finally:
+            await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, action="append")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    create_tables()
+    seed_database()
+    asyncio.run(run(args.rows or [100_000, 1_000_000], args.repeat))
+
+
+if __name__ == "__main__":
+    main()
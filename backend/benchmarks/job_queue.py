@@ -0,0 +1,288 @@
+"""
+Job queue benchmarks.
+
+Runs against the configured database with throwaway "benchmark" jobs that
+are deleted afterwards. Do not run it while a real job worker is attached
+to the same database.
+
+Usage:
+    # Claim throughput as independent workers are added
+    python -m benchmarks.job_queue claim --jobs 400 --work-ms 20 --workers 1 2 4 8
+
+    # Enqueue-to-start latency: LISTEN/NOTIFY vs. the old 5 s polling loop
+    python -m benchmarks.job_queue latency --jobs 20 --max-gap-ms 1500
+
+    # Queue-drain throughput of one JobWorker as its slot count grows
+    python -m benchmarks.job_queue drain --jobs 200 --work-ms 200 --slots 1 4 16
+
+    # Claim query plan and latency with a large finished-job history
+    python -m benchmarks.job_queue claim-plan --history 1000000 --ready 1000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.database import AsyncSessionLocal, create_tables
+from app.models.job import Job, JobStatus
+from app.repositories.job_repository import JobRepository
+from app.services.job_worker import JobWorker
+
+BENCHMARK_JOB_TYPE = "benchmark"
+
+
+async def seed_jobs(count: int) -> None:
+    async with AsyncSessionLocal() as db:
+        db.add_all(
+            [
+                Job(job_type=BENCHMARK_JOB_TYPE, status=JobStatus.READY)
+                for _ in range(count)
+            ]
+        )
+        await db.commit()
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Job).where(Job.job_type == BENCHMARK_JOB_TYPE))
+        await db.commit()
+
+
+async def claiming_worker(work_ms: int, claimed: list) -> None:
+    """Claim, 'process' and complete jobs until the queue is empty"""
+    async with AsyncSessionLocal() as db:
+        job_repo = JobRepository(db)
+        while job := await job_repo.claim_next():
+            await asyncio.sleep(work_ms / 1000)
+            job.status = JobStatus.COMPLETED
+            job.completed_at = datetime.utcnow()
+            await db.commit()
+            claimed.append(job.id)
+
+
+async def bench_claim(jobs: int, work_ms: int, worker_counts: list[int]) -> None:
+    for workers in worker_counts:
+        await seed_jobs(jobs)
+        claimed: list[str] = []
+        try:
+            start = time.perf_counter()
+            await asyncio.gather(
+                *[claiming_worker(work_ms, claimed) for _ in range(workers)]
+            )
+            elapsed = time.perf_counter() - start
+        finally:
+            await cleanup()
+
+        duplicates = len(claimed) - len(set(claimed))
+        print(
+            f"workers={workers:>3}  {len(claimed) / elapsed:8.1f} jobs/s  "
+            f"claimed={len(claimed)} duplicates={duplicates}"
+        )
+
+
+class BenchmarkWorker(JobWorker):
+    """JobWorker whose jobs just wait work_ms (an I/O-bound job) and complete"""
+
+    def __init__(self, work_ms: int = 0, **kwargs):
+        super().__init__(**kwargs)
+        self.work_ms = work_ms
+
+    async def process_job(self, job: Job, db) -> None:
+        await asyncio.sleep(self.work_ms / 1000)
+        job.status = JobStatus.COMPLETED
+        job.completed_at = datetime.utcnow()
+        await db.commit()
+
+
+async def wait_until_drained() -> None:
+    while True:
+        async with AsyncSessionLocal() as db:
+            pending = await db.scalar(
+                select(Job.id)
+                .where(
+                    Job.job_type == BENCHMARK_JOB_TYPE,
+                    Job.status != JobStatus.COMPLETED,
+                )
+                .limit(1)
+            )
+        if pending is None:
+            return
+        await asyncio.sleep(0.05)
+
+
+async def measure_latency(worker: JobWorker, jobs: int, max_gap_ms: int) -> list:
+    """Enqueue jobs at random intervals and return their wait times in ms"""
+    rng = random.Random(42)
+    worker.start()
+    try:
+        # Let the worker reach its idle wait (and the listener connect)
+        await asyncio.sleep(1)
+        async with AsyncSessionLocal() as db:
+            job_repo = JobRepository(db)
+            for _ in range(jobs):
+                await asyncio.sleep(rng.uniform(0, max_gap_ms) / 1000)
+                await job_repo.create(
+                    Job(job_type=BENCHMARK_JOB_TYPE, status=JobStatus.READY)
+                )
+                await job_repo.commit()
+
+        await wait_until_drained()
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Job.created_at, Job.started_at).where(
+                    Job.job_type == BENCHMARK_JOB_TYPE
+                )
+            )
+            return [
+                (started - created).total_seconds() * 1000
+                for created, started in result.all()
+            ]
+    finally:
+        await worker.stop()
+        await cleanup()
+
+
+async def bench_latency(jobs: int, max_gap_ms: int) -> None:
+    variants = [
+        ("poll 5s", BenchmarkWorker(poll_interval=5, listen=False)),
+        ("listen/notify", BenchmarkWorker()),
+    ]
+    for name, worker in variants:
+        latencies = sorted(await measure_latency(worker, jobs, max_gap_ms))
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"{name:<14} jobs={len(latencies)}  "
+            f"mean={statistics.mean(latencies):8.1f} ms  "
+            f"p50={statistics.median(latencies):8.1f} ms  "
+            f"p95={p95:8.1f} ms  max={latencies[-1]:8.1f} ms"
+        )
+
+
+async def bench_drain(jobs: int, work_ms: int, slot_counts: list[int]) -> None:
+    for slots in slot_counts:
+        await seed_jobs(jobs)
+        worker = BenchmarkWorker(work_ms=work_ms, concurrency=slots, type_limits={})
+        try:
+            start = time.perf_counter()
+            worker.start()
+            await wait_until_drained()
+            elapsed = time.perf_counter() - start
+        finally:
+            await worker.stop()
+            await cleanup()
+
+        print(
+            f"slots={slots:>3}  drained {jobs} jobs in {elapsed:6.2f} s  "
+            f"{jobs / elapsed:8.1f} jobs/s"
+        )
+
+
+async def bench_claim_plan(history: int, ready: int) -> None:
+    async with AsyncSessionLocal() as db:
+        # Finished history spread over a year, plus a backlog of ready jobs
+        # with mixed priorities, some of them scheduled in the future
+        await db.execute(
+            text(
+                """
+                INSERT INTO jobs (id, job_type, status, priority, run_at,
+                                  created_at, retry_count, max_retries)
+                SELECT gen_random_uuid()::text, :job_type, 'completed', 0,
+                       now() - (i || ' seconds')::interval,
+                       now() - (i || ' seconds')::interval, 0, 2
+                FROM generate_series(1, :history) AS i
+                """
+            ),
+            {"job_type": BENCHMARK_JOB_TYPE, "history": history},
+        )
+        await db.execute(
+            text(
+                """
+                INSERT INTO jobs (id, job_type, status, priority, run_at,
+                                  created_at, retry_count, max_retries)
+                SELECT gen_random_uuid()::text, :job_type, 'ready',
+                       (i % 3 - 1) * 10,
+                       now() AT TIME ZONE 'utc'
+                           + ((i % 5 - 2) || ' minutes')::interval,
+                       now(), 0, 2
+                FROM generate_series(1, :ready) AS i
+                """
+            ),
+            {"job_type": BENCHMARK_JOB_TYPE, "ready": ready},
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE jobs"))
+
+    try:
+        async with AsyncSessionLocal() as db:
+            query = (
+                JobRepository(db)
+                ._ready_query()
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            sql = query.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+            plan = await db.execute(text(f"EXPLAIN ANALYZE {sql}"))
+            print("\n".join(row[0] for row in plan))
+            await db.rollback()
+
+        claims = 200
+        async with AsyncSessionLocal() as db:
+            job_repo = JobRepository(db)
+            start = time.perf_counter()
+            for _ in range(claims):
+                await job_repo.claim_next()
+            elapsed = time.perf_counter() - start
+        print(
+            f"history={history} ready={ready}: "
+            f"{elapsed / claims * 1000:.2f} ms per claim ({claims} claims)"
+        )
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    claim = sub.add_parser("claim", help="claim throughput vs. worker count")
+    claim.add_argument("--jobs", type=int, default=400)
+    claim.add_argument("--work-ms", type=int, default=20)
+    claim.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+
+    latency = sub.add_parser("latency", help="enqueue-to-start latency")
+    latency.add_argument("--jobs", type=int, default=20)
+    latency.add_argument("--max-gap-ms", type=int, default=1500)
+
+    drain = sub.add_parser("drain", help="queue-drain throughput vs. slots")
+    drain.add_argument("--jobs", type=int, default=200)
+    drain.add_argument("--work-ms", type=int, default=200)
+    drain.add_argument("--slots", type=int, nargs="+", default=[1, 4, 16])
+
+    plan = sub.add_parser("claim-plan", help="claim query plan with history")
+    plan.add_argument("--history", type=int, default=1_000_000)
+    plan.add_argument("--ready", type=int, default=1000)
+
+    args = parser.parse_args()
+    create_tables()
+
+    if args.command == "claim":
+        asyncio.run(bench_claim(args.jobs, args.work_ms, args.workers))
+    elif args.command == "latency":
+        asyncio.run(bench_latency(args.jobs, args.max_gap_ms))
+    elif args.command == "drain":
+        asyncio.run(bench_drain(args.jobs, args.work_ms, args.slots))
+    elif args.command == "claim-plan":
+        asyncio.run(bench_claim_plan(args.history, args.ready))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Concurrent load benchmark against a running API worker.
+
+Fires requests at a single uvicorn worker with a fixed number of in-flight
+requests and reports throughput and latency percentiles. Run it against the
+same endpoint before and after a change to compare.
+
+Usage:
+    uvicorn app.main:app --workers 1 --port 8000
+    python -m benchmarks.load_concurrency --url http://localhost:8000/api/spools/ \
+        --concurrency 50 --requests 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def _worker(client, url, headers, remaining, latencies, errors):
+    while True:
+        if remaining[0] <= 0:
+            return
+        remaining[0] -= 1
+        start = time.perf_counter()
+        try:
+            response = await client.get(url, headers=headers)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def run(url: str, concurrency: int, requests: int, token: str = None) -> dict:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    latencies: list[float] = []
+    errors: list = []
+    remaining = [requests]
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=60.0) as client:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *[
+                _worker(client, url, headers, remaining, latencies, errors)
+                for _ in range(concurrency)
+            ]
+        )
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "seconds": round(elapsed, 2),
+        "req_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 1),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000/api/spools/")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--token", default=None, help="Bearer token, if needed")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.url, args.concurrency, args.requests, args.token))
+    for key, value in result.items():
+        print(f"{key:>12}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Login burst benchmark: latency of unrelated requests during concurrent logins.
+
+Drives the app in-process over ASGI while `--logins` logins run with
+`--concurrency` in flight, and meanwhile probes GET / every `--probe-ms`.
+Runs once with bcrypt called inline on the event loop (how login used to
+work) and once on the password pool, and reports probe latency
+percentiles. Creates one throwaway user and deletes it afterwards.
+
+Usage:
+    python -m benchmarks.login_latency --logins 40 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from sqlalchemy import delete
+
+from app.database import AsyncSessionLocal, create_tables
+from app.main import app
+from app.models.user import User, UserRole
+from app.services import auth_service
+from app.services.auth_service import get_password_hash
+
+EMAIL = "bench-login@example.com"
+PASSWORD = "bench-password"
+
+
+async def inline_password_work(func, *args):
+    """The old behaviour: bcrypt runs on the event loop"""
+    return func(*args)
+
+
+async def seed_user() -> None:
+    async with AsyncSessionLocal() as db:
+        db.add(
+            User(
+                email=EMAIL,
+                hashed_password=get_password_hash(PASSWORD),
+                role=UserRole.VIEWER,
+            )
+        )
+        await db.commit()
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(User).where(User.email == EMAIL))
+        await db.commit()
+
+
+async def bench(logins: int, concurrency: int, probe_ms: int) -> tuple[float, list]:
+    """Return (logins/s, probe latencies in ms)"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        done = asyncio.Event()
+        latencies: list[float] = []
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await c.get("/")
+                latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(probe_ms / 1000)
+
+        counter = iter(range(logins))
+
+        async def login():
+            for _ in counter:
+                response = await c.post(
+                    "/api/auth/login", json={"email": EMAIL, "password": PASSWORD}
+                )
+                assert response.status_code == 200, response.text
+
+        prober = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*[login() for _ in range(concurrency)])
+        elapsed = time.perf_counter() - start
+        done.set()
+        await prober
+    return logins / elapsed, latencies
+
+
+async def main_async(logins: int, concurrency: int, probe_ms: int) -> None:
+    await cleanup()
+    await seed_user()
+    pooled = auth_service.run_password_work
+    try:
+        for name, runner in [("inline", inline_password_work), ("pool", pooled)]:
+            auth_service.run_password_work = runner
+            rate, latencies = await bench(logins, concurrency, probe_ms)
+            latencies.sort()
+            p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+            print(
+                f"{name:<7} logins {rate:6.1f}/s   GET / "
+                f"p50={statistics.median(latencies):7.1f} ms  "
+                f"p99={p99:7.1f} ms  max={latencies[-1]:7.1f} ms  "
+                f"(n={len(latencies)})"
+            )
+    finally:
+        auth_service.run_password_work = pooled
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--probe-ms", type=int, default=10)
+    args = parser.parse_args()
+
+    create_tables()
+    asyncio.run(main_async(args.logins, args.concurrency, args.probe_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Lookup cache benchmark: catalog and inventory write throughput.
+
+Creates spools through SpoolService.create_spool (five find_or_create
+lookups each) and inventory items through InventoryService.add_to_inventory
+(one status lookup each), wired the way the API dependencies wire them,
+with one session per operation like one request. The lookup rows exist
+up front (the steady state: these tables rarely change). Runs once with the
+lookup cache disabled and once with it warmed at startup, then deletes
+everything it created.
+
+Usage:
+    python -m benchmarks.lookup_cache --ops 500 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import delete, select
+
+from app.core.cache import lookup_cache
+from app.database import AsyncSessionLocal, create_tables
+from app.models.activity_log import ActivityLog
+from app.models.brand import Brand
+from app.models.category import Category
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.models.trade_name import TradeName
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.brand_repository import BrandRepository
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.color_repository import ColorRepository
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.material_repository import MaterialRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.status_repository import StatusRepository
+from app.repositories.trade_name_repository import TradeNameRepository
+from app.schemas.inventory import InventoryCreate
+from app.schemas.spool import SpoolCreate
+from app.services.activity_log_service import ActivityLogService
+from app.services.brand_service import BrandService
+from app.services.category_service import CategoryService
+from app.services.color_service import ColorService
+from app.services.inventory_service import InventoryService
+from app.services.material_service import MaterialService
+from app.services.spool_service import SpoolService
+from app.services.status_service import StatusService
+from app.services.trade_name_service import TradeNameService
+
+PREFIX = "bench-"
+LOOKUP_MODELS = [Color, Brand, Material, TradeName, Category, Status]
+
+
+def spool_service(db) -> SpoolService:
+    return SpoolService(
+        SpoolRepository(db),
+        ColorService(ColorRepository(db)),
+        BrandService(BrandRepository(db)),
+        MaterialService(MaterialRepository(db)),
+        TradeNameService(TradeNameRepository(db)),
+        CategoryService(CategoryRepository(db)),
+        ActivityLogService(ActivityLogRepository(db)),
+    )
+
+
+def inventory_service(db) -> InventoryService:
+    return InventoryService(
+        InventoryRepository(db),
+        SpoolRepository(db),
+        StatusService(StatusRepository(db)),
+        ActivityLogService(ActivityLogRepository(db)),
+    )
+
+
+def spool_data(i: int) -> SpoolCreate:
+    return SpoolCreate(
+        base_weight=1000,
+        color_name=f"{PREFIX}color-{i % 12}",
+        brand_name=f"{PREFIX}brand-{i % 5}",
+        material_name=f"{PREFIX}material-{i % 4}",
+        trade_name=f"{PREFIX}trade-{i % 3}",
+        category_name=f"{PREFIX}category-{i % 3}",
+    )
+
+
+async def seed_lookups() -> None:
+    async with AsyncSessionLocal() as db:
+        for i in range(12):
+            db.add(Color(name=f"{PREFIX}color-{i}", hex_code="#000000"))
+        for model, prefix, count in [
+            (Brand, "brand", 5),
+            (Material, "material", 4),
+            (TradeName, "trade", 3),
+            (Category, "category", 3),
+            (Status, "status", 3),
+        ]:
+            db.add_all([model(name=f"{PREFIX}{prefix}-{i}") for i in range(count)])
+        await db.commit()
+
+
+async def run_concurrently(ops: int, concurrency: int, op) -> float:
+    """Run op(i) for i in range(ops) on `concurrency` tasks; return ops/s"""
+    counter = iter(range(ops))
+
+    async def runner():
+        for i in counter:
+            await op(i)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[runner() for _ in range(concurrency)])
+    return ops / (time.perf_counter() - start)
+
+
+async def bench(ops: int, concurrency: int, cached: bool) -> tuple[float, float]:
+    lookup_cache.clear()
+    lookup_cache.enabled = cached
+    spool_ids: list[str] = []
+
+    async def create_spool(i: int) -> None:
+        async with AsyncSessionLocal() as db:
+            spool = await spool_service(db).create_spool(spool_data(i))
+            spool_ids.append(spool.id)
+
+    async def add_inventory(i: int) -> None:
+        async with AsyncSessionLocal() as db:
+            await inventory_service(db).add_to_inventory(
+                InventoryCreate(
+                    spool_id=spool_ids[i % len(spool_ids)],
+                    status_name=f"{PREFIX}status-{i % 3}",
+                )
+            )
+
+    await seed_lookups()
+    if cached:
+        # Same as startup
+        async with AsyncSessionLocal() as db:
+            await lookup_cache.load(db, LOOKUP_MODELS)
+
+    catalog = await run_concurrently(ops, concurrency, create_spool)
+    inventory = await run_concurrently(ops, concurrency, add_inventory)
+    return catalog, inventory
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        spool_ids = select(Spool.id).join(Color).where(Color.name.like(f"{PREFIX}%"))
+        inventory_ids = select(Inventory.id).where(Inventory.spool_id.in_(spool_ids))
+        await db.execute(
+            delete(ActivityLog).where(
+                ActivityLog.entity_id.in_(spool_ids)
+                | ActivityLog.entity_id.in_(inventory_ids)
+            )
+        )
+        await db.execute(delete(Inventory).where(Inventory.spool_id.in_(spool_ids)))
+        await db.execute(delete(Spool).where(Spool.id.in_(spool_ids)))
+        for model in LOOKUP_MODELS:
+            await db.execute(delete(model).where(model.name.like(f"{PREFIX}%")))
+        await db.commit()
+
+
+async def main_async(ops: int, concurrency: int) -> None:
+    # Leftovers of an interrupted run would collide with seed_lookups()
+    await cleanup()
+    for name, cached in [("no cache", False), ("lookup cache", True)]:
+        try:
+            catalog, inventory = await bench(ops, concurrency, cached)
+        finally:
+            await cleanup()
+        print(
+            f"{name:<13} catalog {catalog:7.1f} spools/s   "
+            f"inventory {inventory:7.1f} items/s"
+        )
+    print(f"cache hits={lookup_cache.hits} misses={lookup_cache.misses}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    create_tables()
+    asyncio.run(main_async(args.ops, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Pagination benchmark: OFFSET vs. keyset cursor at increasing page depth.
+
+Seeds `--rows` throwaway activity log entries, then times fetching page N
+(`--limit` rows each) both with OFFSET (BaseRepository.get_all) and with a
+cursor (BaseRepository.get_page). The cursor for page N is looked up
+beforehand, as a client paging through would already hold it. Deletes the
+seeded rows afterwards.
+
+Usage:
+    python -m benchmarks.pagination --rows 1000100 --pages 1 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import delete, select, text
+
+from app.core.pagination import encode_cursor
+from app.database import AsyncSessionLocal, create_tables
+from app.models.activity_log import ActivityLog
+from app.repositories.activity_log_repository import ActivityLogRepository
+
+ENTITY_TYPE = "benchmark"
+REPEAT = 20
+
+
+async def seed(rows: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            text(
+                """
+                INSERT INTO activity_logs (id, action_type, entity_type,
+                                           description, created_at)
+                SELECT gen_random_uuid()::text, 'created', :entity_type,
+                       'benchmark row', now() - (i || ' seconds')::interval
+                FROM generate_series(1, :rows) AS i
+                """
+            ),
+            {"entity_type": ENTITY_TYPE, "rows": rows},
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE activity_logs"))
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            delete(ActivityLog).where(ActivityLog.entity_type == ENTITY_TYPE)
+        )
+        await db.commit()
+
+
+async def timed(fn) -> float:
+    """Best of REPEAT runs, in ms"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def bench(limit: int, pages: list[int]) -> None:
+    async with AsyncSessionLocal() as db:
+        repo = ActivityLogRepository(db)
+        for page in pages:
+            skip = (page - 1) * limit
+            cursor = None
+            if skip:
+                # Key of the last row of the previous page
+                created_at, id = (
+                    await db.execute(
+                        select(ActivityLog.created_at, ActivityLog.id)
+                        .order_by(ActivityLog.created_at, ActivityLog.id)
+                        .offset(skip - 1)
+                        .limit(1)
+                    )
+                ).one()
+                cursor = encode_cursor(created_at, id)
+
+            offset_ms = await timed(lambda: repo.get_all(skip, limit))
+            keyset_ms = await timed(lambda: repo.get_page(limit, cursor))
+            # Same rows either way
+            by_offset = [log.id for log in await repo.get_all(skip, limit)]
+            by_cursor = [log.id for log in (await repo.get_page(limit, cursor))[0]]
+            assert by_offset == by_cursor
+
+            print(
+                f"page {page:>6}  offset {offset_ms:9.2f} ms   "
+                f"cursor {keyset_ms:7.2f} ms"
+            )
+
+
+async def main_async(rows: int, limit: int, pages: list[int]) -> None:
+    await cleanup()
+    await seed(rows)
+    try:
+        await bench(limit, pages)
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_100)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000, 10000])
+    args = parser.parse_args()
+
+    create_tables()
+    asyncio.run(main_async(args.rows, args.limit, args.pages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Barcode scan benchmark: the old three-call lookup vs. /api/scan.
+
+Seeds `--spools` throwaway spools with `--units` inventory units spread
+over them, then resolves `--scans` random barcodes
+  - the old way: find_by_barcode, then inventory by spool, then count
+    (three queries; three HTTP round trips for the scanner),
+  - with InventoryService.scan (one query),
+and reports the server-side time per scan. Deletes everything afterwards.
+
+Usage:
+    python -m benchmarks.scan --spools 50000 --units 200000 --scans 2000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import delete, select, text
+
+from app.database import AsyncSessionLocal, create_tables
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.status_repository import StatusRepository
+from app.services.inventory_service import InventoryService
+from app.services.status_service import StatusService
+
+PREFIX = "bench-scan"
+
+
+async def seed(spools: int, units: int) -> None:
+    async with AsyncSessionLocal() as db:
+        db.add_all(
+            [
+                Color(name=f"{PREFIX}-color", hex_code="#000000"),
+                Brand(name=f"{PREFIX}-brand"),
+                Material(name=f"{PREFIX}-material"),
+                Status(name=f"{PREFIX}-status"),
+            ]
+        )
+        await db.commit()
+        await db.execute(
+            text(
+                """
+                INSERT INTO spools (id, barcode, base_weight, is_box, spool_return,
+                                    color_id, brand_id, material_id,
+                                    created_at, updated_at)
+                SELECT gen_random_uuid()::text, 'BSCAN-' || i, 1000, false, false,
+                       (SELECT id FROM colors WHERE name = :prefix || '-color'),
+                       (SELECT id FROM brands WHERE name = :prefix || '-brand'),
+                       (SELECT id FROM materials WHERE name = :prefix || '-material'),
+                       now(), now()
+                FROM generate_series(1, :spools) AS i
+                """
+            ),
+            {"prefix": PREFIX, "spools": spools},
+        )
+        await db.execute(
+            text(
+                """
+                WITH s AS (SELECT array_agg(id) ids FROM spools
+                           WHERE barcode LIKE 'BSCAN-%')
+                INSERT INTO inventory (id, spool_id, weight, is_in_use, status_id,
+                                       created_at, updated_at)
+                SELECT gen_random_uuid()::text, s.ids[1 + i % :spools], 500,
+                       i % 7 = 0,
+                       (SELECT id FROM statuses WHERE name = :prefix || '-status'),
+                       now(), now()
+                FROM generate_series(1, :units) AS i, s
+                """
+            ),
+            {"prefix": PREFIX, "spools": spools, "units": units},
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE spools"))
+        await db.execute(text("ANALYZE inventory"))
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        spool_ids = select(Spool.id).where(Spool.barcode.like("BSCAN-%"))
+        await db.execute(delete(Inventory).where(Inventory.spool_id.in_(spool_ids)))
+        await db.execute(delete(Spool).where(Spool.barcode.like("BSCAN-%")))
+        for model in (Color, Brand, Material, Status):
+            await db.execute(delete(model).where(model.name.like(f"{PREFIX}-%")))
+        await db.commit()
+
+
+async def per_scan_ms(barcodes: list[str], resolve) -> float:
+    """Median server time per scan in ms"""
+    samples = []
+    async with AsyncSessionLocal() as db:
+        for barcode in barcodes:
+            start = time.perf_counter()
+            await resolve(db, barcode)
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def old_lookup(db, barcode: str) -> None:
+    spool = await SpoolRepository(db).find_by_barcode(barcode)
+    inventory_repo = InventoryRepository(db)
+    await inventory_repo.find_by_spool_id(spool.id)
+    await inventory_repo.count_by_spool_id(spool.id)
+
+
+async def scan(db, barcode: str) -> None:
+    service = InventoryService(
+        InventoryRepository(db),
+        SpoolRepository(db),
+        StatusService(StatusRepository(db)),
+    )
+    await service.scan(barcode)
+
+
+async def main_async(spools: int, units: int, scans: int) -> None:
+    await cleanup()
+    await seed(spools, units)
+    try:
+        rng = random.Random(42)
+        barcodes = [f"BSCAN-{rng.randint(1, spools)}" for _ in range(scans)]
+
+        old_ms = await per_scan_ms(barcodes, old_lookup)
+        scan_ms = await per_scan_ms(barcodes, scan)
+        print(f"old 3-query lookup   {old_ms:6.3f} ms/scan (+2 HTTP round trips)")
+        print(f"scan                 {scan_ms:6.3f} ms/scan")
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spools", type=int, default=50_000)
+    parser.add_argument("--units", type=int, default=200_000)
+    parser.add_argument("--scans", type=int, default=2000)
+    args = parser.parse_args()
+
+    create_tables()
+    asyncio.run(main_async(args.spools, args.units, args.scans))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Catalog search benchmark: ranked search latency on a large catalog.
+
+Seeds `--spools` throwaway spools spread over a few dozen colors, brands,
+materials and trade names, then times SpoolRepository.search for a mix of
+barcode fragments, exact barcodes and lookup names, next to the old
+unbounded `barcode ILIKE '%x%'` scan. Needs pg_trgm (create_tables sets up
+the extension and index). Deletes everything it created afterwards.
+
+Usage:
+    python -m benchmarks.spool_search --spools 500000 --limit 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import delete, select, text
+
+from app.database import AsyncSessionLocal, create_tables
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.trade_name import TradeName
+from app.repositories.spool_repository import SpoolRepository
+
+PREFIX = "bench"
+REPEAT = 20
+QUERIES = [
+    "0004217",  # barcode fragment
+    "BENCH-0123456",  # exact barcode
+    "bench-color-7",  # color name
+    "bench-material",  # matches every material
+    "bench-trade-2",  # trade name
+    "nothing-matches",
+]
+
+
+async def seed(spools: int) -> None:
+    async with AsyncSessionLocal() as db:
+        for model, name, count in [
+            (Color, "color", 24),
+            (Brand, "brand", 12),
+            (Material, "material", 8),
+            (TradeName, "trade", 6),
+        ]:
+            extra = {"hex_code": "#000000"} if model is Color else {}
+            db.add_all(
+                [model(name=f"{PREFIX}-{name}-{i}", **extra) for i in range(count)]
+            )
+        await db.commit()
+        await db.execute(
+            text(
+                """
+                WITH c AS (SELECT array_agg(id ORDER BY name) ids FROM colors
+                           WHERE name LIKE :prefix),
+                     b AS (SELECT array_agg(id ORDER BY name) ids FROM brands
+                           WHERE name LIKE :prefix),
+                     m AS (SELECT array_agg(id ORDER BY name) ids FROM materials
+                           WHERE name LIKE :prefix),
+                     t AS (SELECT array_agg(id ORDER BY name) ids FROM trade_names
+                           WHERE name LIKE :prefix)
+                INSERT INTO spools (id, barcode, base_weight, is_box, spool_return,
+                                    color_id, brand_id, material_id, trade_name_id,
+                                    created_at, updated_at)
+                SELECT gen_random_uuid()::text,
+                       'BENCH-' || lpad(i::text, 7, '0'), 1000, false, false,
+                       c.ids[1 + i % 24], b.ids[1 + i % 12],
+                       m.ids[1 + i % 8], t.ids[1 + i % 6],
+                       now() - (i || ' seconds')::interval, now()
+                FROM generate_series(1, :spools) AS i, c, b, m, t
+                """
+            ),
+            {"prefix": f"{PREFIX}-%", "spools": spools},
+        )
+        await db.commit()
+        await db.execute(text("ANALYZE spools"))
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Spool).where(Spool.barcode.like("BENCH-%")))
+        for model in (Color, Brand, Material, TradeName):
+            await db.execute(delete(model).where(model.name.like(f"{PREFIX}-%")))
+        await db.commit()
+
+
+async def timed(fn) -> tuple[float, int]:
+    """Median of REPEAT runs in ms, and the number of rows returned"""
+    samples, rows = [], 0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        rows = len(await fn())
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), rows
+
+
+async def bench(limit: int) -> None:
+    async with AsyncSessionLocal() as db:
+        spool_repo = SpoolRepository(db)
+
+        async def unbounded_scan(query: str):
+            # The old find_by_barcode_partial: no index, no limit
+            result = await db.execute(
+                select(Spool.id).where(Spool.barcode.ilike(f"%{query}%"))
+            )
+            return result.all()
+
+        for query in QUERIES:
+            search_ms, found = await timed(lambda: spool_repo.search(query, limit))
+            scan_ms, matched = await timed(lambda: unbounded_scan(query))
+            print(
+                f"{query!r:<20} search {search_ms:7.2f} ms ({found:>3} rows)   "
+                f"old ILIKE scan {scan_ms:8.2f} ms ({matched} rows)"
+            )
+
+
+async def main_async(spools: int, limit: int) -> None:
+    await cleanup()
+    await seed(spools)
+    try:
+        await bench(limit)
+    finally:
+        await cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spools", type=int, default=500_000)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    create_tables()
+    asyncio.run(main_async(args.spools, args.limit))
+
+
+if __name__ == "__main__":
+    main()
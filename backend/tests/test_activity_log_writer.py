@@ -0,0 +1,142 @@
+"""Tests for the buffered activity log writer"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from app.models.activity_log import ActivityLog
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.services.activity_log_service import (
+    ActionType,
+    ActivityLogService,
+    EntityType,
+)
+from app.services.activity_log_writer import ActivityLogWriter
+from tests.conftest import AsyncTestingSessionLocal, TestingSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+
+class DatabaseWriter(ActivityLogWriter):
+    """Writer that flushes through the test database"""
+
+    def _get_db(self):
+        return AsyncTestingSessionLocal()
+
+    def _get_sync_db(self):
+        return TestingSessionLocal()
+
+
+@pytest.fixture
+async def writer():
+    writer = DatabaseWriter(batch_size=3, flush_interval_ms=60_000, max_pending=5)
+    writer.start()
+    yield writer
+    await writer.stop()
+
+
+async def log(service: ActivityLogService, entity_id: str) -> ActivityLog:
+    return await service.log(
+        action_type=ActionType.INVENTORY_ADDED,
+        entity_type=EntityType.INVENTORY,
+        entity_id=entity_id,
+        description=f"Added {entity_id}",
+        metadata={"weight": 1000},
+    )
+
+
+async def count_logs() -> int:
+    # A separate session, so only committed rows count
+    async with AsyncTestingSessionLocal() as session:
+        return await session.scalar(
+            select(func.count(ActivityLog.id)).where(
+                ActivityLog.entity_id.like("unit-%")
+            )
+        )
+
+
+async def test_entries_are_buffered_after_commit_and_written_in_batches(db, writer):
+    """Nothing is queued before commit; a full batch is written right away"""
+    service = ActivityLogService(ActivityLogRepository(db), writer)
+    await log(service, "unit-1")
+    await log(service, "unit-2")
+    assert writer.pending == 0
+
+    await db.commit()
+    assert writer.pending == 2
+    assert await count_logs() == 0
+
+    await log(service, "unit-3")
+    await db.commit()
+    for _ in range(50):
+        if writer.written == 3:
+            break
+        await asyncio.sleep(0.02)
+    assert writer.written == 3
+    assert await count_logs() == 3
+
+
+async def test_rolled_back_entries_are_never_written(db, writer):
+    """The log of a change that rolled back is dropped with it"""
+    service = ActivityLogService(ActivityLogRepository(db), writer)
+    await log(service, "unit-1")
+    await db.rollback()
+
+    await writer.stop()
+    assert writer.written == 0
+    assert await count_logs() == 0
+
+
+async def test_stop_writes_what_is_left(db, writer):
+    """A graceful shutdown flushes a partial batch"""
+    service = ActivityLogService(ActivityLogRepository(db), writer)
+    await log(service, "unit-1")
+    await db.commit()
+
+    await writer.stop()
+    assert writer.pending == 0
+    assert await count_logs() == 1
+
+
+async def test_rows_committed_after_stop_are_written(db, writer):
+    """A transaction that logged before stop but commits after it loses nothing"""
+    service = ActivityLogService(ActivityLogRepository(db), writer)
+    await log(service, "unit-1")
+
+    await writer.stop()
+    await db.commit()
+
+    assert writer.pending == 0
+    assert await count_logs() == 1
+
+
+async def test_interval_flushes_partial_batches(db):
+    """A batch that never fills up is written after the flush interval"""
+    writer = DatabaseWriter(batch_size=100, flush_interval_ms=50)
+    writer.start()
+    try:
+        service = ActivityLogService(ActivityLogRepository(db), writer)
+        await log(service, "unit-1")
+        await db.commit()
+        for _ in range(50):
+            if writer.written:
+                break
+            await asyncio.sleep(0.02)
+        assert writer.written == 1
+    finally:
+        await writer.stop()
+
+
+async def test_full_buffer_and_stopped_writer_fall_back_to_sync_writes(db, writer):
+    """Entries are written in the caller's transaction when the writer can't take them"""
+    service = ActivityLogService(ActivityLogRepository(db), writer)
+    writer.max_pending = 0
+    await log(service, "unit-1")
+    await db.commit()
+    assert writer.pending == 0
+    assert await count_logs() == 1
+
+    await writer.stop()
+    await log(service, "unit-2")
+    await db.commit()
+    assert await count_logs() == 2
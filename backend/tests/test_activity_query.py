@@ -0,0 +1,183 @@
+"""Tests for JSONB activity log extra_data and the activity query API"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from app.main import app
+from app.core.dependencies import get_db
+from app.models.activity_log import ActivityLog
+from app.models.user import User, UserRole
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.services.activity_log_service import (
+    ActionType,
+    ActivityLogService,
+    EntityType,
+)
+from app.services.auth_service import create_access_token, get_password_hash
+from tests.conftest import override_get_db
+
+pytestmark = pytest.mark.anyio
+
+app.dependency_overrides[get_db] = override_get_db
+client = TestClient(app)
+
+
+@pytest.fixture
+async def logs(db):
+    """A spool, two of its inventory units and an unrelated unit, logged"""
+    service = ActivityLogService(ActivityLogRepository(db))
+    entries = [
+        (ActionType.SPOOL_CREATED, EntityType.SPOOL, "spool-a", None),
+        (
+            ActionType.INVENTORY_ADDED,
+            EntityType.INVENTORY,
+            "unit-1",
+            {"spool_id": "spool-a", "weight": 1000, "barcode": "QA-1"},
+        ),
+        (
+            ActionType.INVENTORY_ADDED,
+            EntityType.INVENTORY,
+            "unit-2",
+            {"spool_id": "spool-a", "weight": 750, "barcode": "QA-1"},
+        ),
+        (
+            ActionType.WEIGHT_UPDATED,
+            EntityType.INVENTORY,
+            "unit-1",
+            {"spool_id": "spool-a", "weight": {"old": 1000, "new": 800}},
+        ),
+        (
+            ActionType.INVENTORY_ADDED,
+            EntityType.INVENTORY,
+            "unit-3",
+            {"spool_id": "spool-b", "weight": 1000, "barcode": "QA-2"},
+        ),
+    ]
+    for action_type, entity_type, entity_id, metadata in entries:
+        await service.log(
+            action_type=action_type,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            description=f"{action_type} {entity_id}",
+            metadata=metadata,
+        )
+    await db.commit()
+    return service
+
+
+async def test_extra_data_is_stored_as_json(db, logs):
+    """Metadata round-trips as an object; no metadata is SQL NULL"""
+    log = await db.scalar(
+        select(ActivityLog).where(ActivityLog.action_type == ActionType.WEIGHT_UPDATED)
+    )
+    assert log.extra_data == {
+        "spool_id": "spool-a",
+        "weight": {"old": 1000, "new": 800},
+    }
+
+    spool_log = await db.scalar(
+        select(ActivityLog).where(ActivityLog.extra_data.is_(None))
+    )
+    assert spool_log.entity_id == "spool-a"
+
+
+async def test_non_ascii_extra_data(db, logs):
+    """Non-ASCII metadata is stored and matched whatever the database encoding"""
+    await logs.log(
+        action_type=ActionType.SPOOL_CREATED,
+        entity_type=EntityType.SPOOL,
+        entity_id="spool-c",
+        description="Created Grün",
+        metadata={"color": "Grün", "brand": "İzmir"},
+    )
+    await db.commit()
+
+    found, _ = await logs.query(contains={"color": "Grün"})
+    assert [log.extra_data["brand"] for log in found] == ["İzmir"]
+
+
+async def test_query_filters(db, logs):
+    """Containment, action type and spool filters combine"""
+    found, _ = await logs.query(contains={"barcode": "QA-1"})
+    assert {log.entity_id for log in found} == {"unit-1", "unit-2"}
+
+    found, _ = await logs.query(contains={"weight": {"new": 800}})
+    assert [log.action_type for log in found] == [ActionType.WEIGHT_UPDATED]
+
+    found, _ = await logs.query(spool_id="spool-a")
+    assert len(found) == 4
+    assert {log.entity_id for log in found} == {"spool-a", "unit-1", "unit-2"}
+
+    found, _ = await logs.query(
+        spool_id="spool-a", action_types=[ActionType.INVENTORY_ADDED]
+    )
+    assert {log.entity_id for log in found} == {"unit-1", "unit-2"}
+
+    found, _ = await logs.query(entity_type=EntityType.INVENTORY, entity_id="unit-3")
+    assert [log.extra_data["spool_id"] for log in found] == ["spool-b"]
+
+
+async def test_query_time_range_and_pages(db, logs):
+    """Bounds may be timezone-aware; pages continue without overlap"""
+    now = datetime.now(timezone.utc)
+    found, _ = await logs.query(since=now - timedelta(minutes=5))
+    assert len(found) == 5
+    found, _ = await logs.query(until=now - timedelta(minutes=5))
+    assert found == []
+    with pytest.raises(ValueError):
+        await logs.query(since=now, until=now - timedelta(minutes=5))
+
+    first, cursor = await logs.query(limit=3, spool_id="spool-a")
+    second, last = await logs.query(limit=3, cursor=cursor, spool_id="spool-a")
+    assert (len(first), len(second), last) == (3, 1, None)
+    assert not {log.id for log in first} & {log.id for log in second}
+
+
+async def test_activity_endpoint(db, logs):
+    """Filters come from query parameters; bad ones get a 400"""
+    user = User(
+        email="activity@example.com",
+        hashed_password=get_password_hash("secret-password"),
+        role=UserRole.VIEWER,
+    )
+    db.add(user)
+    await db.commit()
+    token = create_access_token(data={"user_id": user.id, "role": "VIEWER"})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get(
+        "/api/activity/",
+        params={"spool_id": "spool-a", "contains": '{"barcode": "QA-1"}', "limit": 1},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()[0]["extra_data"]["barcode"] == "QA-1"
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        "/api/activity/",
+        params={
+            "spool_id": "spool-a",
+            "contains": '{"barcode": "QA-1"}',
+            "cursor": cursor,
+        },
+        headers=headers,
+    )
+    assert len(response.json()) == 1
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get(
+        "/api/activity/",
+        params=[
+            ("action_type", ActionType.SPOOL_CREATED),
+            ("action_type", ActionType.WEIGHT_UPDATED),
+        ],
+        headers=headers,
+    )
+    assert {log["entity_id"] for log in response.json()} >= {"spool-a", "unit-1"}
+
+    for params in ({"contains": "[1]"}, {"contains": "{"}, {"cursor": "nope"}):
+        response = client.get("/api/activity/", params=params, headers=headers)
+        assert response.status_code == 400
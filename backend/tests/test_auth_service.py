@@ -0,0 +1,63 @@
+"""Tests for AuthService password handling"""
+
+import threading
+import pytest
+from passlib.context import CryptContext
+from app.core.config import settings
+from app.models.user import User, UserRole
+from app.services import auth_service as auth_module
+from app.services.auth_service import AuthService, pwd_context
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_user(db, password_hash: str) -> User:
+    user = User(
+        email="hash-cost@example.com",
+        hashed_password=password_hash,
+        role=UserRole.VIEWER,
+    )
+    db.add(user)
+    await db.commit()
+    return user
+
+
+async def test_login_rehashes_password_with_changed_cost(db):
+    """A hash made with another bcrypt cost is replaced on successful login"""
+    old_context = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=4)
+    user = await create_user(db, old_context.hash("secret-password"))
+
+    authenticated = await AuthService(db).authenticate_user(
+        "hash-cost@example.com", "secret-password"
+    )
+
+    assert authenticated.id == user.id
+    await db.refresh(user)
+    assert pwd_context.identify(user.hashed_password) == "bcrypt"
+    assert f"${settings.BCRYPT_ROUNDS:02d}$" in user.hashed_password
+    assert pwd_context.verify("secret-password", user.hashed_password)
+
+
+async def test_wrong_password_keeps_hash(db):
+    """Failed logins neither authenticate nor touch the stored hash"""
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=4).hash("a")
+    user = await create_user(db, old_hash)
+
+    assert await AuthService(db).authenticate_user(user.email, "b") is None
+    await db.refresh(user)
+    assert user.hashed_password == old_hash
+
+
+async def test_password_work_runs_off_the_event_loop(monkeypatch):
+    """bcrypt calls run on the password pool, not the event loop thread"""
+    threads = []
+
+    def fake_hash(password: str) -> str:
+        threads.append(threading.current_thread())
+        return "hashed"
+
+    monkeypatch.setattr(auth_module, "get_password_hash", fake_hash)
+
+    assert await auth_module.hash_password("secret") == "hashed"
+    assert threads[0] is not threading.main_thread()
+    assert threads[0].name.startswith("bcrypt")
@@ -0,0 +1,76 @@
+"""Tests for DashboardService inventory statistics"""
+
+import pytest
+from app.models.color import Color
+from app.models.brand import Brand
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.models.inventory import Inventory
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.insight_repository import InsightRepository
+from app.services.dashboard_service import DashboardService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def dashboard_service(db):
+    return DashboardService(
+        inventory_repo=InventoryRepository(db),
+        activity_log_repo=ActivityLogRepository(db),
+        insight_repo=InsightRepository(db),
+    )
+
+
+async def create_spool(db, barcode: str, base_weight: float) -> Spool:
+    spool = Spool(
+        barcode=barcode,
+        base_weight=base_weight,
+        color=Color(name=f"Stats Color {barcode}", hex_code="#123456"),
+        brand=Brand(name=f"Stats Brand {barcode}"),
+        material=Material(name=f"Stats Material {barcode}"),
+    )
+    db.add(spool)
+    await db.flush()
+    return spool
+
+
+async def test_inventory_stats_empty(dashboard_service):
+    """Stats on an empty inventory are all zero"""
+    stats = await dashboard_service.get_inventory_stats()
+
+    assert stats.total_spools == 0
+    assert stats.total_weight == 0
+    assert stats.spools_in_use == 0
+    assert stats.low_stock_count == 0
+
+
+async def test_inventory_stats_aggregates(db, dashboard_service):
+    """Count, weight, in-use and low-stock are computed in one query"""
+    status = Status(name="stats_in_stock")
+    db.add(status)
+    spool_1kg = await create_spool(db, "STATS-1KG", 1000.0)
+    spool_250g = await create_spool(db, "STATS-250G", 250.0)
+
+    db.add_all(
+        [
+            Inventory(spool_id=spool_1kg.id, weight=1000.0, status=status),
+            # 150g of 1000g is below the 20% threshold
+            Inventory(
+                spool_id=spool_1kg.id, weight=150.0, is_in_use=True, status=status
+            ),
+            # 100g of 250g is above the 20% threshold
+            Inventory(spool_id=spool_250g.id, weight=100.0, status=status),
+            Inventory(spool_id=spool_250g.id, weight=20.0, status=status),
+        ]
+    )
+    await db.commit()
+
+    stats = await dashboard_service.get_inventory_stats()
+
+    assert stats.total_spools == 4
+    assert stats.total_weight == 1270.0
+    assert stats.spools_in_use == 1
+    assert stats.low_stock_count == 2
@@ -0,0 +1,234 @@
+"""Tests for per-request database session usage"""
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select, text
+from starlette.applications import Starlette
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+from app.main import app
+from app.core.config import settings
+from app.core.db_metrics import DbUsageMiddleware
+from app.core.dependencies import get_db
+from app.models.activity_log import ActivityLog
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.models.user import User, UserRole
+from app.services.auth_service import create_access_token, get_password_hash
+from tests.conftest import AsyncTestingSessionLocal, override_get_db
+
+app.dependency_overrides[get_db] = override_get_db
+client = TestClient(app)
+
+
+@pytest.fixture
+async def auth_headers(db):
+    """Create an admin user and return a bearer token header for it"""
+    user = User(
+        email="db-usage@example.com",
+        hashed_password=get_password_hash("secret-password"),
+        role=UserRole.ADMIN,
+    )
+    db.add(user)
+    await db.commit()
+    token = create_access_token(data={"user_id": user.id, "role": "ADMIN"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(autouse=True)
+def db_usage_headers(monkeypatch):
+    monkeypatch.setattr(settings, "DB_USAGE_HEADERS", True)
+
+
+@pytest.mark.anyio
+async def test_authenticated_request_checks_out_one_connection(auth_headers):
+    """Auth and repositories share the request session"""
+    response = client.get("/api/inventory/", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["X-DB-Checkouts"] == "1"
+
+
+@pytest.mark.anyio
+async def test_dashboard_checks_out_one_connection(auth_headers):
+    """Several repositories behind one service still share one connection"""
+    response = client.get("/api/dashboard/", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["X-DB-Checkouts"] == "1"
+
+
+def test_unauthenticated_request_checks_out_nothing():
+    """Requests rejected by auth never touch the pool"""
+    response = client.get("/api/inventory/")
+
+    assert response.status_code == 401
+    assert response.headers["X-DB-Checkouts"] == "0"
+
+
+@pytest.fixture
+async def writer(db):
+    """An admin token plus a spool type and a status to write inventory with"""
+    user = User(
+        email="db-writer@example.com",
+        hashed_password=get_password_hash("secret-password"),
+        role=UserRole.ADMIN,
+    )
+    color = Color(name="Usage Grey", hex_code="#808080")
+    brand, material = Brand(name="Usage Brand"), Material(name="Usage PLA")
+    db.add_all([user, color, brand, material, Status(name="usage_stock")])
+    await db.flush()
+    spool = Spool(
+        barcode="USAGE-1",
+        base_weight=1000,
+        color_id=color.id,
+        brand_id=brand.id,
+        material_id=material.id,
+    )
+    db.add(spool)
+    await db.commit()
+    token = create_access_token(data={"user_id": user.id, "role": "ADMIN"})
+    headers = {"Authorization": f"Bearer {token}"}
+    # Warm the user and lookup caches, so the counts below are steady state
+    client.post(
+        "/api/inventory/",
+        json={"spool_id": spool.id, "status_name": "usage_stock"},
+        headers=headers,
+    )
+    return {"headers": headers, "spool_id": spool.id}
+
+
+def statements(response) -> tuple:
+    return (
+        int(response.headers["X-DB-Statements"]),
+        int(response.headers["X-DB-Commits"]),
+    )
+
+
+@pytest.mark.anyio
+async def test_add_to_inventory_commits_once(writer):
+    """SELECT spool, INSERT unit, INSERT activity log, one commit"""
+    response = client.post(
+        "/api/inventory/",
+        json={"spool_id": writer["spool_id"], "status_name": "usage_stock"},
+        headers=writer["headers"],
+    )
+
+    assert response.status_code == 201
+    assert response.json()["spool"]["color"]["name"] == "Usage Grey"
+    assert statements(response) == (3, 1)
+
+
+@pytest.mark.anyio
+async def test_update_inventory_commits_once(writer):
+    """SELECT unit, UPDATE unit, INSERT activity log, one commit"""
+    created = client.post(
+        "/api/inventory/",
+        json={"spool_id": writer["spool_id"], "status_name": "usage_stock"},
+        headers=writer["headers"],
+    ).json()
+
+    response = client.patch(
+        f"/api/inventory/{created['id']}",
+        json={"weight": 700, "status_name": "usage_stock"},
+        headers=writer["headers"],
+    )
+
+    assert response.status_code == 200
+    assert response.json()["weight"] == 700
+    assert statements(response) == (3, 1)
+
+
+@pytest.mark.anyio
+async def test_delete_inventory_commits_once(writer):
+    """SELECT unit, DELETE unit, INSERT activity log, one commit"""
+    created = client.post(
+        "/api/inventory/",
+        json={"spool_id": writer["spool_id"], "status_name": "usage_stock"},
+        headers=writer["headers"],
+    ).json()
+
+    response = client.delete(
+        f"/api/inventory/{created['id']}", headers=writer["headers"]
+    )
+
+    assert response.status_code == 204
+    assert statements(response) == (3, 1)
+
+
+@pytest.mark.anyio
+async def test_create_spool_commits_once(writer):
+    """Barcode check, INSERT spool, INSERT activity log, one commit"""
+    response = client.post(
+        "/api/spools/",
+        json={
+            "barcode": "USAGE-2",
+            "base_weight": 750,
+            "color_name": "Usage Grey",
+            "brand_name": "Usage Brand",
+            "material_name": "Usage PLA",
+        },
+        headers=writer["headers"],
+    )
+
+    assert response.status_code == 201
+    assert response.json()["brand"]["name"] == "Usage Brand"
+    # Color, brand and material come from the lookup cache after one miss each
+    assert statements(response)[1] == 1
+
+
+@pytest.mark.anyio
+async def test_failed_request_leaves_nothing_behind(db, writer, monkeypatch):
+    """A unit whose activity log cannot be written is not added either"""
+
+    async def fail(*args, **kwargs):
+        raise RuntimeError("audit log unavailable")
+
+    monkeypatch.setattr(
+        "app.services.activity_log_service.ActivityLogService.log", fail
+    )
+    units = await db.scalar(select(func.count(Inventory.id)))
+    logs = await db.scalar(select(func.count(ActivityLog.id)))
+
+    response = client.post(
+        "/api/inventory/",
+        json={"spool_id": writer["spool_id"], "status_name": "usage_stock"},
+        headers=writer["headers"],
+    )
+
+    assert response.status_code == 500
+    assert statements(response)[1] == 0
+    assert await db.scalar(select(func.count(Inventory.id))) == units
+    assert await db.scalar(select(func.count(ActivityLog.id))) == logs
+
+
+def test_streamed_work_is_counted_after_the_body(caplog):
+    """Work done while a body streams is checked once the last chunk is sent"""
+
+    async def body():
+        for _ in range(2):
+            async with AsyncTestingSessionLocal() as session:
+                await session.execute(text("SELECT 1"))
+                await session.commit()
+            yield b"chunk\n"
+
+    async def stream(request):
+        return StreamingResponse(body())
+
+    streaming_app = Starlette(routes=[Route("/stream", stream)])
+    streaming_app.add_middleware(DbUsageMiddleware)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.db_metrics"):
+        response = TestClient(streaming_app).get("/stream")
+
+    assert response.text == "chunk\nchunk\n"
+    # The headers went out before the body, so they can't include it
+    assert response.headers["X-DB-Commits"] == "0"
+    assert "GET /stream checked out 2 pooled connections" in caplog.text
+    assert "GET /stream committed 2 transactions" in caplog.text
@@ -0,0 +1,94 @@
+"""Tests for streaming CSV/NDJSON exports"""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.dependencies import get_db
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.models.user import User, UserRole
+from app.services.auth_service import create_access_token, get_password_hash
+from tests.conftest import override_get_db
+
+pytestmark = pytest.mark.anyio
+
+app.dependency_overrides[get_db] = override_get_db
+client = TestClient(app)
+
+
+@pytest.fixture
+async def catalog(db):
+    """Two spools, one of them with an inventory unit, and an admin token"""
+    color = Color(name="Export Blue", hex_code="#0000FF")
+    brand, material = Brand(name="Export Brand"), Material(name="Export PLA")
+    status = Status(name="export_in_stock")
+    user = User(
+        email="export@example.com",
+        hashed_password=get_password_hash("secret-password"),
+        role=UserRole.ADMIN,
+    )
+    db.add_all([color, brand, material, status, user])
+    await db.flush()
+    spools = [
+        Spool(
+            barcode=f"EXP-{i}",
+            base_weight=1000,
+            color_id=color.id,
+            brand_id=brand.id,
+            material_id=material.id,
+        )
+        for i in range(2)
+    ]
+    db.add_all(spools)
+    await db.flush()
+    db.add(Inventory(spool_id=spools[0].id, weight=640, status_id=status.id))
+    await db.commit()
+    token = create_access_token(data={"user_id": user.id, "role": "ADMIN"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def test_spool_export_csv(db, catalog):
+    """Header row plus one flat row per spool, oldest first"""
+    response = client.get("/api/spools/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="spools.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["barcode"] for row in rows] == ["EXP-0", "EXP-1"]
+    assert rows[0]["color"] == "Export Blue"
+    assert rows[0]["trade_name"] == ""
+
+
+async def test_spool_export_ndjson_gzip(db, catalog):
+    """NDJSON, gzipped on the fly, one JSON object per line"""
+    response = client.get("/api/spools/export?format=ndjson&gzip=true")
+
+    assert response.status_code == 200
+    assert 'filename="spools.ndjson.gz"' in response.headers["content-disposition"]
+    lines = gzip.decompress(response.content).decode().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [record["barcode"] for record in records] == ["EXP-0", "EXP-1"]
+    assert records[0]["base_weight"] == 1000
+    assert records[0]["trade_name"] is None
+
+
+async def test_inventory_export(db, catalog):
+    """Inventory rows carry the spool barcode and lookup names"""
+    response = client.get("/api/inventory/export", headers=catalog)
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["barcode"] == "EXP-0"
+    assert rows[0]["status"] == "export_in_stock"
+    assert float(rows[0]["weight"]) == 640
@@ -0,0 +1,104 @@
+"""Tests for bulk inventory intake"""
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from app.models.activity_log import ActivityLog
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.status_repository import StatusRepository
+from app.schemas.inventory import MAX_BULK_UNITS, InventoryBulkCreate
+from app.services.activity_log_service import ActivityLogService
+from app.services.inventory_service import InventoryService
+from app.services.status_service import StatusService
+
+pytestmark = pytest.mark.anyio
+
+
+def inventory_service(db) -> InventoryService:
+    return InventoryService(
+        InventoryRepository(db),
+        SpoolRepository(db),
+        StatusService(StatusRepository(db)),
+        ActivityLogService(ActivityLogRepository(db)),
+    )
+
+
+@pytest.fixture
+async def spools(db):
+    """Two spool types to receive"""
+    color = Color(name="Bulk Green", hex_code="#00FF00")
+    brand, material = Brand(name="Bulk Brand"), Material(name="Bulk PLA")
+    db.add_all([color, brand, material])
+    await db.flush()
+    spools = [
+        Spool(
+            barcode=f"BULK-{i}",
+            base_weight=1000,
+            color_id=color.id,
+            brand_id=brand.id,
+            material_id=material.id,
+        )
+        for i in range(2)
+    ]
+    db.add_all(spools)
+    await db.commit()
+    return spools
+
+
+async def count(db, model) -> int:
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+async def test_bulk_adds_units_and_activity_logs(db, spools):
+    """N units of spool X, plus single units, in one call"""
+    first, second = spools
+    data = InventoryBulkCreate(
+        items=[
+            {"spool_id": first.id, "quantity": 3},
+            {"spool_id": second.id, "weight": 400, "status_name": "bulk_opened"},
+        ]
+    )
+
+    ids = await inventory_service(db).add_bulk(data)
+
+    assert len(ids) == len(set(ids)) == 4
+    units = {
+        unit.id: unit
+        for unit in (await db.execute(select(Inventory))).scalars().unique()
+    }
+    assert set(units) == set(ids)
+    assert [units[i].weight for i in ids] == [1000, 1000, 1000, 400]
+    assert units[ids[-1]].status.name == "bulk_opened"
+    logged = await db.scalars(select(ActivityLog.entity_id))
+    assert set(logged) == set(ids)
+
+
+async def test_bulk_with_unknown_spool_adds_nothing(db, spools):
+    """One bad spool id rejects the whole request"""
+    data = InventoryBulkCreate(
+        items=[{"spool_id": spools[0].id}, {"spool_id": "no-such-spool"}]
+    )
+
+    with pytest.raises(ValueError, match="no-such-spool"):
+        await inventory_service(db).add_bulk(data)
+
+    assert await count(db, Inventory) == 0
+    assert await count(db, ActivityLog) == 0
+
+
+def test_bulk_request_is_capped():
+    """More than MAX_BULK_UNITS units in one request is rejected"""
+    with pytest.raises(ValidationError):
+        InventoryBulkCreate(
+            items=[
+                {"spool_id": "a", "quantity": MAX_BULK_UNITS},
+                {"spool_id": "b", "quantity": 1},
+            ]
+        )
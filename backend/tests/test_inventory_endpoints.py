@@ -4,7 +4,7 @@ import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 from app.core.dependencies import get_db
-from tests.conftest import TestingSessionLocal, Base, engine
+from tests.conftest import Base, engine, override_get_db
 
 # Import all models
 from app.models.color import Color
@@ -21,14 +21,6 @@ Base.metadata.create_all(bind=engine)
 
 
 # Override dependency
-def override_get_db():
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 app.dependency_overrides[get_db] = override_get_db
 client = TestClient(app)
 
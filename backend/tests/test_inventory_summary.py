@@ -0,0 +1,76 @@
+"""Tests for the grouped per-spool inventory summary"""
+
+import pytest
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.repositories.inventory_repository import InventoryRepository
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def stock(db):
+    """A PLA spool with three units and a PETG spool with one"""
+    color = Color(name="Summary Black", hex_code="#000000")
+    brand = Brand(name="Summary Brand")
+    pla, petg = Material(name="Summary PLA"), Material(name="Summary PETG")
+    in_stock, in_use = Status(name="summary_stock"), Status(name="summary_use")
+    db.add_all([color, brand, pla, petg, in_stock, in_use])
+    await db.flush()
+    spools = {}
+    for material in (pla, petg):
+        spools[material.name] = Spool(
+            barcode=f"SUM-{material.name}",
+            base_weight=1000,
+            color_id=color.id,
+            brand_id=brand.id,
+            material_id=material.id,
+        )
+    db.add_all(spools.values())
+    await db.flush()
+    pla_id, petg_id = spools["Summary PLA"].id, spools["Summary PETG"].id
+    db.add_all(
+        [
+            Inventory(spool_id=pla_id, weight=1000, status_id=in_stock.id),
+            Inventory(spool_id=pla_id, weight=150, status_id=in_stock.id),
+            Inventory(spool_id=pla_id, weight=600, is_in_use=True, status_id=in_use.id),
+            Inventory(spool_id=petg_id, weight=900, status_id=in_stock.id),
+        ]
+    )
+    await db.commit()
+    return pla_id, petg_id
+
+
+async def test_summary_groups_units_per_spool(db, stock):
+    """Counts, weight, in-use and low-stock units per spool in one query"""
+    pla_id, petg_id = stock
+
+    summary = await InventoryRepository(db).get_summary_by_spool()
+
+    by_spool = {row["spool_id"]: row for row in summary}
+    assert by_spool[pla_id] == {
+        "spool_id": pla_id,
+        "units": 3,
+        "total_weight": 1750,
+        "in_use_count": 1,
+        "low_stock_count": 1,
+    }
+    assert by_spool[petg_id]["units"] == 1
+
+
+async def test_summary_filters(db, stock):
+    """Material filters spools, status filters which units count"""
+    pla_id, petg_id = stock
+    inventory_repo = InventoryRepository(db)
+
+    by_material = await inventory_repo.get_summary_by_spool(material="summary petg")
+    by_status = await inventory_repo.get_summary_by_spool(status="summary_use")
+    by_brand = await inventory_repo.get_summary_by_spool(brand="No Such Brand")
+
+    assert [row["spool_id"] for row in by_material] == [petg_id]
+    assert [(row["spool_id"], row["units"]) for row in by_status] == [(pla_id, 1)]
+    assert by_brand == []
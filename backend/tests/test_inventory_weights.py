@@ -0,0 +1,134 @@
+"""Tests for batch weight updates from scale stations"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from app.models.activity_log import ActivityLog
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.status_repository import StatusRepository
+from app.schemas.inventory import WeightBatchUpdate
+from app.services.activity_log_service import ActionType, ActivityLogService
+from app.services.inventory_service import InventoryService
+from app.services.status_service import StatusService
+from tests.conftest import AsyncTestingSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+
+def inventory_service(db) -> InventoryService:
+    return InventoryService(
+        InventoryRepository(db),
+        SpoolRepository(db),
+        StatusService(StatusRepository(db)),
+        ActivityLogService(ActivityLogRepository(db)),
+    )
+
+
+@pytest.fixture
+async def shelf(db):
+    """Three units of one spool type, 1000g each"""
+    color = Color(name="Scale White", hex_code="#FFFFFF")
+    brand, material = Brand(name="Scale Brand"), Material(name="Scale PLA")
+    status = Status(name="scale_in_stock")
+    db.add_all([color, brand, material, status])
+    await db.flush()
+    spool = Spool(
+        barcode="SCALE-1",
+        base_weight=1000,
+        color_id=color.id,
+        brand_id=brand.id,
+        material_id=material.id,
+    )
+    db.add(spool)
+    await db.flush()
+    units = [
+        Inventory(spool_id=spool.id, weight=1000, status_id=status.id) for _ in range(3)
+    ]
+    db.add_all(units)
+    await db.commit()
+    return [unit.id for unit in units]
+
+
+async def weights(db, ids) -> list:
+    result = await db.execute(select(Inventory.id, Inventory.weight))
+    by_id = dict(result.all())
+    return [by_id[i] for i in ids]
+
+
+async def test_batch_applies_readings_and_logs_changes(db, shelf):
+    """Changed weights are saved with old values and logged; same weight is not"""
+    data = WeightBatchUpdate(
+        readings=[
+            {"id": shelf[0], "weight": 750},
+            {"id": shelf[1], "weight": 1200},
+            {"id": shelf[2], "weight": 1000},
+        ]
+    )
+
+    results = await inventory_service(db).update_weights(data)
+
+    assert [(r["updated"], r["old_weight"], r["weight"]) for r in results] == [
+        (True, 1000, 750),
+        (True, 1000, 1200),
+        (True, 1000, 1000),
+    ]
+    db.expire_all()
+    assert await weights(db, shelf) == [750, 1200, 1000]
+    logs = {
+        log.entity_id: log
+        for log in (await db.execute(select(ActivityLog))).scalars().all()
+    }
+    assert set(logs) == {shelf[0], shelf[1]}
+    assert logs[shelf[0]].action_type == ActionType.WEIGHT_UPDATED
+    assert logs[shelf[0]].description.startswith("Used 250.0g of Scale White")
+    assert logs[shelf[1]].action_type == ActionType.INVENTORY_UPDATED
+
+
+async def test_unknown_and_repeated_items_fail_alone(db, shelf):
+    """Bad readings are reported per item; the good ones are still saved"""
+    data = WeightBatchUpdate(
+        readings=[
+            {"id": shelf[0], "weight": 900},
+            {"id": "no-such-item", "weight": 500},
+            {"id": shelf[0], "weight": 800},
+        ]
+    )
+
+    results = await inventory_service(db).update_weights(data)
+
+    assert [r["updated"] for r in results] == [False, False, True]
+    assert "Superseded" in results[0]["error"]
+    assert "not found" in results[1]["error"]
+    db.expire_all()
+    assert await weights(db, shelf[:1]) == [800]
+
+
+async def test_overlapping_batches_see_committed_weights(db, shelf):
+    """A batch that waited for another one logs the change from its weight"""
+    first = inventory_service(db)
+    await first.inventory_repo.update_weights({shelf[0]: 800, shelf[1]: 900})
+
+    async with AsyncTestingSessionLocal() as other:
+        # Blocks on the row locks until the first batch commits
+        second = asyncio.create_task(
+            inventory_service(other).update_weights(
+                WeightBatchUpdate(readings=[{"id": shelf[0], "weight": 600}])
+            )
+        )
+        await asyncio.sleep(0.2)
+        assert not second.done()
+        await db.commit()
+        results = await second
+
+    assert (results[0]["old_weight"], results[0]["weight"]) == (800, 600)
+    log = await db.scalar(select(ActivityLog).where(ActivityLog.entity_id == shelf[0]))
+    assert log.description.startswith("Used 200.0g")
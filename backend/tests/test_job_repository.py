@@ -0,0 +1,151 @@
+"""Tests for JobRepository job claiming"""
+
+import asyncio
+from datetime import datetime, timedelta
+import asyncpg
+import pytest
+from app.models.job import Job, JobPriority, JobStatus, JobType
+from app.repositories.job_repository import JOB_NOTIFY_CHANNEL, JobRepository
+from tests.conftest import AsyncTestingSessionLocal, SQLALCHEMY_TEST_DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_ready_jobs(db, count: int) -> list[str]:
+    jobs = [
+        Job(job_type=JobType.GENERATE_INSIGHTS, status=JobStatus.READY)
+        for _ in range(count)
+    ]
+    db.add_all(jobs)
+    await db.commit()
+    return [job.id for job in jobs]
+
+
+async def test_claim_next_marks_job_processing(db):
+    """Claiming returns the oldest ready job and marks it as processing"""
+    job_ids = await create_ready_jobs(db, 2)
+    job_repo = JobRepository(db)
+
+    job = await job_repo.claim_next()
+
+    assert job.id in job_ids
+    assert job.status == JobStatus.PROCESSING
+    assert job.started_at is not None
+
+
+async def test_claim_next_orders_by_priority_and_skips_future_jobs(db):
+    """Higher priority first; jobs scheduled in the future are not claimed"""
+    now = datetime.utcnow()
+    low = Job(job_type=JobType.GENERATE_INSIGHTS, priority=JobPriority.LOW)
+    high = Job(job_type=JobType.GENERATE_INSIGHTS, priority=JobPriority.HIGH)
+    delayed = Job(
+        job_type=JobType.GENERATE_INSIGHTS,
+        priority=JobPriority.HIGH,
+        run_at=now + timedelta(minutes=5),
+    )
+    db.add_all([low, delayed, high])
+    await db.commit()
+    job_repo = JobRepository(db)
+
+    claimed = [await job_repo.claim_next() for _ in range(3)]
+
+    assert [job and job.id for job in claimed] == [high.id, low.id, None]
+    assert await job_repo.next_run_at() == delayed.run_at
+
+
+async def test_claim_next_empty_queue(db):
+    """Claiming from an empty queue returns None"""
+    job_repo = JobRepository(db)
+
+    assert await job_repo.claim_next() is None
+
+
+async def test_concurrent_claims_are_exactly_once(db):
+    """Concurrent workers never claim the same job twice"""
+    job_ids = await create_ready_jobs(db, 50)
+    claimed: list[str] = []
+
+    async def worker():
+        # Every worker uses its own session/connection, like separate processes
+        async with AsyncTestingSessionLocal() as session:
+            job_repo = JobRepository(session)
+            while job := await job_repo.claim_next():
+                claimed.append(job.id)
+                # Yield so the workers interleave
+                await asyncio.sleep(0)
+
+    await asyncio.gather(*[worker() for _ in range(8)])
+
+    assert len(claimed) == len(set(claimed))
+    assert sorted(claimed) == sorted(job_ids)
+
+
+async def test_create_notifies_listeners(db):
+    """Committing a new job sends its id to workers listening for new jobs"""
+    received = asyncio.Queue()
+    conn = await asyncpg.connect(SQLALCHEMY_TEST_DATABASE_URL)
+    try:
+        await conn.add_listener(
+            JOB_NOTIFY_CHANNEL,
+            lambda _conn, _pid, _channel, payload: received.put_nowait(payload),
+        )
+        job_repo = JobRepository(db)
+
+        job = await job_repo.create(Job(job_type=JobType.GENERATE_INSIGHTS))
+        await job_repo.commit()
+
+        assert await asyncio.wait_for(received.get(), timeout=5) == job.id
+    finally:
+        await conn.close()
+
+
+async def test_create_unique_skips_duplicate_dedup_key(db):
+    """A second job with the same dedup key is not enqueued"""
+    job_repo = JobRepository(db)
+    dedup_key = "daily_insights:2024-12-16"
+
+    first = await job_repo.create_unique(
+        Job(job_type=JobType.GENERATE_INSIGHTS, dedup_key=dedup_key)
+    )
+    second = await job_repo.create_unique(
+        Job(job_type=JobType.GENERATE_INSIGHTS, dedup_key=dedup_key)
+    )
+
+    assert first is not None
+    assert first.status == JobStatus.READY
+    assert second is None
+    assert [job.id for job in await job_repo.get_recent_jobs()] == [first.id]
+
+
+async def test_requeue_expired_counts_a_retry(db):
+    """Jobs with an expired heartbeat go back to ready, or fail when out of retries"""
+    stale = datetime.utcnow() - timedelta(minutes=10)
+    retryable = Job(
+        job_type=JobType.GENERATE_INSIGHTS,
+        status=JobStatus.PROCESSING,
+        heartbeat_at=stale,
+    )
+    exhausted = Job(
+        job_type=JobType.GENERATE_INSIGHTS,
+        status=JobStatus.PROCESSING,
+        heartbeat_at=stale,
+        retry_count=1,
+        max_retries=2,
+    )
+    alive = Job(
+        job_type=JobType.GENERATE_INSIGHTS,
+        status=JobStatus.PROCESSING,
+        heartbeat_at=datetime.utcnow(),
+    )
+    db.add_all([retryable, exhausted, alive])
+    await db.commit()
+    job_repo = JobRepository(db)
+
+    reaped = await job_repo.requeue_expired(timeout_seconds=60)
+
+    assert sorted(reaped) == sorted([retryable.id, exhausted.id])
+    for job in (retryable, exhausted, alive):
+        await db.refresh(job)
+    assert (retryable.status, retryable.retry_count) == (JobStatus.READY, 1)
+    assert (exhausted.status, exhausted.retry_count) == (JobStatus.FAILED, 2)
+    assert alive.status == JobStatus.PROCESSING
@@ -0,0 +1,171 @@
+"""Tests for JobWorker concurrency"""
+
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import func, select
+from app.core.config import settings
+from app.models.insight import Insight
+from app.models.job import Job, JobStatus, JobType
+from app.services.ai_insights_service import AIInsightsService
+from app.services.job_worker import JobWorker, retry_backoff
+from tests.conftest import AsyncTestingSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingWorker(JobWorker):
+    """Worker whose jobs sleep briefly and record how many ran at once"""
+
+    def __init__(self, job_seconds: float = 0.2, **kwargs):
+        super().__init__(poll_interval=0.05, listen=False, **kwargs)
+        self.job_seconds = job_seconds
+        self.running = Counter()
+        self.peak = Counter()
+        self.completed = 0
+
+    def _get_db(self):
+        return AsyncTestingSessionLocal()
+
+    async def process_job(self, job, db):
+        self.running[job.job_type] += 1
+        self.running["total"] += 1
+        for key in (job.job_type, "total"):
+            self.peak[key] = max(self.peak[key], self.running[key])
+        await asyncio.sleep(self.job_seconds)
+        self.running[job.job_type] -= 1
+        self.running["total"] -= 1
+        job.status = JobStatus.COMPLETED
+        await db.commit()
+        self.completed += 1
+
+
+async def run_until_done(worker: RecordingWorker, count: int) -> None:
+    worker.start()
+    try:
+        for _ in range(200):
+            if worker.completed >= count:
+                return
+            await asyncio.sleep(0.05)
+        raise AssertionError(f"only {worker.completed}/{count} jobs completed")
+    finally:
+        await worker.stop()
+
+
+async def test_worker_respects_slots_and_type_limits(db):
+    """No more than `concurrency` jobs run at once, and capped types stay capped"""
+    db.add_all(
+        [Job(job_type="slow", status=JobStatus.READY) for _ in range(4)]
+        + [Job(job_type="fast", status=JobStatus.READY) for _ in range(4)]
+    )
+    await db.commit()
+    worker = RecordingWorker(concurrency=4, type_limits={"slow": 1})
+
+    await run_until_done(worker, 8)
+
+    assert worker.peak["slow"] == 1
+    assert worker.peak["total"] == 4
+
+
+async def start_with_job(worker: RecordingWorker, db) -> Job:
+    """Enqueue one job, start the worker and wait until the job is running"""
+    job = Job(job_type="slow", status=JobStatus.READY)
+    db.add(job)
+    await db.commit()
+    worker.start()
+    while worker.running["total"] == 0:
+        await asyncio.sleep(0.01)
+    return job
+
+
+async def job_status(job_id: str) -> str:
+    async with AsyncTestingSessionLocal() as session:
+        return await session.scalar(select(Job.status).where(Job.id == job_id))
+
+
+async def test_stop_drains_in_flight_jobs(db):
+    """Stopping waits for running jobs that finish within the deadline"""
+    worker = RecordingWorker(job_seconds=0.3)
+    job = await start_with_job(worker, db)
+
+    await worker.stop(timeout=5)
+
+    assert worker.completed == 1
+    assert await job_status(job.id) == JobStatus.COMPLETED
+
+
+async def test_stop_requeues_jobs_past_the_deadline(db):
+    """Jobs still running at the deadline are cancelled and made ready again"""
+    worker = RecordingWorker(job_seconds=30)
+    job = await start_with_job(worker, db)
+
+    await worker.stop(timeout=0.1)
+
+    assert worker.completed == 0
+    assert await job_status(job.id) == JobStatus.READY
+
+
+async def test_failed_job_is_retried_after_backoff(db):
+    """A failing job goes back to ready with a run_at in the future"""
+    job = Job(job_type="unknown", status=JobStatus.PROCESSING)
+    db.add(job)
+    await db.commit()
+
+    await JobWorker().process_job(job, db)
+
+    assert job.status == JobStatus.READY
+    assert job.retry_count == 1
+    assert job.run_at > job.created_at + retry_backoff(1) / 2 - timedelta(seconds=1)
+
+
+async def test_failed_insight_call_is_retried(db, monkeypatch):
+    """An OpenAI error fails the insights job instead of storing the error"""
+
+    async def unavailable(self, prompt, stream=False):
+        raise RuntimeError("OpenAI API error: 503")
+
+    monkeypatch.setattr(AIInsightsService, "_call_openai", unavailable)
+    job = Job(job_type=JobType.GENERATE_INSIGHTS, status=JobStatus.PROCESSING)
+    db.add(job)
+    await db.commit()
+
+    await JobWorker().process_job(job, db)
+
+    assert job.status == JobStatus.READY
+    assert job.run_at > datetime.utcnow()
+    assert "503" in job.error_message
+    assert await db.scalar(select(func.count()).select_from(Insight)) == 0
+
+
+async def test_insights_job_holds_no_transaction_during_openai_call(db, monkeypatch):
+    """The prompt's reads are committed before the slow OpenAI call starts"""
+    in_transaction = []
+
+    async def answer(self, prompt, stream=False):
+        in_transaction.append(self.insight_repo.db.in_transaction())
+        return "- Reorder PLA"
+
+    monkeypatch.setattr(AIInsightsService, "_call_openai", answer)
+    job = Job(job_type=JobType.GENERATE_INSIGHTS, status=JobStatus.PROCESSING)
+    db.add(job)
+    await db.commit()
+
+    await JobWorker().process_job(job, db)
+
+    assert in_transaction == [False]
+    assert job.status == JobStatus.COMPLETED
+    insight = await db.scalar(select(Insight).where(Insight.job_id == job.id))
+    assert insight.content == "- Reorder PLA"
+
+
+def test_retry_backoff_grows_exponentially_with_jitter():
+    """Each attempt waits between half and all of base * 2^(attempt-1), capped"""
+    base = settings.JOB_RETRY_BACKOFF_BASE_SECONDS
+    cap = settings.JOB_RETRY_BACKOFF_MAX_SECONDS
+    for attempt in range(1, 12):
+        full = min(cap, base * 2 ** (attempt - 1))
+        delays = {retry_backoff(attempt).total_seconds() for _ in range(20)}
+        assert all(full / 2 <= delay <= full for delay in delays)
+        # Jittered: retries of simultaneous failures spread out
+        assert len(delays) > 1
@@ -0,0 +1,92 @@
+"""Tests for advisory-lock leader election"""
+
+import asyncio
+import pytest
+from app.services import leader_election
+from app.services.leader_election import LeaderElection
+from tests.conftest import SQLALCHEMY_TEST_DATABASE_URL
+
+pytestmark = pytest.mark.anyio
+
+TEST_LOCK_ID = 990001
+
+
+def make_candidate(events: list, name: str) -> LeaderElection:
+    async def on_elected():
+        events.append(("elected", name))
+
+    async def on_demoted():
+        events.append(("demoted", name))
+
+    return LeaderElection(
+        lock_id=TEST_LOCK_ID,
+        on_elected=on_elected,
+        on_demoted=on_demoted,
+        retry_interval=0.1,
+        dsn=SQLALCHEMY_TEST_DATABASE_URL,
+    )
+
+
+async def wait_for(condition, timeout: float = 5) -> None:
+    for _ in range(int(timeout / 0.05)):
+        if condition():
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError("condition not met in time")
+
+
+async def test_single_leader_and_failover():
+    """Only one candidate leads; another takes over when the leader stops"""
+    events: list = []
+    candidates = [make_candidate(events, name) for name in ("a", "b", "c")]
+    for candidate in candidates:
+        candidate.start()
+    try:
+        await wait_for(lambda: any(c.is_leader for c in candidates))
+        # Give the others several retries to (wrongly) acquire the lock
+        await asyncio.sleep(0.5)
+        leaders = [c for c in candidates if c.is_leader]
+        assert len(leaders) == 1
+
+        await leaders[0].stop()
+        followers = [c for c in candidates if c is not leaders[0]]
+        await wait_for(lambda: any(c.is_leader for c in followers))
+
+        assert sum(c.is_leader for c in candidates) == 1
+        assert [kind for kind, _ in events] == ["elected", "demoted", "elected"]
+    finally:
+        for candidate in candidates:
+            await candidate.stop()
+
+
+class HangingConnection:
+    """Connection whose keep-alive pings never return, like a half-open socket"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    async def fetchval(self, query, *args):
+        if query == "SELECT 1":
+            await asyncio.Event().wait()
+        return await self._conn.fetchval(query, *args)
+
+
+async def test_leader_steps_down_when_pings_hang(monkeypatch):
+    """An unanswered keep-alive ends leadership instead of blocking forever"""
+    connect = leader_election.asyncpg.connect
+
+    async def hanging_connect(*args, **kwargs):
+        return HangingConnection(await connect(*args, **kwargs))
+
+    monkeypatch.setattr(leader_election.asyncpg, "connect", hanging_connect)
+    events: list = []
+    candidate = make_candidate(events, "a")
+    candidate.start()
+    try:
+        await wait_for(lambda: ("demoted", "a") in events)
+        assert events[:2] == [("elected", "a"), ("demoted", "a")]
+    finally:
+        await candidate.stop()
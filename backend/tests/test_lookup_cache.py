@@ -0,0 +1,79 @@
+"""Tests for the lookup-table cache used by find_or_create"""
+
+import pytest
+from app.core.cache import lookup_cache
+from app.models.brand import Brand
+from app.models.status import Status
+from app.repositories.brand_repository import BrandRepository
+from app.repositories.status_repository import StatusRepository
+from tests.conftest import AsyncTestingSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_cached_lookup_is_attached_to_the_callers_session(db):
+    """A cache hit returns a row usable in another session, without a query"""
+    created = await BrandRepository(db).find_or_create("Prusament")
+    await db.commit()
+
+    async with AsyncTestingSessionLocal() as other:
+        hits = lookup_cache.hits
+        brand = await BrandRepository(other).find_or_create("PRUSAMENT")
+
+        assert lookup_cache.hits == hits + 1
+        assert brand.id == created.id
+        assert brand.name == "Prusament"
+        assert brand in other
+
+
+async def test_load_warms_the_cache(db):
+    """Rows loaded at startup are served from the cache"""
+    db.add(Brand(name="Polymaker"))
+    await db.commit()
+
+    await lookup_cache.load(db, [Brand])
+    hits = lookup_cache.hits
+    brand = await BrandRepository(db).find_by_name("polymaker")
+
+    assert brand.name == "Polymaker"
+    assert lookup_cache.hits == hits + 1
+
+
+async def test_update_invalidates_cached_rows(db):
+    """Renaming a row drops stale cache entries"""
+    status_repo = StatusRepository(db)
+    status = await status_repo.find_or_create("Openned")
+
+    status.name = "Opened"
+    await status_repo.update(status)
+
+    assert await status_repo.find_by_name("Openned") is None
+    assert (await status_repo.find_by_name("opened")).id == status.id
+
+
+async def test_rolled_back_rows_are_not_cached(db):
+    """Only committed rows reach the cache"""
+    brand_repo = BrandRepository(db)
+    await brand_repo.find_or_create("Fiberlogy")
+    await db.rollback()
+
+    assert lookup_cache.get(Brand, "fiberlogy") is None
+    assert await brand_repo.find_by_name("Fiberlogy") is None
+
+    await brand_repo.find_or_create("Fiberlogy")
+    assert lookup_cache.get(Brand, "fiberlogy") is None
+    await db.commit()
+    assert lookup_cache.get(Brand, "fiberlogy") is not None
+
+
+async def test_rows_read_back_before_commit_are_not_cached(db):
+    """A row this transaction inserted stays uncached if it rolls back"""
+    status_repo = StatusRepository(db)
+    await status_repo.find_or_create("Drying")
+    assert (await status_repo.find_by_name("DRYING")).name == "Drying"
+    await db.rollback()
+
+    assert lookup_cache.get(Status, "drying") is None
+    created = await status_repo.find_or_create("drying")
+    await db.commit()
+    assert lookup_cache.get(Status, "Drying").id == created.id
@@ -0,0 +1,85 @@
+"""Tests for LookupRepository find_or_create under concurrency"""
+
+import asyncio
+import re
+import pytest
+from sqlalchemy import event, func, select
+from app.core.cache import lookup_cache
+from app.models.brand import Brand
+from app.models.color import Color
+from app.repositories.brand_repository import BrandRepository
+from app.repositories.base import LOOKUP_LOCK_ORDER
+from app.repositories.color_repository import ColorRepository
+from app.schemas.spool import SpoolCreate
+from tests.conftest import AsyncTestingSessionLocal
+
+pytestmark = pytest.mark.anyio
+
+NAMES = ["Galaxy Black", "galaxy black", "GALAXY BLACK", "Jet Black", "jet black"]
+
+
+async def test_parallel_find_or_create_returns_one_row_per_name(db, monkeypatch):
+    """100 parallel creates of the same names never fail and never duplicate"""
+    # Force every call down to the database, where the race happens
+    monkeypatch.setattr(lookup_cache, "enabled", False)
+    # Bound open connections; 20 sessions in flight still race on each name
+    connections = asyncio.Semaphore(20)
+
+    async def create(i: int):
+        async with connections, AsyncTestingSessionLocal() as session:
+            name = NAMES[i % len(NAMES)]
+            brand = await BrandRepository(session).find_or_create(name)
+            color = await ColorRepository(session).find_or_create(name, "#000000")
+            await session.commit()
+            return name.lower(), brand.id, color.id
+
+    results = await asyncio.gather(*[create(i) for i in range(100)])
+
+    ids_by_name: dict = {}
+    for name, brand_id, color_id in results:
+        ids_by_name.setdefault(name, set()).add((brand_id, color_id))
+    assert {name: len(ids) for name, ids in ids_by_name.items()} == {
+        "galaxy black": 1,
+        "jet black": 1,
+    }
+    for model in (Brand, Color):
+        assert await db.scalar(select(func.count(model.id))) == 2
+
+
+async def test_find_by_name_matches_literally(db):
+    """Names are compared case-insensitively, not as ILIKE patterns"""
+    brand_repo = BrandRepository(db)
+    await brand_repo.find_or_create("Blue_Line 100%")
+
+    assert await brand_repo.find_by_name("blue_line 100%") is not None
+    assert await brand_repo.find_by_name("Blue%") is None
+    assert await brand_repo.find_by_name("BlueXLine 100%") is None
+
+
+async def test_create_spool_creates_lookups_in_lock_order(db, spool_service):
+    """New lookup rows are inserted in LOOKUP_LOCK_ORDER, so requests can't deadlock"""
+    inserted = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        match = re.match(r"INSERT INTO (\w+)", statement)
+        if match and match.group(1) in LOOKUP_LOCK_ORDER:
+            inserted.append(match.group(1))
+
+    engine = db.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        await spool_service.create_spool(
+            SpoolCreate(
+                base_weight=1000,
+                color_name="Order Teal",
+                brand_name="Order Brand",
+                material_name="Order PLA",
+                trade_name="Order Silk",
+                category_name="Order Category",
+            )
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert inserted == sorted(inserted, key=LOOKUP_LOCK_ORDER.index)
+    assert len(inserted) == 5
@@ -0,0 +1,106 @@
+"""Tests for keyset (cursor) pagination"""
+
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.dependencies import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.models.activity_log import ActivityLog
+from app.models.brand import Brand
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.brand_repository import BrandRepository
+from tests.conftest import override_get_db
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_pages_cover_every_row_once_in_order(db):
+    """Paging by cursor visits all rows in (created_at, id) order, ties included"""
+    start = datetime(2024, 1, 1)
+    # Pairs of rows share a timestamp, so the id must break the tie
+    brands = [
+        Brand(name=f"page-brand-{i}", created_at=start + timedelta(seconds=i // 2))
+        for i in range(7)
+    ]
+    db.add_all(brands)
+    await db.commit()
+    brand_repo = BrandRepository(db)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page, cursor = await brand_repo.get_page(limit=2, cursor=cursor)
+        seen.extend(brand.id for brand in page)
+        pages += 1
+        if cursor is None:
+            break
+
+    expected = sorted(brands, key=lambda brand: (brand.created_at, brand.id))
+    assert seen == [brand.id for brand in expected]
+    assert pages == 4
+
+
+async def test_rows_inserted_meanwhile_do_not_shift_pages(db):
+    """A new row on an already-read page does not repeat rows on the next one"""
+    start = datetime(2024, 1, 1)
+    db.add_all(
+        [
+            Brand(name=f"stable-brand-{i}", created_at=start + timedelta(minutes=i))
+            for i in range(4)
+        ]
+    )
+    await db.commit()
+    brand_repo = BrandRepository(db)
+
+    first, cursor = await brand_repo.get_page(limit=2)
+    db.add(Brand(name="stable-brand-early", created_at=start - timedelta(minutes=1)))
+    await db.commit()
+    second, cursor = await brand_repo.get_page(limit=2, cursor=cursor)
+
+    assert [b.name for b in first + second] == [f"stable-brand-{i}" for i in range(4)]
+    assert cursor is None
+
+
+async def test_activity_pages_newest_first(db):
+    """Activity logs page from the newest entry backwards"""
+    start = datetime(2024, 1, 1)
+    logs = [
+        ActivityLog(
+            action_type="created",
+            entity_type="spool",
+            description=f"log {i}",
+            created_at=start + timedelta(minutes=i),
+        )
+        for i in range(5)
+    ]
+    db.add_all(logs)
+    await db.commit()
+    activity_repo = ActivityLogRepository(db)
+
+    first, cursor = await activity_repo.get_page_newest_first(limit=3)
+    rest, last = await activity_repo.get_page_newest_first(limit=3, cursor=cursor)
+
+    assert [log.description for log in first + rest] == [
+        f"log {i}" for i in reversed(range(5))
+    ]
+    assert last is None
+
+
+def test_next_cursor_header_and_invalid_cursor(db):
+    """Lists return the next cursor in a header and reject malformed ones"""
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+    for i in range(3):
+        assert client.post("/api/brands/", json={"name": f"hdr-{i}"}).status_code == 201
+
+    first = client.get("/api/brands/", params={"limit": 2})
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+    second = client.get("/api/brands/", params={"limit": 2, "cursor": cursor})
+
+    assert [b["name"] for b in first.json() + second.json()] == [
+        "hdr-0",
+        "hdr-1",
+        "hdr-2",
+    ]
+    assert NEXT_CURSOR_HEADER not in second.headers
+    assert client.get("/api/brands/", params={"cursor": "bogus"}).status_code == 400
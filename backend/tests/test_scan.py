@@ -0,0 +1,87 @@
+"""Tests for the barcode scan fast path"""
+
+import pytest
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.inventory import Inventory
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.status import Status
+from app.repositories.inventory_repository import InventoryRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.status_repository import StatusRepository
+from app.services.inventory_service import InventoryService
+from app.services.status_service import StatusService
+
+pytestmark = pytest.mark.anyio
+
+
+def inventory_service(db) -> InventoryService:
+    return InventoryService(
+        InventoryRepository(db),
+        SpoolRepository(db),
+        StatusService(StatusRepository(db)),
+    )
+
+
+@pytest.fixture
+async def spool(db):
+    """A spool with two units in stock and one in use"""
+    color = Color(name="Scan Red", hex_code="#FF0000")
+    brand = Brand(name="Scan Brand")
+    material = Material(name="Scan PLA")
+    in_stock, in_use = Status(name="scan_in_stock"), Status(name="scan_in_use")
+    db.add_all([color, brand, material, in_stock, in_use])
+    await db.flush()
+    spool = Spool(
+        barcode="SCAN-001",
+        base_weight=1000,
+        color_id=color.id,
+        brand_id=brand.id,
+        material_id=material.id,
+    )
+    db.add(spool)
+    await db.flush()
+    db.add_all(
+        [
+            Inventory(spool_id=spool.id, weight=1000, status_id=in_stock.id),
+            Inventory(spool_id=spool.id, weight=800, status_id=in_stock.id),
+            Inventory(
+                spool_id=spool.id, weight=250, is_in_use=True, status_id=in_use.id
+            ),
+        ]
+    )
+    await db.commit()
+    return spool
+
+
+async def test_scan_returns_spool_inventory_and_aggregates(db, spool):
+    """One call answers what the scanner used to ask in three"""
+    result = await inventory_service(db).scan("SCAN-001")
+
+    assert result["spool"].id == spool.id
+    assert result["spool"].color.name == "Scan Red"
+    assert len(result["inventory"]) == result["count"] == 3
+    assert result["in_use_count"] == 1
+    assert result["total_weight"] == 2050
+    assert result["status_counts"] == {"scan_in_stock": 2, "scan_in_use": 1}
+
+
+async def test_scan_spool_without_inventory_and_unknown_barcode(db, spool):
+    """Spools without units scan with zero aggregates; unknown barcodes fail"""
+    empty = Spool(
+        barcode="SCAN-002",
+        base_weight=750,
+        color_id=spool.color_id,
+        brand_id=spool.brand_id,
+        material_id=spool.material_id,
+    )
+    service = inventory_service(db)
+    await SpoolRepository(db).create(empty)
+
+    result = await service.scan("SCAN-002")
+
+    assert result["inventory"] == []
+    assert (result["count"], result["total_weight"]) == (0, 0)
+    with pytest.raises(ValueError):
+        await service.scan("SCAN-404")
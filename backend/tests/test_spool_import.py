@@ -0,0 +1,271 @@
+"""Tests for CSV catalog imports"""
+
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from app.main import app
+from app.core.config import settings
+from app.core.dependencies import get_db
+from app.models.activity_log import ActivityLog
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.job import Job, JobStatus
+from app.models.material import Material
+from app.models.spool import Spool
+from app.models.user import User, UserRole
+from app.repositories.activity_log_repository import ActivityLogRepository
+from app.repositories.brand_repository import BrandRepository
+from app.repositories.category_repository import CategoryRepository
+from app.repositories.color_repository import ColorRepository
+from app.repositories.job_repository import JobRepository
+from app.repositories.material_repository import MaterialRepository
+from app.repositories.spool_repository import SpoolRepository
+from app.repositories.trade_name_repository import TradeNameRepository
+from app.repositories.user_repository import UserRepository
+from app.services.activity_log_service import ActivityLogService
+from app.services.auth_service import create_access_token, get_password_hash
+from app.services.job_worker import JobWorker
+from app.services import spool_import_service
+from app.services.spool_import_service import OnConflict, SpoolImportService
+from tests.conftest import override_get_db
+
+pytestmark = pytest.mark.anyio
+
+app.dependency_overrides[get_db] = override_get_db
+client = TestClient(app)
+
+HEADER = "barcode,base_weight,color_name,color_hex_code,brand_name,material_name,trade_name\n"
+
+
+@pytest.fixture(autouse=True)
+def import_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def import_service(db) -> SpoolImportService:
+    return SpoolImportService(
+        SpoolRepository(db),
+        ColorRepository(db),
+        BrandRepository(db),
+        MaterialRepository(db),
+        TradeNameRepository(db),
+        CategoryRepository(db),
+        JobRepository(db),
+        UserRepository(db),
+        ActivityLogService(ActivityLogRepository(db)),
+    )
+
+
+async def upload(text: str):
+    data = text.encode()
+    for start in range(0, len(data), 16):
+        yield data[start : start + 16]
+
+
+async def run(db, text: str, on_conflict: OnConflict = OnConflict.SKIP) -> dict:
+    service = import_service(db)
+    job = await service.start_import(upload(text), "catalog.csv", on_conflict)
+    path = json.loads(job.payload)["path"]
+    assert os.path.exists(path)
+    report = await service.run_import(job)
+    assert not os.path.exists(path)
+    return report
+
+
+async def count(db, model) -> int:
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.fixture
+async def existing_spool(db):
+    """A catalog spool that the CSV files also contain"""
+    color = Color(name="Import Red", hex_code="#FF0000")
+    brand, material = Brand(name="Import Brand"), Material(name="Import PLA")
+    db.add_all([color, brand, material])
+    await db.flush()
+    spool = Spool(
+        barcode="IMP-1",
+        base_weight=1000,
+        color_id=color.id,
+        brand_id=brand.id,
+        material_id=material.id,
+    )
+    db.add(spool)
+    await db.commit()
+    return spool
+
+
+async def test_import_creates_spools_and_lookups(db):
+    """New names become lookup rows, shared case-insensitively between rows"""
+    report = await run(
+        db,
+        HEADER
+        + "IMP-1,1000,Ocean Blue,#0000FF,Import Brand,PLA,Matte\n"
+        + "IMP-2,750,ocean blue,#0000FF,import brand,PETG,\n"
+        + ",250,Ocean Blue,#0000FF,Import Brand,PLA,\n",
+    )
+
+    assert report["rows"] == 3
+    assert report["created"] == 3
+    assert report["failed"] == report["skipped"] == 0
+    colors = (await db.scalars(select(Color).where(Color.name == "Ocean Blue"))).all()
+    assert len(colors) == 1
+    spools = (
+        await db.scalars(select(Spool).where(Spool.color_id == colors[0].id))
+    ).all()
+    assert len(spools) == 3
+    assert len({spool.brand_id for spool in spools}) == 1
+    assert len({spool.material_id for spool in spools}) == 2
+    assert await count(db, ActivityLog) >= 3
+    generated = [spool.barcode for spool in spools if spool.base_weight == 250]
+    assert generated[0].startswith("SPL")
+
+
+async def test_import_non_ascii_lookup_names(db):
+    """Names whose lowercase differs between Python and Postgres still resolve"""
+    report = await run(
+        db,
+        HEADER
+        + "IMP-1,1000,İzmir Orange,#FF8800,Ärger Brand,PLA,\n"
+        + "IMP-2,1000,izmir orange,#FF8800,ärger brand,PLA,\n"
+        + "IMP-3,1000,Straße Grün,#00FF00,ÄRGER BRAND,PLA,ẞTRONG\n",
+    )
+
+    assert (report["created"], report["failed"]) == (3, 0)
+    spools = (await db.scalars(select(Spool).where(Spool.barcode.like("IMP-%")))).all()
+    assert len(spools) == 3
+    assert all(spool.color_id and spool.brand_id for spool in spools)
+
+
+async def test_import_skips_existing_barcodes(db, existing_spool):
+    """on_conflict=skip leaves the catalog row alone and reports it"""
+    report = await run(
+        db,
+        HEADER
+        + "IMP-1,500,Import Red,#FF0000,Import Brand,Import PLA,\n"
+        + "IMP-2,500,Import Red,#FF0000,Import Brand,Import PLA,\n",
+    )
+
+    assert (report["created"], report["skipped"]) == (1, 1)
+    assert report["problems"][0]["line"] == 2
+    assert report["problems"][0]["outcome"] == "skipped"
+    await db.refresh(existing_spool)
+    assert existing_spool.base_weight == 1000
+
+
+async def test_import_updates_existing_barcodes(db, existing_spool):
+    """on_conflict=update rewrites the row in place, keeping its id"""
+    report = await run(
+        db,
+        HEADER + "IMP-1,500,Import Red,#FF0000,Import Brand,Import PLA,\n",
+        OnConflict.UPDATE,
+    )
+
+    assert (report["created"], report["updated"]) == (0, 1)
+    spool = await db.scalar(select(Spool).where(Spool.barcode == "IMP-1"))
+    await db.refresh(spool)
+    assert spool.id == existing_spool.id
+    assert spool.base_weight == 500
+
+
+async def test_import_reports_bad_rows(db):
+    """Invalid and duplicate rows fail on their own; the rest is imported"""
+    report = await run(
+        db,
+        HEADER
+        + "IMP-1,1000,Red,#FF0000,Brand,PLA,\n"
+        + "IMP-2,-5,Red,#FF0000,Brand,PLA,\n"
+        + "IMP-1,1000,Red,#FF0000,Brand,PLA,\n"
+        + "IMP-3,1000,Red,not-a-color,Brand,PLA,\n",
+    )
+
+    assert (report["rows"], report["created"], report["failed"]) == (4, 1, 3)
+    problems = {p["line"]: p["reason"] for p in report["problems"]}
+    assert "base_weight" in problems[3]
+    assert problems[4] == "Duplicate barcode in file"
+    assert "color_hex_code" in problems[5]
+    assert await count(db, Spool) == 1
+
+
+async def test_import_rejects_missing_columns(db):
+    """A file without the required columns fails the whole job"""
+    with pytest.raises(ValueError, match="material_name"):
+        await run(db, "barcode,base_weight,color_name,brand_name\nX,1,Red,Brand\n")
+
+
+async def test_failed_import_keeps_committed_batches_and_report(db, monkeypatch):
+    """Batches before a failure stay imported; the job keeps their report"""
+    monkeypatch.setattr(spool_import_service, "IMPORT_BATCH_SIZE", 2)
+    service = import_service(db)
+    upsert_many = service.spool_repo.upsert_many
+    calls = []
+
+    async def fail_second_batch(rows, **kwargs):
+        calls.append(rows)
+        if len(calls) == 2:
+            raise RuntimeError("connection lost")
+        return await upsert_many(rows, **kwargs)
+
+    monkeypatch.setattr(service.spool_repo, "upsert_many", fail_second_batch)
+    rows = "".join(f"IMP-{i},1000,Red,#FF0000,Brand,PLA,\n" for i in range(5))
+    job = await service.start_import(upload(HEADER + rows), "catalog.csv")
+    with pytest.raises(RuntimeError):
+        await service.run_import(job)
+
+    await db.refresh(job)
+    report = json.loads(job.result)
+    assert (report["committed_rows"], report["created"]) == (2, 2)
+    assert report["error"] == "connection lost"
+    assert await count(db, Spool) == 2
+
+
+async def test_start_import_rejects_empty_and_oversized_files(
+    db, import_dir, monkeypatch
+):
+    """Nothing is left behind in IMPORT_DIR when an upload is rejected"""
+    service = import_service(db)
+    with pytest.raises(ValueError, match="empty"):
+        await service.start_import(upload(""), "empty.csv")
+
+    monkeypatch.setattr(settings, "IMPORT_MAX_BYTES", 10)
+    with pytest.raises(ValueError, match="larger"):
+        await service.start_import(upload(HEADER), "big.csv")
+    assert os.listdir(import_dir) == []
+
+
+async def test_import_endpoint_and_job(db):
+    """Upload, let the worker run the job, then read its report"""
+    user = User(
+        email="importer@example.com",
+        hashed_password=get_password_hash("secret-password"),
+        role=UserRole.ADMIN,
+    )
+    db.add(user)
+    await db.commit()
+    token = create_access_token(data={"user_id": user.id, "role": "ADMIN"})
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "text/csv"}
+
+    response = client.post(
+        "/api/spools/import?filename=supplier.csv",
+        content=HEADER + "IMP-9,1000,Red,#FF0000,Brand,PLA,\n",
+        headers=headers,
+    )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    job = await db.get(Job, job_id)
+    await JobWorker(listen=False).process_job(job, db)
+    assert job.status == JobStatus.COMPLETED
+
+    response = client.get(f"/api/spools/import/{job_id}", headers=headers)
+    assert response.status_code == 200
+    report = json.loads(response.json()["result"])
+    assert report["filename"] == "supplier.csv"
+    assert report["created"] == 1
+    spool = await db.scalar(select(Spool).where(Spool.barcode == "IMP-9"))
+    log = await db.scalar(select(ActivityLog).where(ActivityLog.entity_id == spool.id))
+    assert log.user_id == user.id
@@ -0,0 +1,75 @@
+"""Tests for ranked catalog search"""
+
+import pytest
+from sqlalchemy import text
+from app.models.brand import Brand
+from app.models.color import Color
+from app.models.material import Material
+from app.models.spool import Spool
+from app.repositories.spool_repository import SpoolRepository
+from tests.conftest import engine
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pg_trgm():
+    """Search needs the pg_trgm extension (Postgres contrib)"""
+    with engine.begin() as conn:
+        available = conn.scalar(
+            text("SELECT count(*) FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        )
+        if not available:
+            pytest.skip("pg_trgm is not installed on the test server")
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
+@pytest.fixture
+async def catalog(db):
+    """Two colors, brands and materials, and a spool per combination"""
+    red, blue = Color(name="Red", hex_code="#FF0000"), Color(
+        name="Blue", hex_code="#0000FF"
+    )
+    acme, polymaker = Brand(name="Acme"), Brand(name="Polymaker")
+    pla, petg = Material(name="PLA"), Material(name="PETG")
+    db.add_all([red, blue, acme, polymaker, pla, petg])
+    await db.flush()
+    spools = {}
+    for color in (red, blue):
+        for brand in (acme, polymaker):
+            for material in (pla, petg):
+                barcode = f"{brand.name[:3]}-{material.name}-{color.name}".upper()
+                spools[barcode] = Spool(
+                    barcode=barcode,
+                    base_weight=1000,
+                    color_id=color.id,
+                    brand_id=brand.id,
+                    material_id=material.id,
+                )
+    db.add_all(spools.values())
+    await db.commit()
+    return spools
+
+
+async def test_search_matches_lookup_names(db, catalog):
+    """A brand name finds that brand's spools, and only those"""
+    results = await SpoolRepository(db).search("polymaker", limit=50)
+
+    assert {spool.barcode for spool in results} == {
+        barcode for barcode in catalog if barcode.startswith("POL-")
+    }
+
+
+async def test_search_ranks_closest_match_first(db, catalog):
+    """An exact barcode outranks spools that merely share a lookup name"""
+    results = await SpoolRepository(db).search("ACM-PLA-RED", limit=50)
+
+    assert results[0].barcode == "ACM-PLA-RED"
+
+
+async def test_search_respects_limit_and_escapes_wildcards(db, catalog):
+    """Results are capped, and % in the query is matched literally"""
+    spool_repo = SpoolRepository(db)
+
+    assert len(await spool_repo.search("PL", limit=3)) == 3
+    assert await spool_repo.search("%", limit=50) == []
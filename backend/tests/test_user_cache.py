@@ -0,0 +1,100 @@
+"""Tests for the authenticated-user cache"""
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.cache import user_cache
+from app.core.config import settings
+from app.core.dependencies import get_db
+from app.models.user import User, UserRole
+from app.services.auth_service import create_access_token
+from tests.conftest import TestingSessionLocal, override_get_db
+
+app.dependency_overrides[get_db] = override_get_db
+client = TestClient(app)
+
+
+@pytest.fixture
+def users():
+    """Create an admin and a viewer; return bearer token headers for both"""
+    session = TestingSessionLocal()
+    admin = User(
+        email="cache-admin@example.com",
+        hashed_password="not-used",
+        role=UserRole.ADMIN,
+    )
+    viewer = User(
+        email="cache-viewer@example.com",
+        hashed_password="not-used",
+        role=UserRole.VIEWER,
+    )
+    session.add_all([admin, viewer])
+    session.commit()
+
+    def headers(user):
+        token = create_access_token(data={"user_id": user.id, "role": user.role.value})
+        return {"Authorization": f"Bearer {token}"}
+
+    yield {
+        "admin": headers(admin),
+        "viewer": headers(viewer),
+        "viewer_id": viewer.id,
+    }
+
+    session.delete(admin)
+    session.delete(viewer)
+    session.commit()
+    session.close()
+
+
+def test_repeated_requests_hit_the_cache(users, monkeypatch):
+    """Only the first request of a user loads it; later ones skip the query"""
+    monkeypatch.setattr(settings, "DB_USAGE_HEADERS", True)
+    hits = user_cache.hits
+
+    first = client.get("/api/users", headers=users["admin"])
+    second = client.get("/api/users", headers=users["admin"])
+
+    assert first.status_code == second.status_code == 200
+    assert user_cache.hits == hits + 1
+    # The cached user is attached to the request session like a loaded one
+    assert second.headers["X-DB-Checkouts"] == "1"
+
+
+def test_status_change_invalidates_cached_user(users):
+    """A deactivated user is rejected on the very next request"""
+    assert client.get("/api/inventory/", headers=users["viewer"]).status_code == 200
+
+    response = client.patch(
+        f"/api/users/{users['viewer_id']}/status",
+        params={"is_active": False},
+        headers=users["admin"],
+    )
+
+    assert response.status_code == 200
+    assert client.get("/api/inventory/", headers=users["viewer"]).status_code == 403
+
+
+def test_expired_entries_are_reloaded(users, monkeypatch):
+    """Entries past the TTL count as misses and are loaded again"""
+    monkeypatch.setattr(user_cache, "ttl_seconds", 0.001)
+    client.get("/api/users", headers=users["admin"])
+    misses = user_cache.misses
+
+    assert client.get("/api/users", headers=users["admin"]).status_code == 200
+    assert user_cache.misses == misses + 1
+
+
+def test_cache_stats_reports_hit_rate(users):
+    """Admins can read the cache counters"""
+    client.get("/api/users", headers=users["admin"])
+
+    response = client.get("/api/users/cache-stats", headers=users["admin"])
+
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["hits"] >= 1
+    assert 0 < stats["hit_rate"] <= 1
+    assert (
+        client.get("/api/users/cache-stats", headers=users["viewer"]).status_code == 403
+    )
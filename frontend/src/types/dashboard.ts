@@ -13,7 +13,7 @@ export interface ActivityLog {
     entity_type: string
     entity_id: string | null
     description: string
-    extra_data: string | null
+    extra_data: Record<string, unknown> | null
     user_id: string | null
     user_email: string | null
     created_at: string